@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+import sys
+
 import six
 
 from agate.aggregations import *
@@ -13,7 +15,7 @@ from agate.mapped_sequence import MappedSequence  # noqa
 from agate.rows import Row  # noqa
 from agate.table import Table  # noqa
 from agate.tableset import TableSet  # noqa
-from agate.testcase import AgateTestCase  # noqa
+from agate.table_writer import TableWriter  # noqa
 from agate.type_tester import TypeTester  # noqa
 from agate.utils import *
 from agate.warns import NullCalculationWarning, DuplicateColumnWarning, warn_null_calculation, warn_duplicate_column  # noqa
@@ -22,3 +24,20 @@ if six.PY2:  # pragma: no cover
     import agate.csv_py2 as csv  # noqa
 else:
     import agate.csv_py3 as csv  # noqa
+
+
+def __getattr__(name):
+    """
+    Lazily import :class:`.AgateTestCase`, which pulls in :mod:`unittest`.
+    """
+    if name == 'AgateTestCase':
+        from agate.testcase import AgateTestCase
+
+        return AgateTestCase
+
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+
+# Module __getattr__ is only called on Python 3.7+
+if sys.version_info < (3, 7):  # pragma: no cover
+    AgateTestCase = __getattr__('AgateTestCase')
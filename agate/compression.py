@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+
+"""
+This module contains the functions used to transparently read and write
+gzip, bz2 and xz compressed files.
+
+Compression is detected from a file's leading "magic" bytes when reading and
+from its extension when writing. Compressed files are always streamed through
+the standard library codecs, so they are never held in memory in full.
+"""
+
+import io
+import os
+import re
+import threading
+
+from six.moves import queue
+
+#: Supported compression formats, as :code:`(name, extensions, magic)`, where
+#: :code:`magic` is a pattern matching the start of a compressed file
+FORMATS = (
+    ('gzip', ('.gz', '.gzip'), re.compile(b'\x1f\x8b')),
+    # "BZh" and a block size, then the magic number of a block or of the end
+    # of an empty stream. "BZh" alone could begin a plain text file.
+    ('bz2', ('.bz2',), re.compile(b'BZh[1-9](1AY&SY|\x17rE8P\x90)')),
+    ('xz', ('.xz', '.lzma'), re.compile(b'\xfd7zXZ\x00')),
+)
+
+#: Number of leading bytes read to detect compression
+MAGIC_LENGTH = 10
+
+#: Number of compressed bytes decoded at a time by :class:`ReadAhead`
+CHUNK_SIZE = 64 * 1024
+
+#: Number of decoded chunks :class:`ReadAhead` may hold in memory
+QUEUE_SIZE = 16
+
+
+def detect(path, mode='r'):
+    """
+    Determine the compression of a file.
+
+    :param path:
+        A file path.
+    :param mode:
+        If :code:`r`, the compression is detected from the first bytes of the
+        file. Otherwise it is inferred from the file's extension.
+    :returns:
+        The name of a format in :data:`FORMATS` or :code:`None`. Files which
+        are not regular files, such as pipes, are never read and are assumed
+        to be uncompressed.
+    """
+    if mode.startswith('r'):
+        # Reading the head of a pipe would consume it
+        if not os.path.isfile(path):
+            return None
+
+        with io.open(path, 'rb') as f:
+            head = f.read(MAGIC_LENGTH)
+
+        for name, extensions, magic in FORMATS:
+            if magic.match(head):
+                return name
+    else:
+        ext = os.path.splitext(path)[1].lower()
+
+        for name, extensions, magic in FORMATS:
+            if ext in extensions:
+                return name
+
+    return None
+
+
+def _open_binary(name, path, mode):
+    if name == 'gzip':
+        import gzip
+
+        return gzip.GzipFile(path, mode)
+    elif name == 'bz2':
+        import bz2
+
+        return bz2.BZ2File(path, mode)
+    elif name == 'xz':
+        try:
+            import lzma
+        except ImportError:  # pragma: no cover
+            raise ValueError('xz compression requires the lzma module, which is not available in this version of Python.')
+
+        return lzma.LZMAFile(path, mode)
+
+
+def open_file(path, mode='r', encoding=None, newline=None, read_ahead=True, buffering=-1):
+    """
+    Open a file, which may be gzip, bz2 or xz compressed.
+
+    Uncompressed files are opened with :func:`io.open`. Compressed files
+    are decoded incrementally, and text mode wrappers are added on top.
+
+    :param path:
+        A file path.
+    :param mode:
+        A mode as accepted by :func:`io.open`, such as :code:`r`,
+        :code:`rb` or :code:`w`. Python 2's :code:`Urb` mode is also
+        accepted.
+    :param encoding:
+        The encoding of text mode files.
+    :param newline:
+        Controls line endings in text mode, as for :func:`io.open`.
+    :param read_ahead:
+        If :code:`True`, compressed files being read are decoded in a
+        background thread, so that decompression overlaps with parsing. The
+        standard library codecs release the GIL while decoding.
+    :param buffering:
+        The buffer size of uncompressed files, as for :func:`io.open`.
+    """
+    binary = 'b' in mode
+    name = detect(path, mode)
+
+    if name is None:
+        if binary:
+            # io.open doesn't support universal newlines in binary mode
+            return open(path, mode, buffering) if 'U' in mode else io.open(path, mode, buffering)
+
+        return io.open(path, mode, buffering, encoding=encoding, newline=newline)
+
+    raw_mode = mode.replace('t', '').replace('b', '').replace('U', '') + 'b'
+    f = _open_binary(name, path, raw_mode)
+
+    if read_ahead and raw_mode.startswith('r'):
+        f = io.BufferedReader(ReadAhead(f), CHUNK_SIZE)
+
+    if binary:
+        return f
+
+    return io.TextIOWrapper(f, encoding=encoding, newline=newline)
+
+
+class ReadAhead(io.RawIOBase):
+    """
+    A read-only raw stream which reads from another stream in a background
+    thread, keeping up to :data:`QUEUE_SIZE` chunks of :data:`CHUNK_SIZE`
+    bytes ready to be consumed.
+
+    :param f:
+        A binary file-like object. It will be closed when this stream is
+        closed.
+    """
+    def __init__(self, f):
+        super(ReadAhead, self).__init__()
+
+        self._f = f
+        self._queue = queue.Queue(QUEUE_SIZE)
+        self._stopped = threading.Event()
+        self._buffer = b''
+        self._done = False
+
+        self._thread = threading.Thread(target=self._fill)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _fill(self):
+        try:
+            while not self._stopped.is_set():
+                chunk = self._f.read(CHUNK_SIZE)
+
+                if not self._put(chunk) or not chunk:
+                    return
+        except Exception as e:
+            self._put(e)
+
+    def _put(self, item):
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer and not self._done:
+            item = self._queue.get()
+
+            if isinstance(item, Exception):
+                self._done = True
+                raise item
+
+            if not item:
+                self._done = True
+
+            self._buffer = item
+
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._stopped.set()
+            self._thread.join()
+            self._f.close()
+
+        super(ReadAhead, self).close()
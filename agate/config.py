@@ -29,15 +29,15 @@ configuration.
 +-------------------------+------------------------------------------+-----------------------------------------+
 | ellipsis_chars          | Characters to render for ellipsis        | u'...'                                  |
 +-------------------------+------------------------------------------+-----------------------------------------+
+| sniff_limit             | Characters sniffed when CSV sniff_limit  | 65536                                   |
+|                         | is None                                  |                                         |
++-------------------------+------------------------------------------+-----------------------------------------+
 
 """
 
-from babel.core import default_locale
-
-
 _options = {
-    #: Default locale for number formatting
-    'default_locale': default_locale('LC_NUMERIC') or 'en_US',
+    #: Default locale for number formatting, detected when first used
+    'default_locale': None,
     #: Character to render for horizontal lines
     'horizontal_line_char': u'-',
     #: Character to render for vertical lines
@@ -54,6 +54,8 @@ _options = {
     'tick_char': u'+',
     #: Characters to render for ellipsis
     'ellipsis_chars': u'...',
+    #: Number of characters sniffed when a CSV sniff_limit is None
+    'sniff_limit': 65536,
 }
 
 
@@ -64,6 +66,12 @@ def get_option(key):
     :param key:
         The name of the configuration option.
     """
+    # Detecting the locale imports babel, so it's deferred until needed
+    if key == 'default_locale' and _options[key] is None:
+        from babel.core import default_locale
+
+        _options[key] = default_locale('LC_NUMERIC') or 'en_US'
+
     return _options[key]
 
 
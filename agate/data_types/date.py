@@ -2,8 +2,6 @@
 
 from datetime import date, datetime, time
 
-import isodate
-import parsedatetime
 import six
 
 from agate.data_types.base import DataType
@@ -13,6 +11,16 @@ from agate.exceptions import CastError
 ZERO_DT = datetime.combine(date.min, time.min)
 
 
+def _calendar():
+    """
+    Create a :class:`parsedatetime.Calendar`. parsedatetime is imported here,
+    rather than at module level, because it is slow to import.
+    """
+    import parsedatetime
+
+    return parsedatetime.Calendar(version=parsedatetime.VERSION_CONTEXT_STYLE)
+
+
 class Date(DataType):
     """
     Data representing dates alone.
@@ -25,7 +33,7 @@ class Date(DataType):
         super(Date, self).__init__(**kwargs)
 
         self.date_format = date_format
-        self.parser = parsedatetime.Calendar(version=parsedatetime.VERSION_CONTEXT_STYLE)
+        self.parser = _calendar()
 
     def __getstate__(self):
         """
@@ -42,7 +50,7 @@ class Date(DataType):
         of the parsedatetime Calendar class.
         """
         self.__dict__.update(data)
-        self.parser = parsedatetime.Calendar(version=parsedatetime.VERSION_CONTEXT_STYLE)
+        self.parser = _calendar()
 
     def cast(self, d):
         """
@@ -2,11 +2,10 @@
 
 import datetime
 
-import isodate
-import parsedatetime
 import six
 
 from agate.data_types.base import DataType
+from agate.data_types.date import _calendar
 from agate.exceptions import CastError
 
 
@@ -31,7 +30,7 @@ class DateTime(DataType):
         self._source_time = datetime.datetime(
             now.year, now.month, now.day, 0, 0, 0, 0, None
         )
-        self._parser = parsedatetime.Calendar(version=parsedatetime.VERSION_CONTEXT_STYLE)
+        self._parser = _calendar()
 
     def __getstate__(self):
         """
@@ -48,7 +47,7 @@ class DateTime(DataType):
         of the parsedatetime Calendar class.
         """
         self.__dict__.update(dict)
-        self._parser = parsedatetime.Calendar(version=parsedatetime.VERSION_CONTEXT_STYLE)
+        self._parser = _calendar()
 
     def cast(self, d):
         """
@@ -94,6 +93,8 @@ class DateTime(DataType):
             elif matched_text == d and ctx.hasDate and not ctx.hasTime:
                 return datetime.datetime.combine(value.date(), datetime.time.min)
 
+        import isodate
+
         try:
             dt = isodate.parse_datetime(d)
 
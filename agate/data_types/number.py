@@ -8,7 +8,6 @@ except ImportError:  # pragma: no cover
 
 import warnings
 
-from babel.core import Locale
 import six
 
 from agate.data_types.base import DataType
@@ -40,6 +39,8 @@ class Number(DataType):
     def __init__(self, locale='en_US', group_symbol=None, decimal_symbol=None, currency_symbols=DEFAULT_CURRENCY_SYMBOLS, **kwargs):
         super(Number, self).__init__(**kwargs)
 
+        from babel.core import Locale
+
         self.locale = Locale.parse(locale)
 
         self.currency_symbols = currency_symbols
@@ -2,7 +2,6 @@
 
 import datetime
 
-import pytimeparse
 import six
 
 from agate.data_types.base import DataType
@@ -32,6 +31,8 @@ class TimeDelta(DataType):
         else:
             raise CastError('Can not parse value "%s" as timedelta.' % d)
 
+        import pytimeparse
+
         try:
             seconds = pytimeparse.parse(d)
         except AttributeError:
@@ -6,6 +6,7 @@ similar to Python's built-in CSV reader.
 """
 
 from collections import OrderedDict, namedtuple
+from operator import itemgetter
 
 import six
 
@@ -22,21 +23,46 @@ class Reader(six.Iterator):
     Schemas must be in the "ffs" format, with :code:`column`, :code:`start`,
     and :code:`length` columns. There is a repository of such schemas
     maintained at `wireservice/ffs <https://github.com/wireservice/ffs>`_.
+
+    The schema is compiled once into a single :func:`operator.itemgetter` of
+    slices, so each line is split into fields with one call, however many
+    fields there are.
+
+    :param f:
+        A file-like object from which to read fixed-width data.
+    :param schema_f:
+        A file-like object from which to read the schema (CSV) data, or a
+        sequence of :class:`Field` instances, such as the :attr:`fields` of
+        another reader.
+    :param columns:
+        An optional sequence of column names or indices from the schema. If
+        specified, only these fields will be read, in the order given.
     """
-    def __init__(self, f, schema_f):
+    def __init__(self, f, schema_f, columns=None):
         from agate import csv
+        from agate import utils
 
         self.file = f
-        self.fields = []
 
-        reader = csv.reader(schema_f)
-        header = next(reader)
+        if hasattr(schema_f, 'read'):
+            self.fields = []
+
+            reader = csv.reader(schema_f)
+            header = next(reader)
+
+            if header != ['column', 'start', 'length']:
+                raise ValueError('Schema must contain exactly three columns: "column", "start", and "length".')
+
+            for row in reader:
+                self.fields.append(Field(row[0], int(row[1]), int(row[2])))
+        else:
+            self.fields = [Field(*field) for field in schema_f]
 
-        if header != ['column', 'start', 'length']:
-            raise ValueError('Schema must contain exactly three columns: "column", "start", and "length".')
+        if columns is not None:
+            indices = utils.column_indices(columns, [field.name for field in self.fields])
+            self.fields = [self.fields[i] for i in indices]
 
-        for row in reader:
-            self.fields.append(Field(row[0], int(row[1]), int(row[2])))
+        self._split = _compile(self.fields)
 
     def __iter__(self):
         return self
@@ -44,12 +70,7 @@ class Reader(six.Iterator):
     def __next__(self):
         line = next(self.file)
 
-        values = []
-
-        for field in self.fields:
-            values.append(line[field.start:field.start + field.length].strip())
-
-        return values
+        return list(map(type(line).strip, self._split(line)))
 
     @property
     def fieldnames(self):
@@ -64,14 +85,33 @@ class DictReader(Reader):
     A fixed-width reader that returns :class:`collections.OrderedDict` rather
     than a list.
     """
+    def __init__(self, *args, **kwargs):
+        super(DictReader, self).__init__(*args, **kwargs)
+
+        self._names = self.fieldnames
+
     def __next__(self):
         line = next(self.file)
-        values = OrderedDict()
 
-        for field in self.fields:
-            values[field.name] = line[field.start:field.start + field.length].strip()
+        return OrderedDict(zip(self._names, map(type(line).strip, self._split(line))))
+
+
+def _compile(fields):
+    """
+    Compile a sequence of :class:`Field` instances into a function that takes
+    a line and returns a sequence of its (unstripped) field values.
+    """
+    slices = [slice(field.start, field.start + field.length) for field in fields]
+
+    if not slices:
+        return lambda line: ()
+    elif len(slices) == 1:
+        # itemgetter only returns a tuple when it has more than one item
+        s = slices[0]
+
+        return lambda line: (line[s],)
 
-        return values
+    return itemgetter(*slices)
 
 
 def reader(*args, **kwargs):
@@ -0,0 +1,382 @@
+#!/usr/bin/env python
+
+"""
+This module contains the machinery used to parse large files across multiple
+processes. Files are split into contiguous byte ranges which end on record
+boundaries, each range is parsed (and its values cast) in a separate process
+and the results are reassembled in their original order.
+
+These functions are used internally by methods such as
+:meth:`.Table.from_csv` when :code:`workers` is greater than one.
+"""
+
+from collections import OrderedDict
+from itertools import chain
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+import os
+import time
+
+import six
+
+from agate.exceptions import CastError
+from agate.rows import Row
+from agate.type_tester import TypeTester
+
+#: Number of bytes read at a time while scanning a file for boundaries
+BLOCK_SIZE = 1024 * 1024
+
+#: Tasks being run by :func:`export`, inherited by forked processes
+_export_tasks = None
+
+
+class BoundaryError(Exception):
+    """
+    Raised by a reader when a range found by :func:`split` turns out not to
+    end on a record boundary, in which case the file must be parsed
+    serially.
+    """
+    pass
+
+
+def count_lines(data):
+    """
+    Count the lines in a byte string the way Python's universal newlines
+    mode does, treating :code:`\\r\\n`, :code:`\\n` and :code:`\\r` as line
+    endings.
+    """
+    return data.count(b'\n') + data.count(b'\r') - data.count(b'\r\n')
+
+
+def split(path, start, partitions, quotechar=None):
+    """
+    Split a file into byte ranges that each end on a record boundary.
+
+    Boundaries are placed after a :code:`\\n` at which an even number of
+    :code:`quotechar` bytes have been seen since :code:`start`, so newlines
+    inside quoted fields never split a record. (This assumes quotes are
+    escaped by doubling them, as in standard CSV.) A quote inside an
+    unquoted field also counts, so readers must check that each range
+    really ends on a record boundary and raise :class:`BoundaryError` if it
+    does not.
+
+    :param path:
+        Path of the file to split.
+    :param start:
+        Byte offset at which the records begin.
+    :param partitions:
+        The number of ranges to split the file into. Fewer ranges may be
+        returned for small files.
+    :param quotechar:
+        A single byte used to quote fields, or :code:`None` if records can
+        not contain newlines.
+    :returns:
+        A list of :code:`(offset, line_count, line_offset)` tuples, giving the
+        byte offset of each range, the number of lines it contains and the
+        number of lines that precede it (counted from :code:`start`). The
+        :code:`line_count` of the last range is :code:`None`, meaning it
+        extends to the end of the file.
+    """
+    size = os.path.getsize(path)
+    step = max((size - start) // partitions, 1)
+
+    boundaries = [start]
+    line_offsets = [0]
+
+    target = start + step
+    offset = start
+    quotes = 0
+    lines = 0
+    last = b''
+
+    with open(path, 'rb') as f:
+        f.seek(start)
+
+        while len(boundaries) < partitions:
+            block = f.read(BLOCK_SIZE)
+
+            if not block:
+                break
+
+            i = max(target - offset, 0)
+
+            if quotechar is not None:
+                seen = quotes + block.count(quotechar, 0, i)
+
+            while i < len(block) and len(boundaries) < partitions:
+                newline = block.find(b'\n', i)
+
+                if newline == -1:
+                    break
+
+                if quotechar is not None:
+                    seen += block.count(quotechar, i, newline)
+
+                    if seen % 2 == 1:
+                        i = newline + 1
+                        continue
+
+                boundary = offset + newline + 1
+
+                boundaries.append(boundary)
+                line_offsets.append(lines + count_lines(block[:newline + 1]) - _straddles(last, block))
+
+                target = max(start + step * len(boundaries), boundary)
+
+                if quotechar is not None:
+                    seen += block.count(quotechar, newline, target - offset)
+
+                i = target - offset
+
+            if quotechar is not None:
+                quotes += block.count(quotechar)
+
+            lines += count_lines(block) - _straddles(last, block)
+            offset += len(block)
+            last = block[-1:]
+
+    # Don't create an empty range at the end of the file
+    if len(boundaries) > 1 and boundaries[-1] >= size:
+        boundaries.pop()
+        line_offsets.pop()
+
+    line_counts = [b - a for a, b in zip(line_offsets, line_offsets[1:])] + [None]
+
+    return list(zip(boundaries, line_counts, line_offsets))
+
+
+def _straddles(last, block):
+    """
+    Return 1 if a :code:`\\r\\n` line ending is split between two blocks.
+    """
+    return 1 if last == b'\r' and block[:1] == b'\n' else 0
+
+
+def pool_map(func, tasks, workers):
+    """
+    Run :code:`func` over each task in a pool of processes and return the
+    results in the order of the tasks.
+    """
+    pool = multiprocessing.Pool(workers)
+
+    try:
+        return pool.map(func, tasks)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def eliminate(rows, column_names, tester):
+    """
+    Run type elimination over the rows of a single range.
+
+    :returns:
+        For each column, the set of indices into the tester's possible types
+        that are consistent with every value.
+    """
+    hypotheses = tester._eliminate(rows, column_names)
+    possible = tester._possible_types
+
+    return [set(i for i, t in enumerate(possible) if t in h) for h in hypotheses]
+
+
+def choose(results, column_names, tester):
+    """
+    Intersect the results of :func:`eliminate` for every range and select
+    the final column types.
+    """
+    hypotheses = [set(range(len(tester._possible_types))) for name in column_names]
+
+    for result in results:
+        for h, r in zip(hypotheses, result):
+            h &= r
+
+    possible = tester._possible_types
+    hypotheses = [set(possible[i] for i in h) for h in hypotheses]
+
+    return tester._choose(hypotheses, column_names)
+
+
+def cast(rows, column_names, column_types):
+    """
+    Cast the rows of a single range, as :class:`.Table` would.
+
+    Errors are not raised, because the row numbers within this range do not
+    match those of the table. Instead they are returned so that the caller
+    can raise them with the correct row number.
+
+    Values are returned as plain lists rather than :class:`.Row` instances,
+    because they are much faster to send back from a worker. :func:`collect`
+    builds the rows.
+
+    :returns:
+        A tuple of a list of lists of values and either :code:`None` or an
+        error tuple of :code:`(row_index, column_index, message)`.
+        :code:`column_index` is :code:`None` if the row was too long.
+    """
+    len_column_names = len(column_names)
+    cast_funcs = [c.cast for c in column_types]
+    new_rows = []
+
+    for i, row in enumerate(rows):
+        len_row = len(row)
+
+        if len_row > len_column_names:
+            return new_rows, (i, None, len_row)
+        elif len_row < len_column_names:
+            row = chain(row, [None] * (len_column_names - len_row))
+
+        row_values = []
+
+        for j, d in enumerate(row):
+            try:
+                row_values.append(cast_funcs[j](d))
+            except CastError as e:
+                return new_rows, (i, j, str(e))
+
+        new_rows.append(row_values)
+
+    return new_rows, None
+
+
+def collect(results, column_names):
+    """
+    Concatenate the results of :func:`cast` for every range into a list of
+    :class:`.Row` instances, raising the first error with the row number it
+    would have had in a serial parse.
+    """
+    rows = []
+
+    for new_rows, error in results:
+        if error is not None:
+            i, j, detail = error
+            i += len(rows)
+
+            if j is None:
+                raise ValueError('Row %i has %i values, but Table only has %i columns.' % (i, detail, len(column_names)))
+
+            raise CastError(detail + ' Error at row %s column %s.' % (i, column_names[j]))
+
+        rows.extend(Row(values, column_names) for values in new_rows)
+
+    return rows
+
+
+def infer_and_cast(read, tasks, column_names, column_types, workers):
+    """
+    Determine column types (if necessary) and cast every range in parallel.
+
+    :param read:
+        A top-level function that takes a task and returns an iterator of
+        the raw rows in that range.
+    :param tasks:
+        A sequence of picklable task descriptions, one per range.
+    :param column_types:
+        A sequence of :class:`.DataType` instances or a :class:`.TypeTester`.
+    :returns:
+        A tuple of the column types and a list of :class:`.Row` instances.
+    """
+    if isinstance(column_types, TypeTester):
+        # Validate forced column names before starting any processes
+        column_types._force_indices(column_names)
+
+        results = pool_map(_eliminate_task, [(read, task, column_names, column_types) for task in tasks], workers)
+        column_types = choose(results, column_names, column_types)
+
+    results = pool_map(_cast_task, [(read, task, column_names, column_types) for task in tasks], workers)
+
+    return column_types, collect(results, column_names)
+
+
+def _eliminate_task(args):
+    read, task, column_names, tester = args
+
+    return eliminate(read(task), column_names, tester)
+
+
+def _cast_task(args):
+    read, task, column_names, column_types = args
+
+    return cast(read(task), column_names, column_types)
+
+
+def export(method, tasks, workers):
+    """
+    Write tables to separate files, concurrently if :code:`workers` is
+    greater than one.
+
+    Tables are not pickled. Where processes can be forked they inherit the
+    tables from this process and are only sent the index of each task.
+    Elsewhere the files are written by a pool of threads.
+
+    :param method:
+        The name of the :class:`.Table` method to call, such as
+        :code:`to_csv`.
+    :param tasks:
+        A sequence of :code:`(name, table, path, kwargs)` tuples.
+    :returns:
+        An :class:`collections.OrderedDict` mapping each name to the number of
+        seconds taken to write its file.
+    """
+    global _export_tasks
+
+    names = [task[0] for task in tasks]
+    tasks = [(method, table, path, kwargs) for name, table, path, kwargs in tasks]
+
+    if workers > 1 and len(tasks) > 1:
+        workers = min(workers, len(tasks))
+        context = _fork_context()
+
+        if context is not None:
+            # Set before the pool forks, so that every process inherits it
+            _export_tasks = tasks
+
+            try:
+                pool = context.Pool(workers)
+
+                try:
+                    times = pool.map(_export_index, range(len(tasks)))
+                finally:
+                    pool.close()
+                    pool.join()
+            finally:
+                _export_tasks = None
+        else:
+            pool = ThreadPool(workers)
+
+            try:
+                times = pool.map(_export_task, tasks)
+            finally:
+                pool.close()
+                pool.join()
+    else:
+        times = [_export_task(task) for task in tasks]
+
+    return OrderedDict(zip(names, times))
+
+
+def _fork_context():
+    """
+    Get a :mod:`multiprocessing` context which forks processes, or
+    :code:`None` if processes can not be forked on this platform.
+    """
+    if six.PY2:
+        return multiprocessing if os.name == 'posix' else None
+
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+
+    return multiprocessing.get_context('fork')
+
+
+def _export_index(i):
+    return _export_task(_export_tasks[i])
+
+
+def _export_task(args):
+    method, table, path, kwargs = args
+
+    start = time.time()
+    getattr(table, method)(path, **kwargs)
+
+    return time.time() - start
@@ -21,3 +21,86 @@ class Row(MappedSequence):
     features.
     """
     pass
+
+
+class JoinedRow(Row):
+    """
+    A row made by concatenating the values of a left-hand row with selected
+    values of a right-hand row, as in the output of :meth:`.Table.join`.
+
+    Values are not copied. Each instance holds references to the two source
+    rows and a layout shared by every row of the joined table, so it takes
+    the same amount of memory no matter how many columns either table has.
+    Values are looked up in the source rows when they are accessed.
+
+    :param left:
+        A :class:`Row` from the left-hand table or :code:`None`, in which case
+        all of its values are :code:`None`.
+    :param right:
+        A :class:`Row` from the right-hand table or :code:`None`, in which
+        case all of its values are :code:`None`.
+    :param layout:
+        A tuple of the number of left-hand columns and the indices of the
+        right-hand values to include.
+    :param keys:
+        A sequence of keys.
+    """
+    __slots__ = ['_left', '_right', '_layout']
+
+    def __init__(self, left, right, layout, keys=None):
+        self._left = left
+        self._right = right
+        self._layout = layout
+        self._keys = keys
+
+    def __reduce__(self):
+        """
+        Pickle as a plain :class:`Row`, since the source rows may not be
+        shared by whatever unpickles it.
+        """
+        return (Row, (self._values, self._keys))
+
+    @property
+    def _values(self):
+        left_length, right_indices = self._layout
+
+        if self._left is None:
+            left_values = (None,) * left_length
+        else:
+            left_values = self._left.values()
+
+        if self._right is None:
+            right_values = (None,) * len(right_indices)
+        else:
+            right = self._right.values()
+            right_values = tuple([right[i] for i in right_indices])
+
+        return left_values + right_values
+
+    def __getitem__(self, key):
+        """
+        Retrieve values from this row by index, slice or key. Values retrieved
+        by index are read from the source rows directly.
+        """
+        if type(key) is not int:
+            return super(JoinedRow, self).__getitem__(key)
+
+        left_length, right_indices = self._layout
+
+        if key < 0:
+            key += left_length + len(right_indices)
+
+        if 0 <= key < left_length:
+            return None if self._left is None else self._left[key]
+
+        key -= left_length
+
+        if 0 <= key < len(right_indices):
+            return None if self._right is None else self._right[right_indices[key]]
+
+        raise IndexError('tuple index out of range')
+
+    def __len__(self):
+        left_length, right_indices = self._layout
+
+        return left_length + len(right_indices)
@@ -19,7 +19,7 @@ sequences can be accessed either by numeric index or by name. (In the case of
 rows, row names are optional.)
 """
 
-from itertools import chain
+from itertools import chain, islice
 import sys
 import warnings
 
@@ -55,6 +55,9 @@ class Table(object):
         The data as a sequence of any sequences: tuples, lists, etc. If
         any row has fewer values than the number of columns, it will be filled
         out with nulls. No row may have more values than the number of columns.
+        An iterator of rows may also be given, in which case rows are cast as
+        they are consumed and only buffered as far as type inference requires
+        (see the :code:`limit` argument to :class:`.TypeTester`).
     :param column_names:
         A sequence of string names for each column or `None`, in which case
         column names will be automatically assigned using :func:`.letter_name`.
@@ -80,17 +83,6 @@ class Table(object):
         if isinstance(rows, six.string_types):
             raise ValueError('When created directly, the first argument to Table must be a sequence of rows. Did you want agate.Table.from_csv?')
 
-        # Validate column names
-        if column_names:
-            self._column_names = utils.deduplicate(column_names, column_names=True)
-        elif rows:
-            self._column_names = tuple(utils.letter_name(i) for i in range(len(rows[0])))
-            warnings.warn('Column names not specified. "%s" will be used as names.' % str(self._column_names), RuntimeWarning, stacklevel=2)
-        else:
-            self._column_names = tuple()
-
-        len_column_names = len(self._column_names)
-
         # Validate column_types
         if column_types is None:
             column_types = TypeTester()
@@ -105,8 +97,34 @@ class Table(object):
                 if not isinstance(column_type, DataType):
                     raise ValueError('Column types must be instances of DataType.')
 
+        # Buffer streamed rows only as far as naming and type inference require
+        if _is_fork or utils.issequence(rows):
+            sample = rows
+        elif isinstance(column_types, TypeTester) and column_types._limit is None:
+            sample = rows = list(rows)
+        else:
+            rows = iter(rows)
+            sample_size = column_types._limit if isinstance(column_types, TypeTester) else 0
+
+            if not column_names:
+                sample_size = max(sample_size, 1)
+
+            sample = list(islice(rows, sample_size))
+            rows = chain(sample, rows)
+
+        # Validate column names
+        if column_names:
+            self._column_names = utils.deduplicate(column_names, column_names=True)
+        elif sample:
+            self._column_names = tuple(utils.letter_name(i) for i in range(len(sample[0])))
+            warnings.warn('Column names not specified. "%s" will be used as names.' % str(self._column_names), RuntimeWarning, stacklevel=2)
+        else:
+            self._column_names = tuple()
+
+        len_column_names = len(self._column_names)
+
         if isinstance(column_types, TypeTester):
-            self._column_types = column_types.run(rows, self._column_names)
+            self._column_types = column_types.run(sample, self._column_names)
         else:
             self._column_types = tuple(column_types)
 
@@ -295,6 +313,8 @@ class Table(object):
 
 
 from agate.table.aggregate import aggregate
+from agate.table.anti_join import anti_join
+from agate.table.asof_join import asof_join
 from agate.table.bar_chart import bar_chart
 from agate.table.bins import bins
 from agate.table.column_chart import column_chart
@@ -309,6 +329,8 @@ from agate.table.from_json import from_json
 from agate.table.from_object import from_object
 from agate.table.group_by import group_by
 from agate.table.homogenize import homogenize
+from agate.table.iter_csv import iter_csv
+from agate.table.iter_json import iter_json
 from agate.table.join import join
 from agate.table.limit import limit
 from agate.table.line_chart import line_chart
@@ -323,11 +345,14 @@ from agate.table.print_table import print_table
 from agate.table.rename import rename
 from agate.table.scatterplot import scatterplot
 from agate.table.select import select
+from agate.table.semi_join import semi_join
 from agate.table.to_csv import to_csv
 from agate.table.to_json import to_json
 from agate.table.where import where
 
 Table.aggregate = aggregate
+Table.anti_join = anti_join
+Table.asof_join = asof_join
 Table.bar_chart = bar_chart
 Table.bins = bins
 Table.column_chart = column_chart
@@ -342,6 +367,8 @@ Table.from_json = from_json
 Table.from_object = from_object
 Table.group_by = group_by
 Table.homogenize = homogenize
+Table.iter_csv = iter_csv
+Table.iter_json = iter_json
 Table.join = join
 Table.limit = limit
 Table.line_chart = line_chart
@@ -356,6 +383,7 @@ Table.print_table = print_table
 Table.rename = rename
 Table.scatterplot = scatterplot
 Table.select = select
+Table.semi_join = semi_join
 Table.to_csv = to_csv
 Table.to_json = to_json
 Table.where = where
@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+
+from agate.table.semi_join import _filter_by_keys
+
+
+def anti_join(self, right_table, left_key, right_key=None):
+    """
+    Create a new table with only those rows of this table whose key has no
+    match in another table, like a SQL :code:`WHERE ... NOT IN (...)` clause.
+
+    This is the complement of :meth:`.Table.semi_join`. Only a set of the
+    right-hand keys is built and the new table shares its rows with this
+    one. As in :meth:`.Table.join`, null keys match each other, so rows with
+    a null key are only included if :code:`right_table` has no null keys.
+
+    :param right_table:
+        The table to look up keys in.
+    :param left_key:
+        See :meth:`.Table.semi_join`.
+    :param right_key:
+        See :meth:`.Table.semi_join`.
+    :returns:
+        A new :class:`.Table`.
+    """
+    return _filter_by_keys(self, right_table, left_key, right_key, False)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# pylint: disable=W0212
+
+from bisect import bisect_left, bisect_right
+
+from agate.data_types import Date, DateTime, Number
+from agate.exceptions import DataTypeError
+from agate.rows import JoinedRow
+from agate import utils
+
+
+def asof_join(self, right_table, on, by=None, direction='backward', tolerance=None):
+    """
+    Create a new table by joining each row of this table to the row of another
+    table with the nearest key, rather than an equal one.
+
+    This is useful for time series. For instance, each trade can be joined to
+    the most recent quote at or before the time of the trade:
+
+    .. code-block:: python
+
+        trades.asof_join(quotes, 'time', by='symbol')
+
+    Every row of this table is included exactly once, in order. Columns from
+    the right table are added as in :meth:`.Table.join`: the :code:`by`
+    columns are not repeated and names which also exist in this table are
+    suffixed "2". The right-hand :code:`on` column is included, so the key
+    that was matched is visible. If no row matches, the right-hand columns
+    are set to :code:`None`.
+
+    The right table is grouped and sorted once and each row of this table is
+    then matched by bisection, so the join takes :code:`O((n + m) log m)`
+    time.
+
+    :param right_table:
+        The "right" table to join to.
+    :param on:
+        The name of a column to match on, which must exist in both tables and
+        contain :class:`.Date`, :class:`.DateTime` or :class:`.Number` data,
+        of the same type in each.
+        Rows with a null key are never matched.
+    :param by:
+        The name of a column, or a sequence of names, which must exist in both
+        tables. If specified, rows are only matched to rows with equal values
+        in these columns.
+    :param direction:
+        :code:`backward` to match the last row with a key less than or equal
+        to this row's key, :code:`forward` to match the first row with a key
+        greater than or equal to it, or :code:`nearest` to match whichever of
+        those two is closer. Ties are broken in favor of :code:`backward`.
+    :param tolerance:
+        If specified, rows are only matched if their keys differ by at most
+        this much. A :class:`datetime.timedelta` for date and time keys or a
+        number for numeric keys.
+    :returns:
+        A new :class:`.Table`.
+    """
+    if direction not in ('backward', 'forward', 'nearest'):
+        raise ValueError('direction must be "backward", "forward" or "nearest".')
+
+    left_type = self._columns[on].data_type
+    right_type = right_table._columns[on].data_type
+
+    for data_type in (left_type, right_type):
+        if not isinstance(data_type, (Date, DateTime, Number)):
+            raise DataTypeError('asof_join can only match on columns containing Date, DateTime or Number data.')
+
+    if type(left_type) is not type(right_type):
+        raise DataTypeError('asof_join can only match on columns of the same type, not %s and %s.' % (type(left_type).__name__, type(right_type).__name__))
+
+    if by is None:
+        by = []
+    elif not utils.issequence(by):
+        by = [by]
+
+    left_on = self._column_names.index(self._columns[on].name)
+    right_on = right_table._column_names.index(right_table._columns[on].name)
+    left_by = [self._column_names.index(self._columns[name].name) for name in by]
+    right_by = [right_table._column_names.index(right_table._columns[name].name) for name in by]
+
+    # Build names and type lists
+    column_names = list(self._column_names)
+    column_types = list(self._column_types)
+    right_indices = []
+
+    for i, column in enumerate(right_table._columns):
+        if i in right_by:
+            continue
+
+        if column.name in self._column_names:
+            column_names.append('%s2' % column.name)
+        else:
+            column_names.append(column.name)
+
+        column_types.append(column.data_type)
+        right_indices.append(i)
+
+    # Group and sort the right-hand rows once
+    groups = {}
+
+    for i, row in enumerate(right_table._rows):
+        key = row._values[right_on]
+
+        if key is None:
+            continue
+
+        group_key = tuple(row._values[j] for j in right_by)
+
+        if group_key in groups:
+            groups[group_key].append((key, i))
+        else:
+            groups[group_key] = [(key, i)]
+
+    for group_key, items in groups.items():
+        # Stable, so rows with equal keys stay in table order
+        items.sort(key=lambda item: item[0])
+        groups[group_key] = ([key for key, i in items], [i for key, i in items])
+
+    right_rows = right_table._rows
+
+    # Shared by every output row, which only references its source rows
+    layout = (len(self._columns), tuple(right_indices))
+    rows = []
+
+    for row in self._rows:
+        values = row._values
+        key = values[left_on]
+        group = groups.get(tuple(values[j] for j in left_by))
+        right_row = None
+
+        if key is not None and group is not None:
+            match = _find(group, key, direction, tolerance)
+
+            if match is not None:
+                right_row = right_rows[match]
+
+        rows.append(JoinedRow(row, right_row, layout, column_names))
+
+    return self._fork(rows, column_names, column_types, row_names=self._row_names)
+
+
+def _find(group, key, direction, tolerance):
+    """
+    Find the index of the right-hand row that matches a key, or :code:`None`.
+
+    :param group:
+        A tuple of the sorted keys of a group of right-hand rows and the
+        corresponding row indices.
+    """
+    keys, indices = group
+    backward = None
+    forward = None
+
+    if direction != 'forward':
+        # The last of any equal keys
+        i = bisect_right(keys, key) - 1
+
+        if i >= 0 and (tolerance is None or key - keys[i] <= tolerance):
+            backward = i
+
+    if direction != 'backward':
+        # The first of any equal keys
+        i = bisect_left(keys, key)
+
+        if i < len(keys) and (tolerance is None or keys[i] - key <= tolerance):
+            forward = i
+
+    if backward is not None and forward is not None:
+        if keys[forward] - key < key - keys[backward]:
+            return indices[forward]
+
+        return indices[backward]
+
+    if backward is not None:
+        return indices[backward]
+
+    if forward is not None:
+        return indices[forward]
+
+    return None
@@ -6,8 +6,6 @@ try:
 except ImportError:  # pragma: no cover
     from decimal import Decimal
 
-from babel.numbers import format_decimal
-
 from agate.aggregations import Min, Max
 from agate import utils
 
@@ -37,6 +35,8 @@ def bins(self, column_name, count=10, start=None, end=None):
     :returns:
         A new :class:`Table`.
     """
+    from babel.numbers import format_decimal
+
     minimum, maximum = utils.round_limits(
         Min(column_name).run(self),
         Max(column_name).run(self)
@@ -1,12 +1,17 @@
 #!/usr/bin/env python
 
+from csv import QUOTE_NONE, Error as CSVError
 import io
+from itertools import chain, islice
+import warnings
 
 import six
 
+from agate import compression, config, utils
+
 
 @classmethod
-def from_csv(cls, path, column_names=None, column_types=None, row_names=None, skip_lines=0, header=True, sniff_limit=0, encoding='utf-8', **kwargs):
+def from_csv(cls, path, column_names=None, column_types=None, row_names=None, skip_lines=0, header=True, sniff_limit=0, encoding='utf-8', workers=1, columns=None, where=None, **kwargs):
     """
     Create a new table from a CSV.
 
@@ -15,10 +20,14 @@ def from_csv(cls, path, column_names=None, column_types=None, row_names=None, sk
 
     :code:`kwargs` will be passed through to the CSV reader.
 
+    Rows are cast as they are read from the file. To avoid also holding the
+    uncast rows in memory, specify :code:`column_types` or pass a
+    :class:`.TypeTester` with a :code:`limit`.
+
     :param path:
-        Filepath or file-like object from which to read CSV data. If a file-like
-        object is specified, it must be seekable. If using Python 2, the file
-        should be opened in binary mode (`rb`).
+        Filepath or file-like object from which to read CSV data. If using
+        Python 2, the file should be opened in binary mode (`rb`). Files
+        compressed with gzip, bz2 or xz are decompressed as they are read.
     :param column_names:
         See :meth:`.Table.__init__`.
     :param column_types:
@@ -33,25 +42,92 @@ def from_csv(cls, path, column_names=None, column_types=None, row_names=None, sk
         names. If :code:`header` and :code:`column_names` are both specified
         then a row will be skipped, but :code:`column_names` will be used.
     :param sniff_limit:
-        Limit CSV dialect sniffing to the specified number of bytes. Set to
-        None to sniff the entire file. Defaults to 0 (no sniffing).
+        Limit CSV dialect sniffing to the specified number of characters.
+        Set to None to sniff the number of characters given by the
+        :code:`sniff_limit` option (see :mod:`.config`), so that sniffing
+        takes the same time regardless of the size of the file. Only the
+        sniffed characters are read ahead of parsing. Defaults to 0 (no
+        sniffing).
     :param encoding:
         Character encoding of the CSV file. Note: if passing in a file
         handle it is assumed you have already opened it with the correct
         encoding specified.
+    :param workers:
+        If greater than one, the file will be split into this many ranges,
+        which will be parsed and cast in separate processes. :code:`path`
+        must be a file path and the encoding must represent newlines and
+        quotes as single ASCII bytes. Files which can not be split safely
+        (for instance because quotes are escaped with an :code:`escapechar`)
+        are parsed serially, as are compressed files. The ranges are parsed
+        with a :code:`strict` dialect. If a range turns out not to end on a
+        record boundary (for instance because of a stray quote in an
+        unquoted field) or contains quoting that only a lenient dialect
+        accepts, the whole file is parsed again serially. Only supported on
+        Python 3.
+    :param columns:
+        A sequence of column names or indices. If specified, only these
+        columns will be included in the table (in the order given) and the
+        values of other columns will be discarded as soon as each row is
+        read. Names refer to :code:`column_names` if specified, or else to the
+        header row.
+    :param where:
+        A function that takes a :class:`dict` mapping every column name
+        (before :code:`columns` is applied) to its raw, uncast string value
+        and returns :code:`True` if the row should be included. Rows which
+        fail are discarded before they are type tested or cast. If
+        :code:`workers` is greater than one this function must be picklable,
+        i.e. defined at the top level of a module.
     """
-    from agate import csv
     from agate.table import Table
 
+    if workers > 1:
+        if hasattr(path, 'read'):
+            raise ValueError('workers may only be used when path is a file path.')
+
+        if six.PY3:
+            from agate import parallel
+
+            try:
+                table = _from_csv_parallel(path, column_names, column_types, row_names, skip_lines, header, sniff_limit, encoding, workers, columns, where, **kwargs)
+            except (parallel.BoundaryError, CSVError):
+                table = None
+
+            if table is not None:
+                return table
+
+    f, close, reader = _open_reader(path, header, skip_lines, sniff_limit, encoding, **kwargs)
+
+    try:
+        column_names, rows = _select_columns(reader, header, column_names, columns, where)
+
+        # Rows are cast as they are read from the file
+        return Table(rows, column_names, column_types, row_names=row_names)
+    finally:
+        if close:
+            f.close()
+
+
+def _open_reader(path, header, skip_lines, sniff_limit, encoding, **kwargs):
+    """
+    Open a CSV, skip leading lines, sniff its dialect and create a reader.
+
+    See :meth:`.Table.from_csv` for the meaning of the arguments.
+
+    :returns:
+        A tuple of the underlying file, whether it should be closed by the
+        caller and the CSV reader.
+    """
+    from agate import csv
+
     close = False
 
     if hasattr(path, 'read'):
         f = path
     else:
         if six.PY2:
-            f = open(path, 'Urb')
+            f = compression.open_file(path, 'Urb')
         else:
-            f = io.open(path, encoding=encoding)
+            f = compression.open_file(path, encoding=encoding)
 
         close = True
 
@@ -62,27 +138,270 @@ def from_csv(cls, path, column_names=None, column_types=None, row_names=None, sk
     else:
         raise ValueError('skip_lines argument must be an int')
 
-    contents = six.StringIO(f.read())
+    lines = f
 
     if sniff_limit is None:
-        kwargs['dialect'] = csv.Sniffer().sniff(contents.getvalue())
-    elif sniff_limit > 0:
-        kwargs['dialect'] = csv.Sniffer().sniff(contents.getvalue()[:sniff_limit])
+        sniff_limit = config.get_option('sniff_limit')
+
+    if sniff_limit > 0:
+        lines, sample = _read_sample(f, sniff_limit)
+        _sniff(sample, kwargs)
 
     if six.PY2:
         kwargs['encoding'] = encoding
 
-    reader = csv.reader(contents, header=header, **kwargs)
+    return f, close, csv.reader(lines, header=header, **kwargs)
+
+
+def _select_columns(reader, header, column_names, columns, where):
+    """
+    Read the header row (if there is one), filter the rows of a reader and
+    project them onto the selected columns.
 
+    See :meth:`.Table.from_csv` for the meaning of the arguments.
+
+    :returns:
+        A tuple of the column names and an iterator of rows.
+    """
     if header:
         if column_names is None:
             column_names = next(reader)
         else:
             next(reader)
 
-    rows = tuple(reader)
+    if where is not None:
+        reader = utils.filter_rows(reader, column_names, where)
+
+    if columns is None:
+        return column_names, reader
+
+    indices = utils.column_indices(columns, column_names)
+
+    if column_names is not None:
+        column_names = [column_names[i] for i in indices]
+
+    return column_names, utils.project(reader, indices)
+
+
+def _read_sample(f, size):
+    """
+    Read a sample of up to :code:`size` characters for dialect sniffing.
+
+    If :code:`f` is seekable it is rewound to where the sample began.
+    Otherwise the sample is buffered (to the end of its last line) and
+    chained in front of the remaining lines.
+
+    :returns:
+        A tuple of a line iterator or file-like object to read from and the
+        sample.
+    """
+    try:
+        position = f.tell()
+        sample = f.read(size)
+        f.seek(position)
+
+        return f, sample
+    except (AttributeError, IOError, ValueError):
+        pass
+
+    sample = f.read(size)
+
+    if six.PY2:  # pragma: no cover
+        return six.StringIO(sample + f.read()), sample
+
+    return chain(six.StringIO(sample + f.readline()), f), sample
+
+
+def _sniff(sample, kwargs):
+    """
+    Sniff the dialect of a sample and, if it can be determined, add it to the
+    reader's :code:`kwargs`.
+
+    A partial line at the end of the sample is ignored, since it could
+    confuse the sniffer (for instance by ending inside a quoted field).
+    """
+    from agate import csv
+
+    end = max(sample.rfind('\n'), sample.rfind('\r'))
+
+    if end > 0:
+        sample = sample[:end + 1]
+
+    dialect = csv.Sniffer().sniff(sample)
+
+    if dialect is not None:
+        kwargs['dialect'] = dialect
+
+
+def _from_csv_parallel(path, column_names, column_types, row_names, skip_lines, header, sniff_limit, encoding, workers, columns, where, **kwargs):
+    """
+    Parse a CSV file across multiple processes.
+
+    See :meth:`.Table.from_csv` for the meaning of the arguments.
+
+    :returns:
+        A new :class:`.Table`, or :code:`None` if the file can not be split
+        safely and should be parsed serially. :class:`.parallel.BoundaryError`
+        or :class:`csv.Error` is raised if the ranges could not be parsed,
+        in which case the file should also be parsed serially.
+    """
+    from agate import csv
+    from agate import parallel
+    from agate.table import Table
+    from agate.type_tester import TypeTester
+
+    # Compressed files can't be split into byte ranges
+    if compression.detect(path) is not None:
+        return None
+
+    # Newlines and quotes must be single bytes to find boundaries
+    for c in u'\r\n"':
+        if c.encode(encoding) != c.encode('ascii'):
+            return None
+
+    with io.open(path, 'rb') as f:
+        sample = f.read(parallel.BLOCK_SIZE)
+
+        # Old Mac line endings can't be split on
+        if b'\r' in sample and b'\n' not in sample:
+            return None
+
+        f.seek(0)
+
+        if not isinstance(skip_lines, int):
+            raise ValueError('skip_lines argument must be an int')
+
+        for i in range(skip_lines):
+            f.readline()
+
+        start = f.tell()
+
+        if sniff_limit is None:
+            sniff_limit = config.get_option('sniff_limit')
+
+        if sniff_limit > 0:
+            _sniff(f.read(sniff_limit).decode(encoding, 'ignore'), kwargs)
+
+        f.seek(start)
+
+        lines = (line.decode(encoding) for line in iter(f.readline, b''))
+        reader = csv.reader(lines, header=header, **kwargs)
+        dialect = reader.dialect
+
+        if dialect.escapechar and not dialect.doublequote:
+            return None
+
+        header_lines = 0
+
+        if header:
+            if column_names is None:
+                column_names = next(reader)
+            else:
+                next(reader)
+
+            header_lines = reader.line_num
+            start = f.tell()
+
+    all_column_names = column_names
+    indices = None
+
+    if columns is not None:
+        indices = utils.column_indices(columns, column_names)
+
+        if column_names is not None:
+            column_names = [column_names[i] for i in indices]
+
+    # Sniffed dialects can't be pickled, so pass their parameters instead
+    csv_kwargs = dict((k, v) for k, v in kwargs.items() if k not in ('dialect', 'line_numbers'))
+
+    for attr in ('delimiter', 'doublequote', 'escapechar', 'lineterminator', 'quotechar', 'quoting', 'skipinitialspace'):
+        csv_kwargs[attr] = getattr(dialect, attr)
+
+    # Lenient parsing accepts malformed quoting, which could hide a range
+    # that doesn't start on a record boundary
+    csv_kwargs['strict'] = True
+
+    if kwargs.get('line_numbers'):
+        line_number_base = header_lines - (1 if header else 0)
+    else:
+        line_number_base = None
+
+    def task(offset, line_count, line_offset):
+        return (path, offset, line_count, encoding, csv_kwargs, None if line_number_base is None else line_number_base + line_offset, indices, all_column_names, where)
+
+    if column_names is None:
+        first = list(islice(_read_range(task(start, None, 0)), 1))
+        column_names = tuple(utils.letter_name(i) for i in range(len(first[0]) if first else 0))
+        warnings.warn('Column names not specified. "%s" will be used as names.' % str(column_names), RuntimeWarning, stacklevel=3)
+
+    column_names = utils.deduplicate(column_names, column_names=True)
+
+    if column_types is None:
+        column_types = TypeTester()
+    elif isinstance(column_types, dict):
+        column_types = TypeTester(force=column_types)
+
+    # A limited sample is small enough to test in this process
+    if isinstance(column_types, TypeTester) and column_types._limit is not None:
+        rows = list(islice(_read_range(task(start, None, 0)), column_types._limit))
+        column_types = column_types.run(rows, column_names)
+
+    quotechar = None
+
+    if dialect.quoting != QUOTE_NONE and dialect.quotechar:
+        quotechar = dialect.quotechar.encode(encoding)
+
+    ranges = parallel.split(path, start, workers, quotechar)
+    tasks = [task(*r) for r in ranges]
+
+    column_types, rows = parallel.infer_and_cast(_read_range, tasks, column_names, column_types, workers)
+
+    return Table(rows, column_names, column_types, row_names=row_names, _is_fork=True)
+
+
+def _read_range(task):
+    """
+    Read the rows in one range of a CSV file. Used as a worker by
+    :func:`_from_csv_parallel`.
+
+    The quote counting used to split the file can be fooled by quotes in
+    unquoted fields, so records are read until the range's lines have been
+    consumed and :class:`.parallel.BoundaryError` is raised if the last one
+    doesn't end exactly where the next range begins.
+    """
+    from agate import csv
+    from agate import parallel
+
+    path, offset, line_count, encoding, csv_kwargs, line_number_base, indices, column_names, where = task
+
+    with io.open(path, encoding=encoding) as f:
+        f.seek(offset)
+
+        reader = csv.reader(f, header=False, **csv_kwargs)
+
+        for row in reader:
+            if line_count is not None and reader.line_num > line_count:
+                raise parallel.BoundaryError('Range at offset %i does not end on a record boundary.' % offset)
+
+            if line_number_base is not None:
+                row.insert(0, str(line_number_base + reader.line_num))
+
+            if where is not None:
+                if column_names is None:
+                    column_names = [utils.letter_name(i) for i in range(len(row))]
+
+                keep = where(dict(zip(column_names, row)))
+            else:
+                keep = True
+
+            if keep:
+                if indices is not None:
+                    row = [row[i] if i < len(row) else None for i in indices]
+
+                yield row
 
-    if close:
-        f.close()
+            if line_count is not None and reader.line_num == line_count:
+                return
 
-    return Table(rows, column_names, column_types, row_names=row_names)
+    if line_count is not None and reader.line_num != line_count:
+        raise parallel.BoundaryError('Range at offset %i does not end on a record boundary.' % offset)
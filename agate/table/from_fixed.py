@@ -1,13 +1,19 @@
 #!/usr/bin/env python
 
 import io
+from itertools import islice
+import mmap
+import os
 
+import six
+
+from agate import compression
 from agate import fixed
 from agate import utils
 
 
 @classmethod
-def from_fixed(cls, path, schema_path, column_names=utils.default, column_types=None, row_names=None, encoding='utf-8', schema_encoding='utf-8'):
+def from_fixed(cls, path, schema_path, column_names=utils.default, column_types=None, row_names=None, encoding='utf-8', schema_encoding='utf-8', columns=None, where=None, workers=1):
     """
     Create a new table from a fixed-width file and a CSV schema.
 
@@ -16,6 +22,8 @@ def from_fixed(cls, path, schema_path, column_names=utils.default, column_types=
 
     :param path:
         File path or file-like object from which to read fixed-width data.
+        Files compressed with gzip, bz2 or xz are decompressed as they are
+        read.
     :param schema_path:
         File path or file-like object from which to read schema (CSV) data.
     :param column_names:
@@ -33,13 +41,41 @@ def from_fixed(cls, path, schema_path, column_names=utils.default, column_types=
         Character encoding of the schema file. Note: if passing in a file
         handle it is assumed you have already opened it with the correct
         encoding specified.
+    :param columns:
+        A sequence of column names or indices. If specified, only these
+        columns will be sliced from each line and included in the table, in
+        the order given. Names refer to :code:`column_names` if specified, or
+        else to the schema.
+    :param where:
+        A function that takes a :class:`dict` mapping every column name
+        (before :code:`columns` is applied) to its raw, stripped string value
+        and returns :code:`True` if the row should be included. Rows which
+        fail are discarded before they are type tested or cast. If
+        :code:`workers` is greater than one this function must be picklable.
+    :param workers:
+        If greater than one, the file will be memory-mapped and split on line
+        boundaries into this many ranges, which will be sliced and cast in
+        separate processes and reassembled in order. :code:`path` must be a
+        file path and the encoding must represent newlines as single ASCII
+        bytes. Compressed files and files with old Mac line endings are
+        parsed serially. Only supported on Python 3.
     """
     from agate.table import Table
 
+    if workers > 1:
+        if hasattr(path, 'read'):
+            raise ValueError('workers may only be used when path is a file path.')
+
+        if six.PY3:
+            table = _from_fixed_parallel(path, schema_path, column_names, column_types, row_names, encoding, schema_encoding, columns, where, workers)
+
+            if table is not None:
+                return table
+
     close_f = False
 
     if not hasattr(path, 'read'):
-        f = io.open(path, encoding=encoding)
+        f = compression.open_file(path, encoding=encoding)
         close_f = True
     else:
         f = path
@@ -47,21 +83,152 @@ def from_fixed(cls, path, schema_path, column_names=utils.default, column_types=
     close_schema_f = False
 
     if not hasattr(schema_path, 'read'):
-        schema_f = io.open(schema_path, encoding=schema_encoding)
+        schema_f = compression.open_file(schema_path, encoding=schema_encoding)
         close_schema_f = True
     else:
-        schema_f = path
+        schema_f = schema_path
+
+    try:
+        if where is None:
+            if columns is not None and column_names != utils.default:
+                columns = utils.column_indices(columns, column_names)
+                column_names = [column_names[i] for i in columns]
+
+            rows = reader = fixed.reader(f, schema_f, columns=columns)
+            fieldnames = reader.fieldnames
+        else:
+            # The test may use any field, so project only after filtering
+            reader = fixed.reader(f, schema_f)
+            fieldnames = reader.fieldnames
+
+            if column_names == utils.default:
+                all_column_names = fieldnames
+            else:
+                all_column_names = column_names
+
+            rows = utils.filter_rows(reader, all_column_names, where)
+
+            if columns is not None:
+                columns = utils.column_indices(columns, all_column_names)
+                rows = utils.project(rows, columns)
+                fieldnames = [fieldnames[i] for i in columns]
+
+                if column_names != utils.default:
+                    column_names = [column_names[i] for i in columns]
+
+        if column_names == utils.default:
+            column_names = fieldnames
+
+        # Rows are sliced from the file as the table casts them
+        return Table(rows, column_names, column_types, row_names=row_names)
+    finally:
+        if close_f:
+            f.close()
+
+        if close_schema_f:
+            schema_f.close()
+
+
+def _from_fixed_parallel(path, schema_path, column_names, column_types, row_names, encoding, schema_encoding, columns, where, workers):
+    """
+    Parse a fixed-width file across multiple processes.
+
+    See :meth:`.Table.from_fixed` for the meaning of the arguments.
+
+    :returns:
+        A new :class:`.Table`, or :code:`None` if the file can not be split
+        safely and should be parsed serially.
+    """
+    from agate import parallel
+    from agate.table import Table
+    from agate.type_tester import TypeTester
+
+    # Compressed files can't be mapped and empty files can't be split
+    if compression.detect(path) is not None or os.path.getsize(path) == 0:
+        return None
 
-    reader = fixed.reader(f, schema_f)
-    rows = list(reader)
+    # Newlines must be single bytes to find boundaries
+    for c in u'\r\n':
+        if c.encode(encoding) != c.encode('ascii'):
+            return None
 
-    if close_f:
-        f.close()
+    with io.open(path, 'rb') as f:
+        sample = f.read(parallel.BLOCK_SIZE)
 
-    if close_schema_f:
-        schema_f.close()
+    # Lines are split on \n, so a bare \r would not end a line
+    if sample.count(b'\r') != sample.count(b'\r\n'):
+        return None
+
+    if hasattr(schema_path, 'read'):
+        fields = fixed.Reader(None, schema_path).fields
+    else:
+        with compression.open_file(schema_path, encoding=schema_encoding) as schema_f:
+            fields = fixed.Reader(None, schema_f).fields
 
     if column_names == utils.default:
-        column_names = reader.fieldnames
+        column_names = [field.name for field in fields]
+
+    all_column_names = column_names
+    indices = None
+
+    if columns is not None:
+        indices = utils.column_indices(columns, column_names)
+        column_names = [column_names[i] for i in indices]
+
+    column_names = utils.deduplicate(column_names, column_names=True)
+
+    def task(offset, end):
+        return (path, offset, end, encoding, fields, indices, all_column_names, where)
+
+    if column_types is None:
+        column_types = TypeTester()
+    elif isinstance(column_types, dict):
+        column_types = TypeTester(force=column_types)
+
+    # A limited sample is small enough to test in this process
+    if isinstance(column_types, TypeTester) and column_types._limit is not None:
+        rows = list(islice(_read_range(task(0, None)), column_types._limit))
+        column_types = column_types.run(rows, column_names)
+
+    ranges = parallel.split(path, 0, workers)
+    ends = [offset for offset, line_count, line_offset in ranges[1:]] + [None]
+    tasks = [task(offset, end) for (offset, line_count, line_offset), end in zip(ranges, ends)]
+
+    column_types, rows = parallel.infer_and_cast(_read_range, tasks, column_names, column_types, workers)
+
+    return Table(rows, column_names, column_types, row_names=row_names, _is_fork=True)
+
+
+def _read_range(task):
+    """
+    Slice the rows in one range of a memory-mapped fixed-width file. Used as
+    a worker by :func:`_from_fixed_parallel`.
+    """
+    path, offset, end, encoding, fields, indices, column_names, where = task
+
+    with io.open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            mapped.seek(offset)
+
+            if end is None:
+                end = mapped.size()
+
+            def lines():
+                while mapped.tell() < end:
+                    yield mapped.readline().decode(encoding)
+
+            if where is None:
+                for row in fixed.Reader(lines(), fields, columns=indices):
+                    yield row
+            else:
+                rows = utils.filter_rows(fixed.Reader(lines(), fields), column_names, where)
+
+                if indices is not None:
+                    rows = utils.project(rows, indices)
 
-    return Table(rows, column_names, column_types, row_names=row_names)
+                for row in rows:
+                    yield row
+        finally:
+            mapped.close()
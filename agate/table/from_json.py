@@ -2,11 +2,16 @@
 
 from collections import OrderedDict
 from decimal import Decimal
+import io
 import json
 
+import six
+
+from agate import compression, utils
+
 
 @classmethod
-def from_json(cls, path, row_names=None, key=None, newline=False, column_types=None, **kwargs):
+def from_json(cls, path, row_names=None, key=None, newline=False, column_types=None, columns=None, where=None, workers=1, **kwargs):
     """
     Create a new table from a JSON file.
 
@@ -16,10 +21,15 @@ def from_json(cls, path, row_names=None, key=None, newline=False, column_types=N
     If the file contains a top-level dictionary you may specify what
     property contains the row list using the :code:`key` parameter.
 
+    Newline-delimited JSON is read one line at a time: each object is
+    flattened into a row of values as soon as it is decoded, so the decoded
+    objects are never held in memory together.
+
     :code:`kwargs` will be passed through to :meth:`json.load`.
 
     :param path:
-        Filepath or file-like object from which to read JSON data.
+        Filepath or file-like object from which to read JSON data. Files
+        compressed with gzip, bz2 or xz are decompressed as they are read.
     :param row_names:
         See the :meth:`.Table.__init__`.
     :param key:
@@ -28,29 +38,72 @@ def from_json(cls, path, row_names=None, key=None, newline=False, column_types=N
     :param newline:
         If `True` then the file will be parsed as "newline-delimited JSON".
     :param column_types:
-        See :meth:`.Table.__init__`.
+        See :meth:`.Table.__init__`. If a type is given for every column,
+        for instance with a list of types and a list of column names in
+        :code:`columns`, type inference is skipped and values which JSON has
+        already decoded to the right type (:class:`decimal.Decimal` for
+        :class:`.Number` and :class:`bool` for :class:`.Boolean`) are not
+        cast again.
+    :param columns:
+        See :meth:`.Table.from_object`.
+    :param where:
+        See :meth:`.Table.from_object`. If :code:`workers` is greater than
+        one this function must be picklable.
+    :param workers:
+        If greater than one and :code:`newline` is :code:`True`, the file
+        will be split into this many ranges of lines, which will be decoded
+        in separate processes. :code:`path` must be the path of an
+        uncompressed, UTF-8 encoded file. Only supported on Python 3.
     """
     from agate.table import Table
+    from agate.table.from_object import _build_table, _flatten_objects, _schema
 
     if key is not None and newline:
         raise ValueError('key and newline may not be specified together.')
 
     if newline:
-        js = []
+        # Names can be selected before columns are discovered, indices can not
+        if columns is not None and all(isinstance(c, six.string_types) for c in columns):
+            column_names = list(columns)
+            fixed = True
+            columns = None
+        else:
+            column_names = []
+            fixed = False
+
+        # With a complete schema rows can be cast as they are decoded
+        stream = fixed and _schema(column_names, column_types) is not None
+
+        if workers > 1 and six.PY3 and not hasattr(path, 'read') and compression.detect(path) is None:
+            column_names, rows = _from_json_parallel(path, column_names, fixed, where, workers, kwargs)
+        elif hasattr(path, 'read'):
+            rows = _flatten_objects(_decode_lines(path, kwargs), column_names, where, fixed)
 
-        if hasattr(path, 'read'):
-            for line in path:
-                js.append(json.loads(line, object_pairs_hook=OrderedDict, parse_float=Decimal, **kwargs))
+            if stream:
+                return _build_table(rows, column_names, column_types, row_names)
+
+            rows = list(rows)
         else:
-            with open(path, 'r') as f:
-                for line in f:
-                    js.append(json.loads(line, object_pairs_hook=OrderedDict, parse_float=Decimal, **kwargs))
+            with compression.open_file(path, 'rb' if six.PY2 else 'r') as f:
+                rows = _flatten_objects(_decode_lines(f, kwargs), column_names, where, fixed)
+
+                if stream:
+                    return _build_table(rows, column_names, column_types, row_names)
+
+                rows = list(rows)
+
+        if columns is not None:
+            indices = utils.column_indices(columns, column_names)
+            column_names = [column_names[i] for i in indices]
+            rows = list(utils.project(rows, indices))
+
+        return _build_table(rows, column_names, column_types, row_names)
+
+    if hasattr(path, 'read'):
+        js = json.load(path, object_pairs_hook=OrderedDict, parse_float=Decimal, **kwargs)
     else:
-        if hasattr(path, 'read'):
-            js = json.load(path, object_pairs_hook=OrderedDict, parse_float=Decimal, **kwargs)
-        else:
-            with open(path, 'r') as f:
-                js = json.load(f, object_pairs_hook=OrderedDict, parse_float=Decimal, **kwargs)
+        with compression.open_file(path, 'rb' if six.PY2 else 'r') as f:
+            js = json.load(f, object_pairs_hook=OrderedDict, parse_float=Decimal, **kwargs)
 
     if isinstance(js, dict):
         if not key:
@@ -58,4 +111,98 @@ def from_json(cls, path, row_names=None, key=None, newline=False, column_types=N
 
         js = js[key]
 
-    return Table.from_object(js, row_names=row_names, column_types=column_types)
+    return Table.from_object(js, row_names=row_names, column_types=column_types, columns=columns, where=where)
+
+
+def _decode_lines(lines, kwargs):
+    """
+    Decode each non-blank line of newline-delimited JSON.
+    """
+    kwargs = dict(kwargs)
+    cls = kwargs.pop('cls', None) or json.JSONDecoder
+
+    # Reuse one decoder rather than creating one per line, as json.loads would
+    decode = cls(object_pairs_hook=OrderedDict, parse_float=Decimal, **kwargs).decode
+
+    for line in lines:
+        if line.strip():
+            yield decode(line)
+
+
+def _from_json_parallel(path, column_names, fixed, where, workers, kwargs):
+    """
+    Decode and flatten newline-delimited JSON across multiple processes.
+
+    Each process discovers the columns of its own range of lines. The
+    results are then merged in order, so column order is the same as for a
+    serial parse.
+
+    :returns:
+        A tuple of the column names and a list of rows.
+    """
+    from agate import parallel
+
+    # JSON strings can't contain raw newlines, so every newline is a boundary
+    ranges = parallel.split(path, 0, workers)
+    ends = [offset for offset, line_count, line_offset in ranges[1:]] + [None]
+    tasks = [(path, offset, end, column_names, fixed, where, kwargs) for (offset, line_count, line_offset), end in zip(ranges, ends)]
+
+    results = parallel.pool_map(_read_json_range, tasks, workers)
+
+    column_names = list(column_names)
+    positions = dict((name, i) for i, name in enumerate(column_names))
+    rows = []
+
+    for range_names, range_rows in results:
+        for name in range_names:
+            if name not in positions:
+                positions[name] = len(column_names)
+                column_names.append(name)
+
+        # Rows only need to be rearranged if their columns were discovered
+        # in a different order
+        if all(positions[name] == i for i, name in enumerate(range_names)):
+            rows.extend(range_rows)
+        else:
+            mapping = [positions[name] for name in range_names]
+
+            for range_row in range_rows:
+                row = [None] * len(column_names)
+
+                for i, value in zip(mapping, range_row):
+                    row[i] = value
+
+                rows.append(row)
+
+    return column_names, rows
+
+
+def _read_json_range(task):
+    """
+    Decode and flatten one range of a newline-delimited JSON file. Used as a
+    worker by :func:`_from_json_parallel`.
+    """
+    from agate.table.from_object import _flatten_objects
+
+    path, offset, end, column_names, fixed, where, kwargs = task
+
+    column_names = list(column_names)
+
+    def lines():
+        with io.open(path, 'rb') as f:
+            f.seek(offset)
+
+            remaining = end - offset if end is not None else None
+
+            for line in f:
+                if remaining is not None:
+                    if remaining <= 0:
+                        break
+
+                    remaining -= len(line)
+
+                yield line.decode('utf-8')
+
+    rows = list(_flatten_objects(_decode_lines(lines(), kwargs), column_names, where, fixed))
+
+    return column_names, rows
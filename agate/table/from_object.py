@@ -1,10 +1,27 @@
 #!/usr/bin/env python
 
+import datetime
+from decimal import Decimal
+
+import six
+
 from agate import utils
+from agate.data_types import Boolean, DataType, Date, DateTime, Number, Text, TimeDelta
+from agate.exceptions import CastError
+from agate.rows import Row
+
+#: Types of value that each data type's :code:`cast` returns unchanged
+NATIVE_TYPES = {
+    Boolean: (bool,),
+    Date: (datetime.date,),
+    DateTime: (datetime.datetime,),
+    Number: (Decimal,),
+    TimeDelta: (datetime.timedelta,)
+}
 
 
 @classmethod
-def from_object(cls, obj, row_names=None, column_types=None):
+def from_object(cls, obj, row_names=None, column_types=None, columns=None, where=None):
     """
     Create a new table from a Python object.
 
@@ -47,30 +64,204 @@ def from_object(cls, obj, row_names=None, column_types=None):
     :param row_names:
         See :meth:`.Table.__init__`.
     :param column_types:
-        See :meth:`.Table.__init__`.
+        See :meth:`.Table.__init__`. If a type is given for every column, type
+        inference is skipped and values which are already of a column's type
+        are not cast again.
+    :param columns:
+        A sequence of (flattened) column names or indices. If specified, only
+        these columns will be included in the table, in the order given. When
+        only names are given, values for other columns are discarded as soon
+        as each object is parsed. Names which never occur will be included as
+        columns of nulls.
+    :param where:
+        A function that takes a :class:`dict` mapping each (flattened) column
+        name of an object to its uncast value and returns :code:`True` if the
+        object should be included. Objects which fail are discarded before
+        columns are discovered or values are type tested or cast.
+    """
+    # Names can be selected before columns are discovered, indices can not
+    if columns is not None and all(isinstance(c, six.string_types) for c in columns):
+        column_names = list(columns)
+        fixed = True
+        columns = None
+    else:
+        column_names = []
+        fixed = False
+
+    rows = _flatten_objects(obj, column_names, where, fixed)
+
+    if not fixed or _schema(column_names, column_types) is None:
+        rows = list(rows)
+
+    if columns is not None:
+        indices = utils.column_indices(columns, column_names)
+        column_names = [column_names[i] for i in indices]
+        rows = list(utils.project(rows, indices))
+
+    return _build_table(rows, column_names, column_types, row_names)
+
+
+def _flatten_objects(objects, column_names, where=None, fixed=False):
+    """
+    Flatten objects with :func:`.utils.iter_object` and yield a list of
+    values for each, ordered by :code:`column_names`.
+
+    Each value is written straight to its position in the row. Column
+    positions are tracked in a dictionary, so discovering columns takes
+    constant time per value, however many columns there are.
+
+    Names which are not yet in :code:`column_names` are appended to it as they
+    are discovered, so rows yielded earlier may be shorter than the final
+    list of names. (:class:`.Table` pads short rows with nulls.)
+
+    :param objects:
+        An iterable of objects.
+    :param column_names:
+        A list of column names, which will be extended in place.
+    :param where:
+        See :meth:`.Table.from_object`.
+    :param fixed:
+        If :code:`True`, :code:`column_names` will not be extended and values
+        for other names will be discarded.
+    """
+    positions = dict((name, i) for i, name in enumerate(column_names))
+
+    for obj in objects:
+        if where is not None:
+            items = utils.parse_object(obj)
+
+            if not where(items):
+                continue
+
+            items = items.items()
+        elif isinstance(obj, dict):
+            items = _iter_items(obj)
+        else:
+            items = utils.iter_object(obj)
+
+        row = [None] * len(column_names)
+
+        for name, value in items:
+            i = positions.get(name)
+
+            if i is None:
+                if fixed:
+                    continue
+
+                i = positions[name] = len(column_names)
+                column_names.append(name)
+                row.append(None)
+
+            row[i] = value
+
+        yield row
+
+
+def _iter_items(obj):
+    """
+    Flatten a dictionary as :func:`.utils.iter_object` would, but without
+    walking the (common) values which are not nested.
+    """
+    for key, value in obj.items():
+        if isinstance(value, (dict, list, tuple)):
+            for item in utils.iter_object(value, six.text_type(key) + '/'):
+                yield item
+        else:
+            yield six.text_type(key).strip('/'), value
+
+
+def _schema(column_names, column_types):
+    """
+    Resolve :code:`column_types` to a complete list of data types for
+    :code:`column_names`, if possible.
+
+    :returns:
+        A list of :class:`.DataType` instances, or :code:`None` if the types
+        of some columns would have to be inferred, or :code:`column_types` is
+        not valid for these columns. A :class:`ValueError` is raised if
+        :code:`column_types` is a :class:`dict` with a key which is not a
+        column name, as :class:`.TypeTester` would.
+    """
+    if isinstance(column_types, dict):
+        for name in column_types:
+            if name not in column_names:
+                raise ValueError('"%s" does not match the name of any column in this table.' % name)
+
+        column_types = [column_types.get(name) for name in column_names]
+    elif column_types is None or not utils.issequence(column_types):
+        return None
+
+    if len(column_types) != len(column_names) or len(set(column_names)) != len(column_names):
+        return None
+
+    if not all(isinstance(column_type, DataType) for column_type in column_types):
+        return None
+
+    return list(column_types)
+
+
+def _build_table(rows, column_names, column_types, row_names):
+    """
+    Create a :class:`.Table` from flattened rows.
+
+    If the type of every column is known it is created directly, without
+    type testing, and values which are already of the type a column would
+    cast them to (such as :class:`decimal.Decimal` values parsed from JSON
+    for a :class:`.Number` column) are not cast again. Otherwise this falls
+    back to :class:`.Table`.
     """
     from agate.table import Table
 
-    column_names = []
-    row_objects = []
+    schema = _schema(column_names, column_types)
+
+    if schema is None:
+        return Table(rows, column_names, row_names=row_names, column_types=column_types)
+
+    column_names = tuple(column_names)
+
+    return Table(_cast_rows(rows, column_names, schema), column_names, schema, row_names=row_names, _is_fork=True)
+
+
+def _cast_rows(rows, column_names, column_types):
+    """
+    Cast ragged lists of values to :class:`.Row` instances, skipping the
+    :code:`cast` call for nulls and values of a column's native type.
+    """
+    width = len(column_names)
+    casts = []
+
+    for column_type in column_types:
+        native = NATIVE_TYPES.get(type(column_type), ())
+
+        if type(column_type) is Text and not column_type.cast_nulls:
+            native = (six.text_type,)
+
+        if native:
+            native += (type(None),)
 
-    for sub in obj:
-        parsed = utils.parse_object(sub)
+        casts.append((frozenset(native), column_type.cast))
 
-        for key in parsed.keys():
-            if key not in column_names:
-                column_names.append(key)
+    new_rows = []
 
-        row_objects.append(parsed)
+    for i, row in enumerate(rows):
+        len_row = len(row)
 
-    rows = []
+        if len_row > width:
+            raise ValueError('Row %i has %i values, but Table only has %i columns.' % (i, len_row, width))
+        elif len_row < width:
+            row = row + [None] * (width - len_row)
 
-    for sub in row_objects:
-        r = []
+        try:
+            values = [d if type(d) in native else cast(d) for d, (native, cast) in zip(row, casts)]
+        except CastError as e:
+            for j, (d, (native, cast)) in enumerate(zip(row, casts)):
+                try:
+                    cast(d)
+                except CastError:
+                    break
 
-        for name in column_names:
-            r.append(sub.get(name, None))
+            raise CastError(str(e) + ' Error at row %s column %s.' % (i, column_names[j]))
 
-        rows.append(r)
+        new_rows.append(Row(values, column_names))
 
-    return Table(rows, column_names, row_names=row_names, column_types=column_types)
+    return new_rows
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+from itertools import islice
+
+from agate.table.from_csv import _open_reader, _select_columns
+
+
+@classmethod
+def iter_csv(cls, path, chunk_size=10000, column_names=None, column_types=None, skip_lines=0, header=True, sniff_limit=0, encoding='utf-8', columns=None, where=None, **kwargs):
+    """
+    Read a CSV in chunks, yielding a new table for each chunk of rows.
+
+    This makes it possible to process files that do not fit in memory, for
+    instance by aggregating each chunk and combining the results with
+    :meth:`.Table.merge`. Only one chunk is held in memory at a time.
+
+    Column names and types are determined once, from the first chunk (or from
+    :code:`column_types` if a complete list of types is given), and used for
+    every subsequent chunk. If later rows contain values which can not be cast
+    to the inferred types a :exc:`.CastError` will be raised.
+
+    :code:`kwargs` will be passed through to the CSV reader.
+
+    :param path:
+        See :meth:`.Table.from_csv`.
+    :param chunk_size:
+        The maximum number of rows in each yielded table.
+    :param column_names:
+        See :meth:`.Table.__init__`.
+    :param column_types:
+        See :meth:`.Table.__init__`. Type inference only considers the rows
+        of the first chunk.
+    :param skip_lines:
+        See :meth:`.Table.from_csv`.
+    :param header:
+        See :meth:`.Table.from_csv`.
+    :param sniff_limit:
+        See :meth:`.Table.from_csv`.
+    :param encoding:
+        See :meth:`.Table.from_csv`.
+    :param columns:
+        See :meth:`.Table.from_csv`.
+    :param where:
+        See :meth:`.Table.from_csv`.
+    :returns:
+        An iterator of :class:`.Table` instances.
+    """
+    from agate.table import Table
+
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be greater than zero.')
+
+    f, close, reader = _open_reader(path, header, skip_lines, sniff_limit, encoding, **kwargs)
+
+    try:
+        try:
+            column_names, rows = _select_columns(reader, header, column_names, columns, where)
+        except StopIteration:
+            # An empty file has no header row and therefore no chunks
+            return
+
+        while True:
+            chunk = list(islice(rows, chunk_size))
+
+            if not chunk:
+                break
+
+            table = Table(chunk, column_names, column_types)
+
+            # Reuse the names and types of the first chunk for all others
+            column_names = table.column_names
+            column_types = table.column_types
+
+            yield table
+    finally:
+        if close:
+            f.close()
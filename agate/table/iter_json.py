@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+from itertools import islice
+
+import six
+
+from agate import compression
+from agate.table.from_json import _decode_lines
+
+
+@classmethod
+def iter_json(cls, path, chunk_size=10000, column_types=None, columns=None, where=None, **kwargs):
+    """
+    Read a newline-delimited JSON file in chunks, yielding a new table for
+    each chunk of objects.
+
+    This makes it possible to process files that do not fit in memory, as
+    with :meth:`.Table.iter_csv`. Only one chunk is held in memory at a time.
+
+    Columns are discovered as objects are read, so a chunk will include every
+    column seen in it or in any earlier chunk, in the order they were first
+    seen. (Columns which have not been seen yet are not included.) The type of
+    each column is inferred from the first chunk in which it appears and is
+    reused for every later chunk.
+
+    :code:`kwargs` will be passed through to :meth:`json.loads`.
+
+    :param path:
+        See :meth:`.Table.from_json`.
+    :param chunk_size:
+        The maximum number of rows in each yielded table.
+    :param column_types:
+        See :meth:`.Table.__init__`. A :class:`.TypeTester` will be used to
+        infer the types of new columns in each chunk. A sequence of types is
+        matched to columns in the order they are first seen (or the order of
+        :code:`columns`), and only as many types as there are columns in a
+        chunk are used.
+    :param columns:
+        See :meth:`.Table.from_object`. Only column names are supported.
+    :param where:
+        See :meth:`.Table.from_object`.
+    :returns:
+        An iterator of :class:`.Table` instances.
+    """
+    from agate.table import Table
+    from agate.table.from_object import _flatten_objects
+    from agate.type_tester import TypeTester
+
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be greater than zero.')
+
+    if columns is not None:
+        if not all(isinstance(c, six.string_types) for c in columns):
+            raise ValueError('Only column names may be used to select columns from a chunked JSON file.')
+
+        column_names = list(columns)
+    else:
+        column_names = []
+
+    if column_types is None:
+        tester = TypeTester()
+    elif isinstance(column_types, dict):
+        tester = TypeTester(force=column_types)
+    elif isinstance(column_types, TypeTester):
+        tester = column_types
+    else:
+        tester = None
+
+    known_types = {}
+
+    if hasattr(path, 'read'):
+        f = path
+        close = False
+    else:
+        f = compression.open_file(path, 'rb' if six.PY2 else 'r')
+        close = True
+
+    try:
+        rows = _flatten_objects(_decode_lines(f, kwargs), column_names, where, columns is not None)
+
+        while True:
+            chunk = list(islice(rows, chunk_size))
+
+            if not chunk:
+                break
+
+            if tester is not None:
+                # Only test columns whose types are not already known. Forced
+                # columns may not have been seen yet.
+                force = dict((k, v) for k, v in tester._force.items() if k in column_names)
+                force.update(known_types)
+
+                chunk_types = TypeTester(force=force, limit=tester._limit, types=tester._possible_types)
+            else:
+                # Types are given in the order columns are first seen
+                chunk_types = column_types[:len(column_names)]
+
+            table = Table(chunk, list(column_names), chunk_types)
+
+            known_types = dict(zip(table.column_names, table.column_types))
+
+            yield table
+    finally:
+        if close:
+            f.close()
@@ -1,11 +1,21 @@
 #!/usr/bin/env python
 # pylint: disable=W0212
 
-from agate.rows import Row
+import heapq
+from itertools import islice
+import tempfile
+
+import six
+from six.moves import cPickle as pickle, range, zip
+
+from agate.rows import JoinedRow
 from agate import utils
 
+#: Number of keys pickled together when a merge join spills to disk
+RUN_BLOCK_SIZE = 1024
+
 
-def join(self, right_table, left_key=None, right_key=None, inner=False, full_outer=False, require_match=False, columns=None):
+def join(self, right_table, left_key=None, right_key=None, inner=False, full_outer=False, require_match=False, columns=None, algorithm='auto', merge_buffer=None, workers=1):
     """
     Create a new table by joining two table's on common values. This method
     implements most varieties of SQL join, in addition to some unique features.
@@ -45,6 +55,12 @@ def join(self, right_table, left_key=None, right_key=None, inner=False, full_out
     A subset of columns from the right-hand table can be included in the joined
     table using the :code:`columns` argument.
 
+    Rows can be matched with a hash join, which indexes the smaller table in
+    a hash table, or with a sort-merge join, which walks both tables in key
+    order and needs no hash table. Tables which are already sorted by their
+    keys (with nulls last) are merged without sorting. Both algorithms
+    produce the same rows in the same order.
+
     :param right_table:
         The "right" table to join to.
     :param left_key:
@@ -72,59 +88,59 @@ def join(self, right_table, left_key=None, right_key=None, inner=False, full_out
         A sequence of column names from :code:`right_table` to include in
         the final output table. Defaults to all columns not in
         :code:`right_key`. Ignored when :code:`full_outer` is :code:`True`.
+    :param algorithm:
+        Either :code:`hash`, :code:`merge` or :code:`auto`, in which case a
+        merge join is used if both tables are already sorted by their keys and
+        a hash join otherwise. Keys must be sortable to use :code:`merge`.
+    :param merge_buffer:
+        If specified, a merge join sorts at most this many keys of each table
+        in memory at a time. Larger tables are sorted in runs which are
+        spilled to temporary files and then merged.
+    :param workers:
+        If greater than one, a hash join is performed with the rows of both
+        tables partitioned by the hash of their keys into this many buckets,
+        which are matched in separate processes. The output is the same as
+        for a serial join. Keys must be picklable. May not be used in
+        combination with :code:`algorithm='merge'`.
     :returns:
         A new :class:`.Table`.
     """
     if inner and full_outer:
         raise ValueError('A join can not be both "inner" and "full_outer".')
 
+    if algorithm not in ('auto', 'hash', 'merge'):
+        raise ValueError('algorithm must be "auto", "hash" or "merge".')
+
+    if workers > 1:
+        if algorithm == 'merge':
+            raise ValueError('A merge join can not be run with multiple workers.')
+
+        algorithm = 'hash'
+
     if right_key is None:
         right_key = left_key
 
     # Get join columns
     right_key_indices = []
 
-    left_key_is_func = hasattr(left_key, '__call__')
-    left_key_is_sequence = utils.issequence(left_key)
-
-    # Left key is None
-    if left_key is None:
-        left_data = tuple(range(len(self._rows)))
-    # Left key is a function
-    elif left_key_is_func:
-        left_data = [left_key(row) for row in self._rows]
-    # Left key is a sequence
-    elif left_key_is_sequence:
-        left_columns = [self._columns[key] for key in left_key]
-        left_data = zip(*[column.values() for column in left_columns])
-    # Left key is a column name/index
-    else:
-        left_data = self._columns[left_key].values()
-
-    right_key_is_func = hasattr(right_key, '__call__')
-    right_key_is_sequence = utils.issequence(right_key)
-
     # Sequential join
     if left_key is None:
-        right_data = tuple(range(len(right_table._rows)))
-    # Right key is a function
-    elif right_key_is_func:
-        right_data = [right_key(row) for row in right_table._rows]
-    # Right key is a sequence
-    elif right_key_is_sequence:
-        right_columns = [right_table._columns[key] for key in right_key]
-        right_data = zip(*[column.values() for column in right_columns])
-        right_key_indices = [right_table._columns._keys.index(key) for key in right_key]
-    # Right key is a column name/index
+        left_data = range(len(self._rows))
+        right_data = range(len(right_table._rows))
     else:
-        right_column = right_table._columns[right_key]
-        right_data = right_column.values()
-        right_key_indices = [right_table._columns.index(right_column)]
+        left_data = _key_values(self, left_key)
+        right_data = _key_values(right_table, right_key)
+
+        if not hasattr(right_key, '__call__'):
+            right_key_indices = [_column_index(right_table, key) for key in (right_key if utils.issequence(right_key) else [right_key])]
 
     # Build names and type lists
     column_names = list(self._column_names)
     column_types = list(self._column_types)
 
+    # Indices of the right-hand values to include in each row
+    right_indices = []
+
     for i, column in enumerate(right_table._columns):
         name = column.name
 
@@ -141,17 +157,40 @@ def join(self, right_table, left_key=None, right_key=None, inner=False, full_out
             column_names.append(name)
 
         column_types.append(column.data_type)
+        right_indices.append(i)
+
+    # Shared by every output row, which only references its source rows
+    layout = (len(self._columns), tuple(right_indices))
 
-    if columns is not None and not full_outer:
-        right_table = right_table.select([n for n in right_table._column_names if n in columns])
+    left_rows = self._rows
+    right_rows = right_table._rows
 
-    right_hash = {}
+    if algorithm != 'hash':
+        # Don't check the right side if the left already rules out a merge
+        left_sorted = _is_sorted(left_data)
+        right_sorted = (left_sorted or algorithm == 'merge') and _is_sorted(right_data)
 
-    for i, value in enumerate(right_data):
-        if value not in right_hash:
-            right_hash[value] = []
+        if algorithm == 'auto':
+            algorithm = 'merge' if left_sorted and right_sorted else 'hash'
 
-        right_hash[value].append(right_table._rows[i])
+    if algorithm == 'merge':
+        # Both sides must be compared in the same form
+        if _has_nulls(left_data) or _has_nulls(right_data):
+            left_keys = [_sort_key(value) for value in left_data]
+            right_keys = [_sort_key(value) for value in right_data]
+        else:
+            left_keys = left_data
+            right_keys = right_data
+
+        matches, unmatched_right = _merge_match(
+            _key_order(left_keys, left_sorted, merge_buffer),
+            _key_order(right_keys, right_sorted, merge_buffer),
+            len(left_data)
+        )
+    elif workers > 1:
+        matches, unmatched_right = _partitioned_hash_match(left_data, right_data, workers, full_outer)
+    else:
+        matches, unmatched_right = _hash_match(left_data, right_data)
 
     # Collect new rows
     rows = []
@@ -161,53 +200,325 @@ def join(self, right_table, left_key=None, right_key=None, inner=False, full_out
     else:
         row_names = None
 
-    # Iterate over left column
-    for left_index, left_value in enumerate(left_data):
-        matching_rows = right_hash.get(left_value, None)
+    # Iterate over left rows
+    for left_index, right_indices_matched in enumerate(matches):
+        if require_match and right_indices_matched is None:
+            raise ValueError('Left key "%s" does not have a matching right key.' % (left_data[left_index],))
 
-        if require_match and matching_rows is None:
-            raise ValueError('Left key "%s" does not have a matching right key.' % left_value)
+        left_row = left_rows[left_index]
 
         # Rows with matches
-        if matching_rows:
-            for right_row in matching_rows:
-                new_row = list(self._rows[left_index])
+        if right_indices_matched:
+            for right_index in right_indices_matched:
+                rows.append(JoinedRow(left_row, right_rows[right_index], layout, column_names))
 
-                for k, v in enumerate(right_row):
-                    if columns is None and k in right_key_indices and not full_outer:
-                        continue
-
-                    new_row.append(v)
-
-                rows.append(Row(new_row, column_names))
-
-                if self._row_names is not None and not full_outer:
+                if row_names is not None:
                     row_names.append(self._row_names[left_index])
         # Rows without matches
         elif not inner:
-            new_row = list(self._rows[left_index])
-
-            for k, v in enumerate(right_table._column_names):
-                if columns is None and k in right_key_indices and not full_outer:
-                    continue
+            rows.append(JoinedRow(left_row, None, layout, column_names))
 
-                new_row.append(None)
-
-            rows.append(Row(new_row, column_names))
-
-            if self._row_names is not None and not full_outer:
+            if row_names is not None:
                 row_names.append(self._row_names[left_index])
 
     # Full outer join
     if full_outer:
-        left_set = set(left_data)
+        for right_index in unmatched_right():
+            rows.append(JoinedRow(None, right_rows[right_index], layout, column_names))
+
+    return self._fork(rows, column_names, column_types, row_names=row_names)
+
+
+def _key_values(table, key):
+    """
+    Compute the value of a join key for every row of a table. Keys made of
+    several columns are combined into tuples, once, up front.
+    """
+    if hasattr(key, '__call__'):
+        return [key(row) for row in table._rows]
+
+    if utils.issequence(key):
+        indices = [_column_index(table, k) for k in key]
+
+        return [tuple(row._values[i] for i in indices) for row in table._rows]
+
+    i = _column_index(table, key)
+
+    return [row._values[i] for row in table._rows]
+
+
+def _column_index(table, key):
+    """
+    Resolve a column name or (possibly negative) index to an index.
+    """
+    return table._column_names.index(table._columns[key].name)
+
+
+def _hash(data):
+    """
+    Map each distinct key value to the (ascending) indices of the rows with
+    that value.
+    """
+    hashed = {}
+
+    for i, value in enumerate(data):
+        if value in hashed:
+            hashed[value].append(i)
+        else:
+            hashed[value] = [i]
+
+    return hashed
+
+
+def _hash_match(left_data, right_data):
+    """
+    Match keys with a hash table built on the smaller side and probed with
+    the other.
+
+    :returns:
+        A tuple of a list with the matching right-hand row indices (or
+        :code:`None`) for each left-hand row and a function which returns the
+        ascending indices of the unmatched right-hand rows.
+    """
+    if len(left_data) < len(right_data):
+        left_hash = _hash(left_data)
+        matches = {}
+        unmatched = []
 
         for right_index, right_value in enumerate(right_data):
-            if right_value in left_set:
+            left_indices = left_hash.get(right_value)
+
+            if left_indices is None:
+                unmatched.append(right_index)
                 continue
 
-            new_row = ([None] * len(self._columns)) + list(right_table.rows[right_index])
+            for left_index in left_indices:
+                if left_index in matches:
+                    matches[left_index].append(right_index)
+                else:
+                    matches[left_index] = [right_index]
 
-            rows.append(Row(new_row, column_names))
+        return [matches.get(i) for i in range(len(left_data))], lambda: unmatched
 
-    return self._fork(rows, column_names, column_types, row_names=row_names)
+    right_hash = _hash(right_data)
+
+    def unmatched():
+        left_set = set(left_data)
+
+        return [i for i, right_value in enumerate(right_data) if right_value not in left_set]
+
+    return [right_hash.get(left_value) for left_value in left_data], unmatched
+
+
+def _partitioned_hash_match(left_data, right_data, workers, full_outer=False):
+    """
+    Match keys with :func:`_hash_match`, after partitioning both sides into
+    buckets by the hash of their keys and matching each bucket in a separate
+    process. Equal keys always fall into the same bucket. See
+    :func:`_hash_match` for the return value. Unmatched right-hand rows are
+    only found if :code:`full_outer` is :code:`True`.
+    """
+    from agate import parallel
+
+    left_buckets = _partition(left_data, workers)
+    right_buckets = _partition(right_data, workers)
+
+    # Only key values are sent to the workers. Row indices stay here.
+    tasks = [([left_data[i] for i in left_indices], [right_data[i] for i in right_indices], full_outer) for left_indices, right_indices in zip(left_buckets, right_buckets)]
+    results = parallel.pool_map(_match_partition, tasks, workers)
+
+    matches = [None] * len(left_data)
+    unmatched = []
+
+    for (left_indices, right_indices), (bucket_matches, bucket_unmatched) in zip(zip(left_buckets, right_buckets), results):
+        # Indices within a bucket are ascending, so right-hand matches stay in
+        # table order
+        for left_index, local_matches in zip(left_indices, bucket_matches):
+            if local_matches is not None:
+                matches[left_index] = [right_indices[j] for j in local_matches]
+
+        unmatched.extend(right_indices[j] for j in bucket_unmatched)
+
+    unmatched.sort()
+
+    return matches, lambda: unmatched
+
+
+def _partition(data, partitions):
+    """
+    Split the indices of join keys into buckets by the hash of each key.
+    """
+    buckets = [[] for i in range(partitions)]
+
+    for i, value in enumerate(data):
+        buckets[hash(value) % partitions].append(i)
+
+    return buckets
+
+
+def _match_partition(task):
+    """
+    Match the keys of one bucket. Used as a worker by
+    :func:`_partitioned_hash_match`.
+    """
+    left_data, right_data, full_outer = task
+
+    matches, unmatched = _hash_match(left_data, right_data)
+
+    return matches, unmatched() if full_outer else []
+
+
+def _merge_match(left_order, right_order, left_length):
+    """
+    Match keys by merging both sides in key order. See :func:`_hash_match`
+    for the return value.
+
+    :param left_order:
+        An iterator of :code:`(key, index)` pairs for the left-hand rows, as
+        returned by :func:`_key_order`.
+    :param right_order:
+        The same, for the right-hand rows.
+    :param left_length:
+        The number of left-hand rows.
+    """
+    matches = [None] * left_length
+    unmatched = []
+
+    end = (None, None)
+    left = next(left_order, end)
+    right = next(right_order, end)
+
+    while left is not end and right is not end:
+        key = right[0]
+
+        if left[0] == key:
+            # The sort is stable, so duplicates are still in table order
+            right_indices = []
+
+            while right is not end and right[0] == key:
+                right_indices.append(right[1])
+                right = next(right_order, end)
+
+            while left is not end and left[0] == key:
+                matches[left[1]] = right_indices
+                left = next(left_order, end)
+        elif left[0] < key:
+            left = next(left_order, end)
+        else:
+            unmatched.append(right[1])
+            right = next(right_order, end)
+
+    while right is not end:
+        unmatched.append(right[1])
+        right = next(right_order, end)
+
+    unmatched.sort()
+
+    return matches, lambda: unmatched
+
+
+def _sort_key(value):
+    """
+    Make a join key sortable, with nulls last. Nulls are equal to each
+    other, as they are in a hash join.
+    """
+    if type(value) is tuple:
+        return tuple((v is None, v) for v in value)
+
+    return (value is None, value)
+
+
+def _has_nulls(data):
+    """
+    Return :code:`True` if any join key is or contains a null.
+    """
+    for value in data:
+        if value is None or (type(value) is tuple and None in value):
+            return True
+
+    return False
+
+
+def _is_sorted(keys):
+    """
+    Return :code:`True` if keys are in ascending order, with nulls last as
+    for :func:`_sort_key`. Keys are compared as they are, and only converted
+    with :func:`_sort_key` to compare nulls, so unsorted keys are usually
+    ruled out after the first few comparisons.
+    """
+    for a, b in zip(keys, islice(keys, 1, None)):
+        try:
+            # Python 2 orders nulls first instead of raising
+            if six.PY2 and _has_nulls((a, b)):
+                raise TypeError
+
+            out_of_order = b < a
+        except TypeError:
+            try:
+                out_of_order = _sort_key(b) < _sort_key(a)
+            except TypeError:
+                return False
+
+        if out_of_order:
+            return False
+
+    return True
+
+
+def _key_order(keys, is_sorted, buffer_size=None):
+    """
+    Return an iterator of :code:`(key, index)` pairs for each key, in
+    ascending order of key and then index.
+
+    If :code:`buffer_size` is given, unsorted keys are sorted in runs of at
+    most that many, which are written to temporary files and merged.
+    """
+    if is_sorted:
+        return zip(keys, range(len(keys)))
+
+    if buffer_size is None or len(keys) <= buffer_size:
+        return iter(sorted(zip(keys, range(len(keys)))))
+
+    return _spill_sort(keys, buffer_size)
+
+
+def _spill_sort(keys, buffer_size):
+    """
+    Sort :code:`(key, index)` pairs in runs of :code:`buffer_size`, spilled to
+    temporary files and merged. See :func:`_key_order`.
+    """
+    runs = []
+
+    try:
+        for start in range(0, len(keys), buffer_size):
+            end = min(start + buffer_size, len(keys))
+            run = sorted(zip(keys[start:end], range(start, end)))
+
+            f = tempfile.TemporaryFile()
+
+            for j in range(0, len(run), RUN_BLOCK_SIZE):
+                pickle.dump(run[j:j + RUN_BLOCK_SIZE], f, pickle.HIGHEST_PROTOCOL)
+
+            f.seek(0)
+            runs.append(f)
+
+        for item in heapq.merge(*[_read_run(f) for f in runs]):
+            yield item
+    finally:
+        for f in runs:
+            f.close()
+
+
+def _read_run(f):
+    """
+    Read back a sorted run written by :func:`_key_order`, one block at a
+    time.
+    """
+    while True:
+        try:
+            block = pickle.load(f)
+        except EOFError:
+            return
+
+        for item in block:
+            yield item
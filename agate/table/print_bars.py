@@ -12,7 +12,6 @@ except ImportError:  # pragma: no cover
 import sys
 
 
-from babel.numbers import format_decimal
 import six
 
 from agate.aggregations import Min, Max
@@ -44,6 +43,8 @@ def print_bars(self, label_column_name='group', value_column_name='Count', domai
     :param printable:
         If true, only printable characters will be outputed.
     """
+    from babel.numbers import format_decimal
+
     tick_mark = config.get_option('tick_char')
     horizontal_line = config.get_option('horizontal_line_char')
     locale = config.get_option('default_locale')
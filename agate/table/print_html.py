@@ -3,7 +3,6 @@
 
 import sys
 
-from babel.numbers import format_decimal
 import six
 
 from agate import config
@@ -33,6 +32,8 @@ def print_html(self, max_rows=20, max_columns=6, output=sys.stdout, max_column_w
         Provide a locale you would like to be used to format the output.
         By default it will use the system's setting.
     """
+    from babel.numbers import format_decimal
+
     if max_rows is None:
         max_rows = len(self._rows)
 
@@ -3,7 +3,6 @@
 
 import sys
 
-from babel.numbers import format_decimal
 import six
 
 from agate import config
@@ -38,6 +37,8 @@ def print_table(self, max_rows=20, max_columns=6, output=sys.stdout, max_column_
         Numbers with lesser precision won't be affected.
         This defaults to :code:`3`. Pass :code:`None` to disable limit.
     """
+    from babel.numbers import format_decimal
+
     if max_rows is None:
         max_rows = len(self._rows)
 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# pylint: disable=W0212
+
+
+def semi_join(self, right_table, left_key, right_key=None):
+    """
+    Create a new table with only those rows of this table whose key has a
+    match in another table, like a SQL :code:`WHERE ... IN (...)` clause.
+
+    Unlike :meth:`.Table.join`, no columns are added and each row is
+    included at most once, however many times its key occurs in
+    :code:`right_table`. Only a set of the right-hand keys is built and the
+    new table shares its rows with this one. As in :meth:`.Table.join`, null
+    keys match each other.
+
+    :param right_table:
+        The table to look up keys in.
+    :param left_key:
+        Either the name of a column from this table to match on, the index of
+        a column, a sequence of such column identifiers, or a
+        :class:`function` that takes a row and returns a value to match on.
+    :param right_key:
+        Either the name of a column from :code:`right_table` to match on, the
+        index of a column, a sequence of such column identifiers, or a
+        :class:`function` that takes a row and returns a value to match on. If
+        :code:`None` then :code:`left_key` will be used for both.
+    :returns:
+        A new :class:`.Table`.
+    """
+    return _filter_by_keys(self, right_table, left_key, right_key, True)
+
+
+def _filter_by_keys(table, right_table, left_key, right_key, keep):
+    """
+    Select the rows of :code:`table` whose key is (if :code:`keep` is
+    :code:`True`) or is not in the set of keys of :code:`right_table`.
+    """
+    from agate.table.join import _key_values
+
+    if right_key is None:
+        right_key = left_key
+
+    right_keys = set(_key_values(right_table, right_key))
+
+    rows = []
+
+    if table._row_names is not None:
+        row_names = []
+    else:
+        row_names = None
+
+    for i, value in enumerate(_key_values(table, left_key)):
+        if (value in right_keys) is keep:
+            rows.append(table._rows[i])
+
+            if row_names is not None:
+                row_names.append(table._row_names[i])
+
+    return table._fork(rows, row_names=row_names)
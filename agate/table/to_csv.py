@@ -1,8 +1,19 @@
 #!/usr/bin/env python
 # pylint: disable=W0212
 
+from itertools import islice
 import os
 
+import six
+
+from agate import compression
+
+#: Number of rows converted and written at a time
+BATCH_SIZE = 10000
+
+#: Size of the buffer used when writing to a file path
+BUFFER_SIZE = 1024 * 1024
+
 
 def to_csv(self, path, **kwargs):
     """
@@ -11,14 +22,15 @@ def to_csv(self, path, **kwargs):
 
     `kwargs` will be passed through to the CSV writer.
 
+    Values are converted a column at a time, in batches of
+    :data:`BATCH_SIZE` rows, and each batch is written with a single call to
+    :meth:`writerows`.
+
     :param path:
-        Filepath or file-like object to write to.
+        Filepath or file-like object to write to. If the path ends in
+        :code:`.gz`, :code:`.bz2` or :code:`.xz` the output will be
+        compressed.
     """
-    from agate import csv
-
-    if 'lineterminator' not in kwargs:
-        kwargs['lineterminator'] = '\n'
-
     close = True
     f = None
 
@@ -32,15 +44,89 @@ def to_csv(self, path, **kwargs):
             if dirpath and not os.path.exists(dirpath):
                 os.makedirs(dirpath)
 
-            f = open(path, 'w')
+            f = compression.open_file(path, 'wb' if six.PY2 else 'w', buffering=BUFFER_SIZE)
 
-        writer = csv.writer(f, **kwargs)
+        writer, clean = _writer(f, **kwargs)
         writer.writerow(self._column_names)
 
-        csv_funcs = [c.csvify for c in self._column_types]
-
-        for row in self._rows:
-            writer.writerow(tuple(csv_funcs[i](d) for i, d in enumerate(row)))
+        _write_rows(writer, _csv_funcs(self._column_types, clean), self._rows)
     finally:
         if close and f is not None:
             f.close()
+
+
+def _writer(f, **kwargs):
+    """
+    Create a CSV writer.
+
+    :returns:
+        A tuple of the writer and whether the values written to it must have
+        Mac line endings converted first (see :func:`_csv_funcs`).
+    """
+    from agate import csv
+
+    if 'lineterminator' not in kwargs:
+        kwargs['lineterminator'] = '\n'
+
+    if six.PY3 and not kwargs.get('line_numbers'):
+        # agate's writer only adds line numbers and the line ending fix
+        # below, so the builtin writer can be used directly
+        import csv as builtin_csv
+
+        kwargs.pop('line_numbers', None)
+
+        return builtin_csv.writer(f, **kwargs), True
+
+    return csv.writer(f, **kwargs), False
+
+
+def _csv_funcs(column_types, clean):
+    """
+    Get a function to convert the values of each column for a CSV.
+    """
+    from agate.data_types import Boolean, Date, DateTime, Number, TimeDelta
+
+    csv_funcs = []
+
+    for column_type in column_types:
+        func = column_type.csvify
+
+        # Convert embedded Mac line endings to unix style line endings so
+        # they get quoted. Only text can contain them.
+        if clean and not isinstance(column_type, (Boolean, Date, DateTime, Number, TimeDelta)):
+            func = _replace_cr(func)
+
+        csv_funcs.append(func)
+
+    return csv_funcs
+
+
+def _write_rows(writer, csv_funcs, rows):
+    """
+    Convert and write rows in batches.
+    """
+    rows = iter(rows)
+
+    while True:
+        batch = list(islice(rows, BATCH_SIZE))
+
+        if not batch:
+            break
+
+        if csv_funcs:
+            columns = [list(map(func, values)) for func, values in zip(csv_funcs, zip(*batch))]
+            batch = zip(*columns)
+
+        writer.writerows(batch)
+
+
+def _replace_cr(func):
+    def csvify(d):
+        d = func(d)
+
+        if isinstance(d, six.string_types):
+            return d.replace('\r', '\n')
+
+        return d
+
+    return csvify
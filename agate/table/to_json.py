@@ -3,11 +3,17 @@
 
 import codecs
 from collections import OrderedDict
+from itertools import islice
 import json
 import os
 
 import six
 
+from agate import compression
+
+#: Number of rows encoded at a time
+BATCH_SIZE = 1000
+
 
 def to_json(self, path, key=None, newline=False, indent=None, **kwargs):
     """
@@ -16,7 +22,9 @@ def to_json(self, path, key=None, newline=False, indent=None, **kwargs):
     :code:`kwargs` will be passed through to the JSON encoder.
 
     :param path:
-        File path or file-like object to write to.
+        File path or file-like object to write to. If the path ends in
+        :code:`.gz`, :code:`.bz2` or :code:`.xz` the output will be
+        compressed.
     :param key:
         If specified, JSON will be output as an hash instead of a list. May
         be either the name of a column from the this table containing
@@ -47,8 +55,6 @@ def to_json(self, path, key=None, newline=False, indent=None, **kwargs):
     # Pass remaining kwargs through to JSON encoder
     json_kwargs.update(kwargs)
 
-    json_funcs = [c.jsonify for c in self._column_types]
-
     close = True
     f = None
 
@@ -59,47 +65,197 @@ def to_json(self, path, key=None, newline=False, indent=None, **kwargs):
         else:
             if os.path.dirname(path) and not os.path.exists(os.path.dirname(path)):
                 os.makedirs(os.path.dirname(path))
-            f = open(path, 'w')
+            f = compression.open_file(path, 'wb' if six.PY2 else 'w')
 
         if six.PY2:
             f = codecs.getwriter('utf-8')(f)
 
-        def dump_json(data):
-            json.dump(data, f, **json_kwargs)
-
-            if newline:
-                f.write('\n')
-
         # Keyed
         if key is not None:
-            output = OrderedDict()
+            # Check the keys are unique before anything is written
+            keys = []
+            seen = set()
+
+            if not key_is_row_function:
+                if key not in self._column_names:
+                    raise KeyError(key)
+
+                key_index = self._column_names.index(key)
 
             for row in self._rows:
                 if key_is_row_function:
                     k = key(row)
                 else:
-                    k = str(row[key]) if six.PY3 else unicode(row[key])
+                    k = str(row[key_index]) if six.PY3 else unicode(row[key_index])
 
-                if k in output:
+                if k in seen:
                     raise ValueError('Value %s is not unique in the key column.' % six.text_type(k))
 
-                values = tuple(json_funcs[i](d) for i, d in enumerate(row))
-                output[k] = OrderedDict(zip(row.keys(), values))
-            dump_json(output)
+                seen.add(k)
+                keys.append(k)
+
+            items = zip(keys, _json_rows(self))
+
+            if json_kwargs.get('sort_keys'):
+                items = sorted(items, key=lambda item: item[0])
+
+            _dump_json_items(f, items, json_kwargs, keyed=True)
         # Newline-delimited
         elif newline:
-            for row in self._rows:
-                values = tuple(json_funcs[i](d) for i, d in enumerate(row))
-                dump_json(OrderedDict(zip(row.keys(), values)))
+            encode = _json_encoder(json_kwargs)
+
+            for row in _json_rows(self):
+                f.write(encode(row))
+                f.write('\n')
         # Normal
         else:
-            output = []
-
-            for row in self._rows:
-                values = tuple(json_funcs[i](d) for i, d in enumerate(row))
-                output.append(OrderedDict(zip(row.keys(), values)))
-
-            dump_json(output)
+            _dump_json_items(f, _json_rows(self), json_kwargs)
     finally:
         if close and f is not None:
             f.close()
+
+
+def _json_format(json_kwargs):
+    """
+    Get the whitespace :func:`json.dump` would use with these arguments.
+
+    :returns:
+        A tuple of the indent string (or :code:`None`), the item separator and
+        the key separator.
+    """
+    indent = json_kwargs.get('indent')
+
+    if indent is not None and not isinstance(indent, six.string_types):
+        indent = ' ' * indent
+
+    separators = json_kwargs.get('separators')
+
+    if separators is None:
+        separators = (', ' if indent is None or six.PY2 else ',', ': ')
+
+    return indent, separators[0], separators[1]
+
+
+def _json_encoder(json_kwargs):
+    """
+    Create a function which encodes a value exactly as :func:`json.dumps`
+    would with these arguments, without creating a new encoder each time.
+    """
+    json_kwargs = dict(json_kwargs)
+    cls = json_kwargs.pop('cls', None) or json.JSONEncoder
+
+    return cls(**json_kwargs).encode
+
+
+def _json_key(key, json_kwargs):
+    """
+    Encode an object key the way :func:`json.dump` does, including
+    converting numbers, booleans and :code:`None` to strings.
+    """
+    key_kwargs = {
+        'ensure_ascii': json_kwargs.get('ensure_ascii', True),
+        'separators': (',', ':')
+    }
+
+    if 'encoding' in json_kwargs:  # pragma: no cover
+        key_kwargs['encoding'] = json_kwargs['encoding']
+
+    # Strip the braces and ":null" from {key: None}
+    return json.dumps(OrderedDict([(key, None)]), **key_kwargs)[1:-6]
+
+
+def _dump_json_items(f, items, json_kwargs, keyed=False, level=0, dump_value=None):
+    """
+    Write a JSON array, or an object if :code:`keyed` is :code:`True`,
+    incrementally.
+
+    The output is identical to passing a :class:`list` or
+    :class:`collections.OrderedDict` of the same items to :func:`json.dump`,
+    but only :data:`BATCH_SIZE` items are held in memory at a time. Keys
+    must be unique.
+
+    :param items:
+        An iterable of values, or of :code:`(key, value)` pairs if
+        :code:`keyed` is :code:`True`.
+    :param json_kwargs:
+        Arguments for :func:`json.dumps`.
+    :param level:
+        The nesting level of the array or object being written.
+    :param dump_value:
+        A function that takes :code:`f`, a value and its nesting level and
+        writes the value. If not specified, values are encoded as by
+        :func:`json.dumps`.
+    """
+    indent, item_separator, key_separator = _json_format(json_kwargs)
+
+    if indent is None:
+        newline = ''
+    else:
+        newline = '\n' + indent * (level + 1)
+
+    f.write('{' if keyed else '[')
+
+    first = True
+
+    if dump_value is not None:
+        for item in items:
+            if first:
+                f.write(newline)
+                first = False
+            else:
+                f.write(item_separator + newline)
+
+            if keyed:
+                key, value = item
+                f.write(_json_key(key, json_kwargs) + key_separator)
+            else:
+                value = item
+
+            dump_value(f, value, level + 1)
+    else:
+        encode = _json_encoder(json_kwargs)
+        items = iter(items)
+
+        while True:
+            batch = list(islice(items, BATCH_SIZE))
+
+            if not batch:
+                break
+
+            # Encode the batch as a whole, then strip its brackets
+            encoded = encode(OrderedDict(batch) if keyed else batch)
+
+            if indent is None:
+                encoded = encoded[1:-1]
+            else:
+                encoded = encoded[2 + len(indent):-2]
+
+                # JSON strings can't contain raw newlines, so any are
+                # indentation
+                if level:
+                    encoded = encoded.replace('\n', '\n' + indent * level)
+
+            if first:
+                f.write(newline)
+                first = False
+            else:
+                f.write(item_separator + newline)
+
+            f.write(encoded)
+
+    if not first and indent is not None:
+        f.write('\n' + indent * level)
+
+    f.write('}' if keyed else ']')
+
+
+def _json_rows(table):
+    """
+    Generate an :class:`collections.OrderedDict` of JSON-ready values for each
+    row of a table.
+    """
+    json_funcs = [c.jsonify for c in table._column_types]
+    column_names = table._column_names
+
+    for row in table._rows:
+        yield OrderedDict(zip(column_names, [func(d) for func, d in zip(json_funcs, row)]))
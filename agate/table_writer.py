@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+
+from collections import OrderedDict
+import codecs
+import json
+import os
+
+import six
+
+from agate import compression
+from agate.table.to_csv import BUFFER_SIZE, _csv_funcs, _write_rows, _writer
+
+
+class TableWriter(object):
+    """
+    Write a CSV or newline-delimited JSON file incrementally, from a series of
+    tables or batches of rows that share the same columns.
+
+    This makes it possible to export the output of a chunked pipeline (for
+    instance one that uses :meth:`.Table.iter_csv`) without first merging it
+    into a single :class:`.Table`. Only the batch being written is held in
+    memory.
+
+    A :class:`TableWriter` is a context manager:
+
+    .. code-block:: python
+
+        with agate.TableWriter('output.csv') as writer:
+            for chunk in agate.Table.iter_csv('input.csv'):
+                writer.write(chunk.where(lambda row: row['amount'] > 0))
+
+    The column names and types are fixed by the constructor or, if they are
+    not given, by the first :class:`.Table` written. The CSV header is written
+    as soon as the column names are known.
+
+    :param path:
+        File path or file-like object to write to. If the path ends in
+        :code:`.gz`, :code:`.bz2` or :code:`.xz` the output will be
+        compressed.
+    :param column_names:
+        A sequence of column names. Required if the first batch written is not
+        a :class:`.Table`.
+    :param column_types:
+        A sequence of :class:`.DataType` instances, one per column. Required
+        if the first batch written is not a :class:`.Table`.
+    :param format:
+        Either :code:`csv` or :code:`json` (newline-delimited JSON). If not
+        specified it is inferred from the extension of :code:`path`:
+        :code:`.json`, :code:`.jsonl` and :code:`.ndjson` files are written as
+        JSON and anything else as CSV.
+    :param kwargs:
+        Passed through to the CSV writer or the JSON encoder, as for
+        :meth:`.Table.to_csv` and :meth:`.Table.to_json`.
+    """
+    def __init__(self, path, column_names=None, column_types=None, format=None, **kwargs):
+        if format is None:
+            format = 'csv'
+
+            if not hasattr(path, 'write'):
+                root = path
+
+                if compression.detect(path, 'w') is not None:
+                    root = os.path.splitext(path)[0]
+
+                if os.path.splitext(root)[1].lower() in ('.json', '.jsonl', '.ndjson'):
+                    format = 'json'
+
+        if format not in ('csv', 'json'):
+            raise ValueError('format must be "csv" or "json".')
+
+        if (column_names is None) != (column_types is None):
+            raise ValueError('column_names and column_types must be specified together.')
+
+        self._format = format
+        self._kwargs = kwargs
+        self._column_names = None
+        self._column_types = None
+
+        if hasattr(path, 'write'):
+            self._f = path
+            self._close = False
+        else:
+            dirpath = os.path.dirname(path)
+
+            if dirpath and not os.path.exists(dirpath):
+                os.makedirs(dirpath)
+
+            self._f = compression.open_file(path, 'wb' if six.PY2 else 'w', buffering=BUFFER_SIZE)
+            self._close = True
+
+        if format == 'json' and six.PY2:
+            self._f = codecs.getwriter('utf-8')(self._f)
+
+        if column_names is not None:
+            self._start(column_names, column_types)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def column_names(self):
+        """
+        The names of the columns being written, or :code:`None` if they are
+        not yet known.
+        """
+        return self._column_names
+
+    @property
+    def column_types(self):
+        """
+        The types of the columns being written, or :code:`None` if they are
+        not yet known.
+        """
+        return self._column_types
+
+    def _start(self, column_names, column_types):
+        """
+        Fix the columns and write the CSV header.
+        """
+        if len(column_names) != len(column_types):
+            raise ValueError('column_names and column_types must be the same length.')
+
+        self._column_names = tuple(column_names)
+        self._column_types = tuple(column_types)
+
+        if self._format == 'csv':
+            self._writer, clean = _writer(self._f, **self._kwargs)
+            self._writer.writerow(self._column_names)
+            self._funcs = _csv_funcs(self._column_types, clean)
+        else:
+            self._json_kwargs = {
+                'ensure_ascii': False
+            }
+
+            if six.PY2:
+                self._json_kwargs['encoding'] = 'utf-8'
+
+            self._json_kwargs.update(self._kwargs)
+            self._funcs = [c.jsonify for c in self._column_types]
+
+    def write(self, rows):
+        """
+        Append a batch of rows.
+
+        :param rows:
+            A :class:`.Table` with the same column names and types as this
+            writer, or a sequence of rows, each a sequence of values in column
+            order. Rows are cast using the writer's column types.
+        """
+        from agate.table import Table
+
+        if self._f is None:
+            raise ValueError('Can not write to a closed TableWriter.')
+
+        if isinstance(rows, Table):
+            if self._column_names is None:
+                self._start(rows.column_names, rows.column_types)
+            elif tuple(rows.column_names) != self._column_names:
+                raise ValueError('Table columns %s do not match the columns being written: %s' % (repr(rows.column_names), repr(self._column_names)))
+            elif any(not isinstance(a, type(b)) for a, b in zip(rows.column_types, self._column_types)):
+                raise ValueError('Table column types %s do not match the column types being written: %s' % (repr(rows.column_types), repr(self._column_types)))
+
+            rows = rows.rows
+        elif self._column_names is None:
+            raise ValueError('column_names and column_types must be specified before writing rows that are not a Table.')
+        else:
+            rows = Table(rows, self._column_names, self._column_types).rows
+
+        if self._format == 'csv':
+            _write_rows(self._writer, self._funcs, rows)
+        else:
+            for row in rows:
+                values = tuple(self._funcs[i](d) for i, d in enumerate(row))
+                json.dump(OrderedDict(zip(self._column_names, values)), self._f, **self._json_kwargs)
+                self._f.write('\n')
+
+    def close(self):
+        """
+        Finish writing. If the writer opened a file path, the file is closed.
+        A file-like object passed to the constructor is left open.
+        """
+        if self._f is None:
+            return
+
+        if self._close:
+            self._f.close()
+        else:
+            self._f.flush()
+
+        self._f = None
@@ -24,6 +24,8 @@ and end up with data grouped across multiple dimensions.
 dimensions.
 """
 
+from collections import Sequence
+
 import six
 from six.moves import zip_longest
 
@@ -60,7 +62,11 @@ class TableSet(MappedSequence):
         is propagated from an existing tablset.
     """
     def __init__(self, tables, keys, key_name='group', key_type=None, _is_fork=False):
-        tables = tuple(tables)
+        lazy = isinstance(tables, LazyTables)
+
+        if not lazy:
+            tables = tuple(tables)
+
         keys = tuple(keys)
 
         self._key_name = key_name
@@ -73,15 +79,30 @@ class TableSet(MappedSequence):
         self._column_types = self._sample_table.column_types
         self._column_names = self._sample_table.column_names
 
-        if not _is_fork:
-            for table in tables:
-                if any(not isinstance(a, type(b)) for a, b in zip_longest(table.column_types, self._column_types)):
-                    raise ValueError('Not all tables have the same column types!')
+        if lazy:
+            # Tables are validated as they are loaded
+            if not _is_fork:
+                tables._validate = self._validate
 
-                if table.column_names != self._column_names:
-                    raise ValueError('Not all tables have the same column names!')
+            self._values = tables
+            self._keys = keys
+            self._key_indices = dict((k, i) for i, k in enumerate(keys))
+        else:
+            if not _is_fork:
+                for table in tables:
+                    self._validate(table)
 
-        MappedSequence.__init__(self, tables, keys)
+            MappedSequence.__init__(self, tables, keys)
+
+    def __getitem__(self, key):
+        """
+        Retrieve tables by index, slice or key. If the tables are loaded
+        lazily, only the requested table is loaded.
+        """
+        if isinstance(self._values, LazyTables) and not isinstance(key, slice) and type(key) is not int:
+            return self._values[self._key_indices[key]]
+
+        return MappedSequence.__getitem__(self, key)
 
     def __str__(self):
         """
@@ -129,6 +150,16 @@ class TableSet(MappedSequence):
         """
         return self._column_names
 
+    def _validate(self, table):
+        """
+        Verify that a table has the same columns as this :class:`.TableSet`.
+        """
+        if any(not isinstance(a, type(b)) for a, b in zip_longest(table.column_types, self._column_types)):
+            raise ValueError('Not all tables have the same column types!')
+
+        if table.column_names != self._column_names:
+            raise ValueError('Not all tables have the same column names!')
+
     def _fork(self, tables, keys, key_name=None, key_type=None):
         """
         Create a new :class:`.TableSet` using the metadata from this one.
@@ -159,6 +190,45 @@ class TableSet(MappedSequence):
         )
 
 
+class LazyTables(Sequence):
+    """
+    A sequence of tables which are each loaded the first time they are
+    accessed. Used by :meth:`.TableSet.from_csv` when :code:`lazy` is
+    :code:`True`.
+
+    :param load:
+        A function that takes one of the :code:`args` and returns a
+        :class:`.Table`.
+    :param args:
+        A sequence of arguments, one per table.
+    """
+    def __init__(self, load, args):
+        self._load = load
+        self._args = tuple(args)
+        self._tables = [None] * len(self._args)
+        self._validate = None
+
+    def __len__(self):
+        return len(self._args)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return tuple(self[j] for j in range(*i.indices(len(self))))
+
+        if self._tables[i] is None:
+            table = self._load(self._args[i])
+
+            if self._validate is not None:
+                self._validate(table)
+
+            self._tables[i] = table
+
+        return self._tables[i]
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+
 from agate.tableset.aggregate import aggregate
 from agate.tableset.bar_chart import bar_chart
 from agate.tableset.column_chart import column_chart
@@ -4,11 +4,12 @@ from collections import OrderedDict
 from glob import glob
 import os
 
+from agate.rows import Row
 from agate.table import Table
 
 
 @classmethod
-def from_csv(cls, dir_path, column_names=None, column_types=None, row_names=None, header=True, **kwargs):
+def from_csv(cls, dir_path, column_names=None, column_types=None, row_names=None, header=True, workers=1, lazy=False, **kwargs):
     """
     Create a new :class:`TableSet` from a directory of CSVs.
 
@@ -25,17 +26,70 @@ def from_csv(cls, dir_path, column_names=None, column_types=None, row_names=None
         See :meth:`Table.__init__`.
     :param header:
         See :meth:`Table.from_csv`.
+    :param workers:
+        If greater than one, files will be loaded concurrently by a pool of
+        this many processes. All arguments must be picklable. Each process
+        sends back the values of the tables it loads, which must be pickled,
+        so this only helps when parsing and type inference take much longer
+        than copying the data, as for large files with many columns to test.
+    :param lazy:
+        If :code:`True`, the :class:`TableSet` will be returned after only
+        the first file is loaded. Each other file will be loaded (and
+        checked for matching columns) the first time its table is accessed.
+        May not be combined with :code:`workers`.
     """
-    from agate.tableset import TableSet
+    from agate import parallel
+    from agate.tableset import LazyTables, TableSet
 
     if not os.path.isdir(dir_path):
         raise IOError('Specified path doesn\'t exist or isn\'t a directory.')
 
-    tables = OrderedDict()
+    if lazy and workers > 1:
+        raise ValueError('lazy and workers may not be specified together.')
+
+    paths = OrderedDict()
 
     for path in glob(os.path.join(dir_path, '*.csv')):
         name = os.path.split(path)[1].strip('.csv')
 
-        tables[name] = Table.from_csv(path, column_names, column_types, row_names=row_names, header=header, **kwargs)
+        paths[name] = path
+
+    args = [(path, column_names, column_types, row_names, header, kwargs) for path in paths.values()]
+
+    if lazy:
+        tables = LazyTables(_load, args)
+    elif workers > 1:
+        results = parallel.pool_map(_load_values, args, min(workers, len(args)))
+        tables = [_build(*result) for result in results]
+    else:
+        tables = [_load(a) for a in args]
+
+    return TableSet(tables, paths.keys())
+
+
+def _load(args):
+    """
+    Load one table. Used as a worker by :meth:`.TableSet.from_csv`.
+    """
+    path, column_names, column_types, row_names, header, kwargs = args
+
+    return Table.from_csv(path, column_names, column_types, row_names=row_names, header=header, **kwargs)
+
+
+def _load_values(args):
+    """
+    Load one table and return its contents as plain values, which are much
+    faster to send back from a worker than a pickled :class:`.Table`.
+    """
+    table = _load(args)
+
+    return table._column_names, table._column_types, [row._values for row in table._rows], table._row_names
+
+
+def _build(column_names, column_types, values, row_names):
+    """
+    Build a table from the values returned by :func:`_load_values`.
+    """
+    rows = [Row(v, column_names) for v in values]
 
-    return TableSet(tables.values(), tables.keys())
+    return Table(rows, column_names, column_types, row_names=row_names, _is_fork=True)
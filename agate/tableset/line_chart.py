@@ -1,8 +1,6 @@
 #!/usr/bin/env python
 # pylint: disable=W0212
 
-import leather
-
 from agate import utils
 
 
@@ -25,6 +23,8 @@ def line_chart(self, x=0, y=1, path=None, width=None, height=None):
     :param height:
         The height of the output SVG.
     """
+    import leather
+
     if type(x) is int:
         x_name = self.column_names[x]
     else:
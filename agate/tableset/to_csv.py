@@ -3,7 +3,7 @@
 import os
 
 
-def to_csv(self, dir_path, **kwargs):
+def to_csv(self, dir_path, workers=1, **kwargs):
     """
     Write each table in this set to a separate CSV in a given
     directory.
@@ -12,11 +12,25 @@ def to_csv(self, dir_path, **kwargs):
 
     :param dir_path:
         Path to the directory to write the CSV files to.
+    :param workers:
+        If greater than one, tables will be written concurrently by a pool of
+        this many forked processes, which inherit the tables rather than
+        being sent a copy. Where processes can't be forked, a pool of threads
+        is used instead.
+    :returns:
+        An :class:`collections.OrderedDict` mapping the name of each table to
+        the number of seconds taken to write it.
     """
+    from agate import parallel
+
     if not os.path.exists(dir_path):
         os.makedirs(dir_path)
 
+    tasks = []
+
     for name, table in self.items():
         path = os.path.join(dir_path, '%s.csv' % name)
 
-        table.to_csv(path, **kwargs)
+        tasks.append((name, table, path, kwargs))
+
+    return parallel.export('to_csv', tasks, workers)
@@ -1,13 +1,15 @@
 #!/usr/bin/env python
 
-from collections import OrderedDict
-import json
+import codecs
 import os
 
 import six
 
+from agate import compression
+from agate.table.to_json import _dump_json_items, _json_rows
 
-def to_json(self, path, nested=False, indent=None, **kwargs):
+
+def to_json(self, path, nested=False, indent=None, workers=1, **kwargs):
     """
     Write :class:`TableSet` to either a set of JSON files for each table or
     a single nested JSON file.
@@ -17,29 +19,38 @@ def to_json(self, path, nested=False, indent=None, **kwargs):
     :param path:
         Path to the directory to write the JSON file(s) to. If nested is
         `True`, this should be a file path or file-like object to write to.
+        Nested output is written as it is encoded, one row at a time.
     :param nested:
         If `True`, the output will be a single nested JSON file with each
         Table's key paired with a list of row objects. Otherwise, the output
         will be a set of files for each table. Defaults to `False`.
     :param indent:
         See :meth:`Table.to_json`.
+    :param workers:
+        If greater than one and :code:`nested` is :code:`False`, tables will
+        be written concurrently, as for :meth:`.TableSet.to_csv`.
+    :returns:
+        If :code:`nested` is :code:`False`, an
+        :class:`collections.OrderedDict` mapping the name of each table to the
+        number of seconds taken to write it.
     """
+    from agate import parallel
+
     if not nested:
         if not os.path.exists(path):
             os.makedirs(path)
 
+        tasks = []
+        kwargs['indent'] = indent
+
         for name, table in self.items():
             filepath = os.path.join(path, '%s.json' % name)
 
-            table.to_json(filepath, indent=indent, **kwargs)
+            tasks.append((name, table, filepath, kwargs))
+
+        return parallel.export('to_json', tasks, workers)
     else:
         close = True
-        tableset_dict = OrderedDict()
-
-        for name, table in self.items():
-            output = six.StringIO()
-            table.to_json(output, **kwargs)
-            tableset_dict[name] = json.loads(output.getvalue(), object_pairs_hook=OrderedDict)
 
         if hasattr(path, 'write'):
             f = path
@@ -50,7 +61,10 @@ def to_json(self, path, nested=False, indent=None, **kwargs):
             if dirpath and not os.path.exists(dirpath):
                 os.makedirs(dirpath)
 
-            f = open(path, 'w')
+            f = compression.open_file(path, 'wb' if six.PY2 else 'w')
+
+        if six.PY2:
+            f = codecs.getwriter('utf-8')(f)
 
         json_kwargs = {'ensure_ascii': False, 'indent': indent}
 
@@ -58,7 +72,18 @@ def to_json(self, path, nested=False, indent=None, **kwargs):
             json_kwargs['encoding'] = 'utf-8'
 
         json_kwargs.update(kwargs)
-        json.dump(tableset_dict, f, **json_kwargs)
 
-        if close and f is not None:
-            f.close()
+        items = self.items()
+
+        if json_kwargs.get('sort_keys'):
+            items = sorted(items, key=lambda item: item[0])
+
+        # Each table's rows are encoded and written one at a time
+        def dump_table(f, table, level):
+            _dump_json_items(f, _json_rows(table), json_kwargs, level=level)
+
+        try:
+            _dump_json_items(f, items, json_kwargs, keyed=True, dump_value=dump_table)
+        finally:
+            if close:
+                f.close()
@@ -79,14 +79,6 @@ class TypeTester(object):
             The data as a sequence of any sequences: tuples, lists, etc.
         """
         num_columns = len(column_names)
-        hypotheses = [set(self._possible_types) for i in range(num_columns)]
-        force_indices = []
-
-        for name in self._force.keys():
-            try:
-                force_indices.append(column_names.index(name))
-            except ValueError:
-                raise ValueError('"%s" does not match the name of any column in this table.' % name)
 
         if self._limit:
             sample_rows = rows[:self._limit]
@@ -96,7 +88,37 @@ class TypeTester(object):
         else:
             sample_rows = rows
 
-        for row in sample_rows:
+        hypotheses = self._eliminate(sample_rows, column_names)
+
+        return self._choose(hypotheses, column_names)
+
+    def _force_indices(self, column_names):
+        """
+        Get the indices of the columns whose types are forced.
+        """
+        force_indices = []
+
+        for name in self._force.keys():
+            try:
+                force_indices.append(column_names.index(name))
+            except ValueError:
+                raise ValueError('"%s" does not match the name of any column in this table.' % name)
+
+        return force_indices
+
+    def _eliminate(self, rows, column_names):
+        """
+        Test every value in the provided rows and return, for each column, the
+        set of possible types that are consistent with all of them.
+
+        Because eliminating hypotheses is order-independent, the results for
+        separate batches of rows can be intersected.
+        """
+        num_columns = len(column_names)
+        hypotheses = [set(self._possible_types) for i in range(num_columns)]
+        force_indices = self._force_indices(column_names)
+
+        for row in rows:
             for i in range(num_columns):
                 if i in force_indices:
                     continue
@@ -110,9 +132,16 @@ class TypeTester(object):
                     if len(row) > i and not column_type.test(row[i]):
                         h.remove(column_type)
 
+        return hypotheses
+
+    def _choose(self, hypotheses, column_names):
+        """
+        Select the most preferred remaining type for each column.
+        """
+        force_indices = self._force_indices(column_names)
         column_types = []
 
-        for i in range(num_columns):
+        for i in range(len(column_names)):
             if i in force_indices:
                 column_types.append(self._force[column_names[i]])
                 continue
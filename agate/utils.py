@@ -10,7 +10,6 @@ from collections import OrderedDict, Sequence
 from functools import wraps
 import string
 import warnings
-from slugify import slugify as pslugify
 from agate.warns import warn_duplicate_column, warn_unnamed_column
 
 try:
@@ -224,25 +223,48 @@ def letter_name(index):
 
 def parse_object(obj, path=''):
     """
-    Recursively parse JSON-like Python objects as a dictionary of paths/keys
-    and values.
+    Parse JSON-like Python objects as a dictionary of paths/keys and values.
 
     Inspired by JSONPipe (https://github.com/dvxhouse/jsonpipe).
     """
-    if isinstance(obj, dict):
-        iterator = obj.items()
-    elif isinstance(obj, (list, tuple)):
-        iterator = enumerate(obj)
-    else:
+    if not isinstance(obj, (dict, list, tuple)):
         return {path.strip('/'): obj}
 
-    d = OrderedDict()
+    return OrderedDict(iter_object(obj, path))
+
+
+def iter_object(obj, path=''):
+    """
+    Yield a :code:`(path, value)` pair for each scalar value in a JSON-like
+    Python object, in the order :func:`parse_object` would include them.
+
+    Nested objects are walked with an explicit stack rather than by
+    recursion, so arbitrarily deep objects can be flattened and no
+    intermediate dictionaries are built. A path may be yielded more than once
+    if distinct keys flatten to the same path.
+    """
+    if not isinstance(obj, (dict, list, tuple)):
+        yield path.strip('/'), obj
+        return
+
+    stack = [(path, iter(obj.items()) if isinstance(obj, dict) else enumerate(obj))]
+
+    while stack:
+        prefix, iterator = stack[-1]
 
-    for key, value in iterator:
-        key = six.text_type(key)
-        d.update(parse_object(value, path + key + '/'))
+        for key, value in iterator:
+            key = prefix + six.text_type(key) + '/'
 
-    return d
+            if isinstance(value, dict):
+                stack.append((key, iter(value.items())))
+                break
+            elif isinstance(value, (list, tuple)):
+                stack.append((key, enumerate(value)))
+                break
+
+            yield key.strip('/'), value
+        else:
+            stack.pop()
 
 
 def issequence(obj):
@@ -253,6 +275,73 @@ def issequence(obj):
     return isinstance(obj, Sequence) and not isinstance(obj, six.string_types)
 
 
+def column_indices(columns, column_names=None):
+    """
+    Resolve a sequence of column identifiers to column indices.
+
+    :param columns:
+        A sequence of column names and/or indices.
+    :param column_names:
+        The names of all columns, used to look up names. If :code:`None`,
+        only indices may be given.
+    """
+    indices = []
+
+    for column in columns:
+        if isinstance(column, six.integer_types):
+            indices.append(column)
+        elif column_names is None:
+            raise ValueError('Columns must be specified by index when column names are not known.')
+        else:
+            try:
+                indices.append(list(column_names).index(column))
+            except ValueError:
+                raise ValueError('"%s" does not match the name of any column.' % column)
+
+    return indices
+
+
+def project(rows, indices):
+    """
+    Select the values at the given indices from each of a sequence of rows.
+    Rows which are too short to contain an index are filled out with nulls.
+
+    :param rows:
+        An iterable of rows.
+    :param indices:
+        A sequence of column indices.
+    :returns:
+        An iterator of lists.
+    """
+    for row in rows:
+        try:
+            yield [row[i] for i in indices]
+        except IndexError:
+            yield [row[i] if i < len(row) else None for i in indices]
+
+
+def filter_rows(rows, column_names, test):
+    """
+    Yield only those rows which pass a test, without casting them or creating
+    :class:`.Row` instances.
+
+    :param rows:
+        An iterable of rows of raw values.
+    :param column_names:
+        The names of the values in each row. If :code:`None`, letter names
+        will be used, as in :class:`.Table`.
+    :param test:
+        A function that takes a :class:`dict` mapping column names to raw
+        values and returns :code:`True` if the row should be kept.
+    """
+    for row in rows:
+        if column_names is None:
+            column_names = [letter_name(i) for i in range(len(row))]
+
+        if test(dict(zip(column_names, row))):
+            yield row
+
+
 def deduplicate(values, column_names=False, separator='_'):
     """
     Append a unique identifer to duplicate strings in a given sequence of
@@ -307,6 +396,8 @@ def slugify(values, ensure_unique=False, **kwargs):
     Any kwargs will be passed to the slugify method in python-slugify. See:
     https://github.com/un33k/python-slugify
     """
+    from slugify import slugify as pslugify
+
     slug_args = {'separator': '_'}
     slug_args.update(kwargs)
 
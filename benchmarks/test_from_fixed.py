@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+import io
+from timeit import Timer
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import six
+from six.moves import range
+
+import agate
+from agate import fixed
+
+#: Number of lines in the benchmark file
+LINE_COUNT = 10 ** 5
+
+#: Number of fields in each line
+FIELD_COUNT = 300
+
+
+class TestFixedReader(unittest.TestCase):
+    def setUp(self):
+        self.schema = u'column,start,length\n' + u''.join(u'f%i,%i,5\n' % (i, i * 5) for i in range(FIELD_COUNT))
+        self.data = (u''.join(u'%5i' % i for i in range(FIELD_COUNT)) + u'\n') * LINE_COUNT
+
+    def test_reader(self):
+        def test():
+            for row in fixed.Reader(io.StringIO(self.data), io.StringIO(self.schema)):
+                pass
+
+        min_time = min(Timer(test).repeat(3, 1))
+
+        print('fixed.Reader: %.2fs' % min_time)
+
+    def test_from_fixed(self):
+        columns = [six.text_type('f%i' % i) for i in range(0, FIELD_COUNT, 10)]
+        column_types = [agate.Number()] * len(columns)
+
+        def test():
+            agate.Table.from_fixed(io.StringIO(self.data), io.StringIO(self.schema), column_types=column_types, columns=columns)
+
+        min_time = min(Timer(test).repeat(3, 1))
+
+        print('Table.from_fixed (%i of %i columns): %.2fs' % (len(columns), FIELD_COUNT, min_time))
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+from collections import OrderedDict
+from timeit import Timer
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import six
+from six.moves import range
+
+import agate
+
+#: Number of objects in the benchmark
+OBJECT_COUNT = 10 ** 4
+
+#: Number of nested keys in each object
+KEY_COUNT = 200
+
+
+class TestTableFromObject(unittest.TestCase):
+    def setUp(self):
+        self.objects = []
+
+        for i in range(OBJECT_COUNT):
+            obj = OrderedDict()
+
+            for j in range(KEY_COUNT):
+                obj['key%i' % j] = {'value': i, 'tags': [six.text_type(j)]}
+
+            self.objects.append(obj)
+
+    def test_from_object(self):
+        objects = self.objects
+
+        def test():
+            agate.Table.from_object(objects, column_types=agate.TypeTester(limit=0))
+
+        min_time = min(Timer(test).repeat(3, 1))
+
+        print('from_object: %.2fs' % min_time)
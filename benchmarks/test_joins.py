@@ -13,6 +13,75 @@ import six
 from six.moves import range
 
 import agate
+from agate.rows import Row
+
+
+def old_join(left, right, key, inner=False, full_outer=False):
+    """
+    The previous hash join: always hash the right table, storing lists of
+    rows for each key, and copy every value into a new row.
+    """
+    keys = key if isinstance(key, list) else [key]
+
+    left_data = list(zip(*[left.columns[k].values() for k in keys]))
+    right_data = list(zip(*[right.columns[k].values() for k in keys]))
+    right_key_indices = [right.column_names.index(k) for k in keys]
+
+    column_names = list(left.column_names)
+    column_types = list(left.column_types)
+
+    for i, column in enumerate(right.columns):
+        if not full_outer and i in right_key_indices:
+            continue
+
+        column_names.append('%s2' % column.name if column.name in left.column_names else column.name)
+        column_types.append(column.data_type)
+
+    right_hash = {}
+
+    for i, value in enumerate(right_data):
+        if value not in right_hash:
+            right_hash[value] = []
+
+        right_hash[value].append(right.rows[i])
+
+    rows = []
+
+    for left_index, left_value in enumerate(left_data):
+        matching_rows = right_hash.get(left_value, None)
+
+        if matching_rows:
+            for right_row in matching_rows:
+                new_row = list(left.rows[left_index])
+
+                for k, v in enumerate(right_row):
+                    if k in right_key_indices and not full_outer:
+                        continue
+
+                    new_row.append(v)
+
+                rows.append(Row(new_row, column_names))
+        elif not inner:
+            new_row = list(left.rows[left_index])
+
+            for k, v in enumerate(right.column_names):
+                if k in right_key_indices and not full_outer:
+                    continue
+
+                new_row.append(None)
+
+            rows.append(Row(new_row, column_names))
+
+    if full_outer:
+        left_set = set(left_data)
+
+        for right_index, right_value in enumerate(right_data):
+            if right_value in left_set:
+                continue
+
+            rows.append(Row(([None] * len(left.columns)) + list(right.rows[right_index]), column_names))
+
+    return agate.Table(rows, column_names, column_types)
 
 
 class TestTableJoin(unittest.TestCase):
@@ -37,3 +106,101 @@ class TestTableJoin(unittest.TestCase):
         min_time = min(results)
 
         self.assertLess(min_time, 0)
+
+    def _compare(self, label, old, new):
+        before = min(Timer(old).repeat(3, 1))
+        after = min(Timer(new).repeat(3, 1))
+
+        print('%s: old %.2fs, new %.2fs' % (label, before, after))
+
+        self.assertLess(after, before)
+
+    def test_join_small_left(self):
+        left_rows = [(six.text_type(i), i) for i in range(1000)]
+        right_rows = [(six.text_type(i % 1000), i) for i in range(500000)]
+
+        column_names = ['text', 'number']
+        column_types = [agate.Text(), agate.Number()]
+
+        left = agate.Table(left_rows, column_names, column_types)
+        right = agate.Table(right_rows, column_names, column_types)
+
+        self._compare(
+            'small left',
+            lambda: old_join(left, right, 'text', inner=True),
+            lambda: left.join(right, 'text', inner=True)
+        )
+
+    def test_join_small_right(self):
+        left_rows = [(six.text_type(i % 1000), i) for i in range(500000)]
+        right_rows = [(six.text_type(i), i) for i in range(1000)]
+
+        column_names = ['text', 'number']
+        column_types = [agate.Text(), agate.Number()]
+
+        left = agate.Table(left_rows, column_names, column_types)
+        right = agate.Table(right_rows, column_names, column_types)
+
+        self._compare(
+            'small right',
+            lambda: old_join(left, right, 'text'),
+            lambda: left.join(right, 'text')
+        )
+
+    def test_join_multiple_columns_full_outer(self):
+        left_rows = [(six.text_type(i % 1000), i % 7, i) for i in range(100000)]
+        right_rows = [(six.text_type(i % 1000), i % 5, i) for i in range(100000)]
+
+        shuffle(left_rows)
+        shuffle(right_rows)
+
+        column_names = ['text', 'number', 'id']
+        column_types = [agate.Text(), agate.Number(), agate.Number()]
+
+        left = agate.Table(left_rows[:20000], column_names, column_types)
+        right = agate.Table(right_rows, column_names, column_types)
+
+        self._compare(
+            'multiple columns, full outer',
+            lambda: old_join(left, right, ['text', 'number'], full_outer=True),
+            lambda: left.join(right, ['text', 'number'], full_outer=True)
+        )
+
+    def test_join_merge_sorted(self):
+        left_rows = [(i, i) for i in range(200000)]
+        right_rows = [(i // 2, i) for i in range(200000)]
+
+        column_names = ['key', 'number']
+        column_types = [agate.Number(), agate.Number()]
+
+        left = agate.Table(left_rows, column_names, column_types)
+        right = agate.Table(right_rows, column_names, column_types)
+
+        for algorithm in ('hash', 'merge'):
+            self._compare(
+                'sorted, %s' % algorithm,
+                lambda: old_join(left, right, 'key'),
+                lambda: left.join(right, 'key', algorithm=algorithm)
+            )
+
+        shuffle(left_rows)
+        left = agate.Table(left_rows, column_names, column_types)
+
+        self._compare(
+            'unsorted, merge with spilling',
+            lambda: old_join(left, right, 'key'),
+            lambda: left.join(right, 'key', algorithm='merge', merge_buffer=50000)
+        )
+
+    def test_join_wide_one_to_many(self):
+        left_rows = [[i] + list(range(50)) for i in range(2000)]
+        right_rows = [(i % 2000, i) for i in range(100000)]
+
+        left = agate.Table(left_rows, ['key'] + ['c%i' % i for i in range(50)], [agate.Number()] * 51)
+        right = agate.Table(right_rows, ['key', 'number'], [agate.Number(), agate.Number()])
+
+        self._compare(
+            'wide one to many',
+            lambda: old_join(left, right, 'key'),
+            lambda: left.join(right, 'key')
+        )
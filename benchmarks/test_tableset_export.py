@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+import multiprocessing
+import shutil
+from timeit import Timer
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import six
+from six.moves import range
+
+import agate
+from agate import parallel
+
+#: Number of rows in the benchmark table set
+ROW_COUNT = 200000
+
+#: Number of tables in the benchmark table set
+GROUP_COUNT = 500
+
+#: Number of processes used to write files
+WORKERS = max(multiprocessing.cpu_count(), 2)
+
+
+class TestTableSetExport(unittest.TestCase):
+    def setUp(self):
+        rows = [(six.text_type(i % GROUP_COUNT), i, six.text_type(i) * 3) for i in range(ROW_COUNT)]
+
+        column_names = ['group', 'number', 'text']
+        column_types = [agate.Text(), agate.Number(), agate.Text()]
+
+        self.tableset = agate.Table(rows, column_names, column_types).group_by('group')
+
+    def tearDown(self):
+        shutil.rmtree('.test-tableset', ignore_errors=True)
+
+    @unittest.skipIf(six.PY2, 'Parallel export is only tested on Python 3')
+    def test_to_csv_workers(self):
+        tableset = self.tableset
+
+        def serial():
+            tableset.to_csv('.test-tableset')
+
+        def pickled():
+            # The previous implementation: every table is pickled to a worker
+            tasks = [('to_csv', table, '.test-tableset/%s.csv' % name, {}) for name, table in tableset.items()]
+            parallel.pool_map(parallel._export_task, tasks, WORKERS)
+
+        def forked():
+            tableset.to_csv('.test-tableset', workers=WORKERS)
+
+        serial()
+
+        times = [min(Timer(f).repeat(3, 1)) for f in (serial, pickled, forked)]
+
+        print('%i workers on %i CPUs, serial: %.2fs, pickled: %.2fs, forked: %.2fs' % ((WORKERS, multiprocessing.cpu_count()) + tuple(times)))
+
+        self.assertLess(times[2], times[1])
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+import datetime
+from decimal import Decimal
+import io
+import os
+from timeit import Timer
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import six
+from six.moves import range
+
+import agate
+
+#: Number of rows in the benchmark table
+ROW_COUNT = 10 ** 7
+
+
+class TestTableToCSV(unittest.TestCase):
+    def setUp(self):
+        rows = ((Decimal(i), six.text_type(i), i % 2 == 0, datetime.date(2015, 1, 1 + i % 28)) for i in range(ROW_COUNT))
+
+        column_names = ['number', 'text', 'boolean', 'date']
+        column_types = [agate.Number(), agate.Text(), agate.Boolean(), agate.Date()]
+
+        self.table = agate.Table(rows, column_names, column_types)
+
+    def tearDown(self):
+        if os.path.exists('.test.csv'):
+            os.remove('.test.csv')
+
+    def test_to_csv(self):
+        table = self.table
+
+        def row_by_row():
+            # The previous implementation: one writerow call per row
+            with io.open('.test.csv', 'wb' if six.PY2 else 'w') as f:
+                writer = agate.csv.writer(f)
+                writer.writerow(table.column_names)
+
+                csv_funcs = [c.csvify for c in table.column_types]
+
+                for row in table.rows:
+                    writer.writerow(tuple(csv_funcs[i](d) for i, d in enumerate(row)))
+
+        def batched():
+            table.to_csv('.test.csv')
+
+        before = min(Timer(row_by_row).repeat(3, 1))
+        after = min(Timer(batched).repeat(3, 1))
+
+        print('row by row: %.2fs, batched: %.2fs' % (before, after))
+
+        self.assertLess(after, before)
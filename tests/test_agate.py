@@ -1,5 +1,9 @@
 #!/usr/bin/env python
 
+import os
+import subprocess
+import sys
+
 try:
     import unittest2 as unittest
 except ImportError:
@@ -22,3 +26,67 @@ class TestCSV(unittest.TestCase):
             self.assertIs(agate.csv.writer, agate.csv_py3.writer)
             self.assertIs(agate.csv.DictReader, agate.csv_py3.DictReader)
             self.assertIs(agate.csv.DictWriter, agate.csv_py3.DictWriter)
+
+
+#: Modules which :code:`import agate` should not import
+LAZY_MODULES = ('leather', 'slugify', 'babel', 'parsedatetime', 'isodate', 'pytimeparse')
+
+# AgateTestCase can only be loaded lazily on Python 3.7+
+if sys.version_info >= (3, 7):
+    LAZY_MODULES += ('unittest',)
+
+#: Maximum number of seconds :code:`import agate` may take in a fresh
+#: interpreter. Override with :code:`AGATE_IMPORT_TIME_BUDGET`.
+IMPORT_TIME_BUDGET = float(os.environ.get('AGATE_IMPORT_TIME_BUDGET', 1.0))
+
+IMPORT_SCRIPT = '''
+import sys
+import time
+
+lazy = %r
+
+start = time.time()
+
+# Measure what the import would cost if nothing were deferred
+if sys.argv[1:] == ['eager']:
+    for name in lazy + ('babel.numbers', 'babel.core', 'agate.testcase'):
+        __import__(name)
+
+import agate
+elapsed = time.time() - start
+
+print(elapsed)
+print(','.join(m for m in lazy if m in sys.modules))
+''' % (LAZY_MODULES,)
+
+
+class TestImport(unittest.TestCase):
+    def _run_import(self, *args):
+        output = subprocess.check_output([sys.executable, '-c', IMPORT_SCRIPT] + list(args))
+        elapsed, loaded = output.decode('utf-8').splitlines()
+
+        return float(elapsed), loaded
+
+    def test_lazy_imports(self):
+        elapsed, loaded = self._run_import()
+
+        self.assertEqual(loaded, '')
+
+    def test_import_time(self):
+        # Compared to an eager import in the same run, so that the test
+        # doesn't depend on the speed of the machine
+        elapsed = min(self._run_import()[0] for i in range(3))
+        eager = min(self._run_import('eager')[0] for i in range(3))
+
+        self.assertLess(elapsed, eager)
+
+    def test_import_time_budget(self):
+        elapsed = min(self._run_import()[0] for i in range(3))
+
+        self.assertLess(elapsed, IMPORT_TIME_BUDGET)
+
+    def test_lazy_testcase(self):
+        self.assertIs(agate.AgateTestCase, agate.testcase.AgateTestCase)
+
+        with self.assertRaises(AttributeError):
+            agate.does_not_exist
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+import io
+import os
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import six
+
+from agate import compression
+
+
+class TestCompression(unittest.TestCase):
+    def tearDown(self):
+        for ext in ('', '.gz', '.bz2', '.xz'):
+            if os.path.exists('.test.txt' + ext):
+                os.remove('.test.txt' + ext)
+
+    def test_detect_magic(self):
+        self.assertEqual(compression.detect('examples/test.csv.gz'), 'gzip')
+        self.assertEqual(compression.detect('examples/test.json.bz2'), 'bz2')
+        self.assertIsNone(compression.detect('examples/test.csv'))
+
+    def test_detect_plain_bz_header(self):
+        with io.open('.test.txt', 'wb') as f:
+            f.write(b'BZh,score\n1,2\n')
+
+        self.assertIsNone(compression.detect('.test.txt'))
+
+        with compression.open_file('.test.txt', 'rb') as f:
+            self.assertEqual(f.read(), b'BZh,score\n1,2\n')
+
+    def test_detect_empty_bz2(self):
+        with compression.open_file('.test.txt.bz2', 'wb') as f:
+            pass
+
+        self.assertEqual(compression.detect('.test.txt.bz2'), 'bz2')
+
+    @unittest.skipIf(not hasattr(os, 'mkfifo'), 'Named pipes are not supported on this platform')
+    def test_detect_fifo(self):
+        os.mkfifo('.test.txt')
+
+        # A pipe with no writer would block if it were opened
+        self.assertIsNone(compression.detect('.test.txt'))
+
+    def test_detect_extension(self):
+        self.assertEqual(compression.detect('foo.csv.gz', 'w'), 'gzip')
+        self.assertEqual(compression.detect('foo.BZ2', 'w'), 'bz2')
+        self.assertEqual(compression.detect('foo.xz', 'w'), 'xz')
+        self.assertIsNone(compression.detect('foo.csv', 'w'))
+
+    def test_detect_uncompressed_extension(self):
+        with io.open('.test.txt.gz', 'wb') as f:
+            f.write(b'plain')
+
+        with compression.open_file('.test.txt.gz', 'rb') as f:
+            self.assertEqual(f.read(), b'plain')
+
+    @unittest.skipIf(six.PY2, 'xz compression is only supported on Python 3')
+    def test_round_trip(self):
+        text = u'a,b\n1,👍\n' * 10000
+
+        for ext in ('', '.gz', '.bz2', '.xz'):
+            path = '.test.txt' + ext
+
+            with compression.open_file(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+
+            self.assertEqual(compression.detect(path), compression.detect(path, 'w'))
+
+            with compression.open_file(path, encoding='utf-8') as f:
+                self.assertEqual(f.read(), text)
+
+            with compression.open_file(path, encoding='utf-8', read_ahead=False) as f:
+                self.assertEqual(list(f), list(io.StringIO(text)))
+
+    def test_read_ahead_close_early(self):
+        data = os.urandom(compression.CHUNK_SIZE * (compression.QUEUE_SIZE + 4))
+
+        with io.open('.test.txt.gz', 'wb') as f:
+            import gzip
+
+            with gzip.GzipFile(fileobj=f, mode='wb') as g:
+                g.write(data)
+
+        f = compression.open_file('.test.txt.gz', 'rb')
+        self.assertEqual(f.read(10), data[:10])
+
+        # The background thread is blocked on a full queue
+        f.close()
+        self.assertTrue(f.closed)
+
+    def test_read_ahead_error(self):
+        class Broken(object):
+            def read(self, size):
+                raise IOError('broken')
+
+            def close(self):
+                pass
+
+        f = compression.ReadAhead(Broken())
+
+        with self.assertRaises(IOError):
+            f.read(10)
+
+        f.close()
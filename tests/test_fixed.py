@@ -50,3 +50,19 @@ class TestFixed(unittest.TestCase):
 
         self.assertEqual(csv_reader.fieldnames, fixed_reader.fieldnames)
         self.assertEqual(csv_data, fixed_data)
+
+    def test_reader_columns(self):
+        with open('examples/testfixed') as f:
+            with open('examples/testfixed_schema.csv') as schema_f:
+                fixed_reader = fixed.Reader(f, schema_f, columns=['date', 0])
+                fixed_data = list(fixed_reader)
+
+        self.assertEqual(fixed_reader.fieldnames, ['date', 'text'])
+        self.assertEqual(fixed_data[0], ['1971-01-01', 'Chicago Reader'])
+
+    def test_reader_single_column(self):
+        with open('examples/testfixed') as f:
+            with open('examples/testfixed_schema.csv') as schema_f:
+                fixed_data = list(fixed.Reader(f, schema_f, columns=['text']))
+
+        self.assertEqual(fixed_data[:2], [['Chicago Reader'], ['Chicago Sun-Times']])
@@ -1,9 +1,25 @@
 #!/usr/bin/env python
 # -*- coding: utf8 -*-
 
+from decimal import Decimal
+import io
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+import six
+
 from agate import Table
 from agate.testcase import AgateTestCase
 from agate.data_types import *
+from agate.exceptions import CastError
 from agate.type_tester import TypeTester
 
 
@@ -31,6 +47,14 @@ class TestJSON(AgateTestCase):
         self.assertColumnTypes(table2, [Number, Text, Boolean, Date, DateTime, TimeDelta])
         self.assertRows(table2, table1.rows)
 
+    def test_from_json_bz2(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+        table2 = Table.from_json('examples/test.json.bz2')
+
+        self.assertColumnNames(table2, self.column_names)
+        self.assertColumnTypes(table2, [Number, Text, Boolean, Date, DateTime, TimeDelta])
+        self.assertRows(table2, table1.rows)
+
     def test_from_json_file_like_object(self):
         table1 = Table(self.rows, self.column_names, self.column_types)
 
@@ -88,3 +112,119 @@ class TestJSON(AgateTestCase):
     def test_from_json_error_newline_key(self):
         with self.assertRaises(ValueError):
             table = Table.from_json('examples/test.json', newline=True, key='test')  # noqa
+
+    def test_from_json_columns(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+        table2 = Table.from_json('examples/test.json', columns=['date', 'number'])
+
+        self.assertColumnNames(table2, ['date', 'number'])
+        self.assertColumnTypes(table2, [Date, Number])
+        self.assertRows(table2, table1.select(['date', 'number']).rows)
+
+    def test_from_json_columns_indices(self):
+        table = Table.from_json('examples/test_nested.json', columns=[3, 0])
+
+        self.assertColumnNames(table, ['three/0', 'one'])
+        self.assertRows(table, [
+            ['a', 1],
+            ['d', 2]
+        ])
+
+    def test_from_json_columns_missing(self):
+        table = Table.from_json('examples/test_mixed.json', columns=['four', 'six'])
+
+        self.assertColumnNames(table, ['four', 'six'])
+        self.assertRows(table, [
+            [None, None],
+            ['d', None],
+            [None, None]
+        ])
+
+    def test_from_json_where(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+        table2 = Table.from_json('examples/test.json', where=lambda row: row['boolean'] is not None)
+
+        self.assertColumnNames(table2, self.column_names)
+        self.assertRows(table2, table1.where(lambda row: row['boolean'] is not None).rows)
+
+    def test_from_json_where_nested(self):
+        table = Table.from_json('examples/test_nested.json', columns=['one'], where=lambda row: row['three/0'] == 'd')
+
+        self.assertRows(table, [[2]])
+
+    def test_from_json_newline_blank_lines(self):
+        f = io.StringIO(u'{"a": 1}\n\n{"a": 2, "b": "x"}\n  \n')
+        table = Table.from_json(f, newline=True)
+
+        self.assertColumnNames(table, ['a', 'b'])
+        self.assertRows(table, [
+            [1, None],
+            [2, 'x']
+        ])
+
+    def test_from_json_newline_columns_where(self):
+        table = Table.from_json('examples/test_newline.json', newline=True, columns=['text', 'six'], where=lambda row: row['number'] is not None)
+
+        self.assertColumnNames(table, ['text', 'six'])
+        self.assertRows(table, [
+            ['a', None],
+            [u'👍', None]
+        ])
+
+    def test_from_json_newline_columns_indices(self):
+        table = Table.from_json('examples/test_newline.json', newline=True, columns=[1, 0])
+
+        self.assertColumnNames(table, ['text', 'number'])
+        self.assertEqual(len(table.rows), 3)
+
+    @unittest.skipIf(six.PY2, 'Parallel JSON parsing is only supported on Python 3')
+    def test_from_json_newline_workers(self):
+        table1 = Table.from_json('examples/test_newline.json', newline=True)
+        table2 = Table.from_json('examples/test_newline.json', newline=True, workers=2)
+
+        self.assertColumnNames(table2, table1.column_names)
+        self.assertColumnTypes(table2, [Number, Text, Boolean, Date, DateTime, TimeDelta])
+        self.assertRows(table2, table1.rows)
+
+    def test_from_json_schema(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+
+        for newline, path in [(False, 'examples/test.json'), (True, 'examples/test_newline.json')]:
+            table2 = Table.from_json(path, newline=newline, columns=self.column_names, column_types=self.column_types)
+
+            self.assertColumnNames(table2, self.column_names)
+            self.assertColumnTypes(table2, [Number, Text, Boolean, Date, DateTime, TimeDelta])
+            self.assertRows(table2, table1.rows)
+
+    def test_from_json_schema_dict(self):
+        column_types = dict(zip(self.column_names, self.column_types))
+
+        with patch.object(TypeTester, 'run') as run:
+            table = Table.from_json('examples/test_newline.json', newline=True, column_types=column_types)
+
+        self.assertFalse(run.called)
+        self.assertColumnNames(table, self.column_names)
+        self.assertColumnTypes(table, [Number, Text, Boolean, Date, DateTime, TimeDelta])
+
+    def test_from_json_schema_dict_unknown_column(self):
+        column_types = {'a': Number(), 'typo': Text()}
+
+        with self.assertRaises(ValueError):
+            Table.from_object([{'a': 1}], column_types=column_types)
+
+        with self.assertRaises(ValueError):
+            Table.from_json(io.StringIO(u'{"a": 1}\n'), newline=True, columns=['a'], column_types=column_types)
+
+    def test_from_json_schema_skips_native_values(self):
+        with patch.object(Number, 'cast', side_effect=Number.cast, autospec=True) as cast:
+            table = Table.from_json(io.StringIO(u'{"a": 1.5}\n{"a": null}\n{"a": 2}\n'), newline=True, columns=['a'], column_types=[Number()])
+
+        # Only the integer needs to be cast
+        self.assertEqual(cast.call_count, 1)
+        self.assertRows(table, [[Decimal('1.5')], [None], [Decimal('2')]])
+
+    def test_from_json_schema_cast_error(self):
+        with self.assertRaises(CastError) as cm:
+            Table.from_json(io.StringIO(u'{"a": 1, "b": 2}\n{"a": 2, "b": "x"}\n'), newline=True, columns=['a', 'b'], column_types=[Number(), Number()])
+
+        self.assertIn('Error at row 1 column b.', str(cm.exception))
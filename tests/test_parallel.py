@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+import io
+
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+from agate import parallel
+
+
+class TestSplit(unittest.TestCase):
+    def test_count_lines(self):
+        self.assertEqual(parallel.count_lines(b'a\nb\r\nc\rd'), 3)
+        self.assertEqual(parallel.count_lines(b''), 0)
+
+    def test_split_quoted_newlines(self):
+        path = 'examples/test_quoted_newlines.csv'
+
+        with io.open(path, 'rb') as f:
+            data = f.read()
+
+        start = data.index(b'\n') + 1
+        ranges = parallel.split(path, start, 5, b'"')
+
+        self.assertGreater(len(ranges), 1)
+        self.assertEqual(ranges[0][0], start)
+        self.assertIsNone(ranges[-1][1])
+
+        offsets = [r[0] for r in ranges] + [len(data)]
+
+        for i, (offset, line_count, line_offset) in enumerate(ranges):
+            chunk = data[offset:offsets[i + 1]]
+
+            # Every range begins and ends outside of a quoted field
+            self.assertEqual(chunk.count(b'"') % 2, 0)
+            self.assertEqual(line_offset, parallel.count_lines(data[start:offset]))
+
+            if line_count is not None:
+                self.assertEqual(line_count, parallel.count_lines(chunk))
+
+    def test_split_small_file(self):
+        ranges = parallel.split('examples/test.csv', 0, 100)
+
+        self.assertEqual(len(ranges), 4)
+        self.assertEqual([r[2] for r in ranges], [0, 1, 2, 3])
@@ -15,6 +15,7 @@ from agate import Table
 from agate.data_types import *
 from agate.computations import Formula
 from agate.testcase import AgateTestCase
+from agate.type_tester import TypeTester
 from agate.warns import DuplicateColumnWarning
 
 
@@ -108,6 +109,36 @@ class TestBasic(AgateTestCase):
         self.assertColumnTypes(table, [Number, Number, Text])
         self.assertRows(table, self.rows)
 
+    def test_create_table_iterator(self):
+        table = Table(iter(self.rows), self.column_names, self.column_types)
+
+        self.assertColumnNames(table, self.column_names)
+        self.assertColumnTypes(table, [Number, Number, Text])
+        self.assertRows(table, self.rows)
+
+    def test_create_table_iterator_type_tester(self):
+        table = Table(iter(self.rows), self.column_names)
+
+        self.assertColumnTypes(table, [Number, Number, Text])
+        self.assertRows(table, self.rows)
+
+    def test_create_table_iterator_type_tester_limit(self):
+        table = Table((row for row in self.rows), self.column_names, TypeTester(limit=2))
+
+        self.assertColumnTypes(table, [Number, Number, Text])
+        self.assertRows(table, self.rows)
+
+    def test_create_table_iterator_no_column_names(self):
+        warnings.simplefilter('ignore')
+
+        try:
+            table = Table(iter(self.rows), None, self.column_types)
+        finally:
+            warnings.resetwarnings()
+
+        self.assertColumnNames(table, ['a', 'b', 'c'])
+        self.assertRows(table, self.rows)
+
     def test_create_table_non_string_columns(self):
         column_names = ['one', 'two', 3]
 
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+import datetime
+
+from agate import Table
+from agate.data_types import *
+from agate.exceptions import DataTypeError
+from agate.rows import JoinedRow
+from agate.testcase import AgateTestCase
+
+
+class TestAsofJoin(AgateTestCase):
+    def setUp(self):
+        self.left_rows = (
+            (1, 'a', 'x'),
+            (5, 'b', 'x'),
+            (7, 'c', 'y'),
+            (None, 'd', 'x'),
+            (10, 'e', 'y')
+        )
+
+        self.right_rows = (
+            (2, 'x', 'p'),
+            (4, 'x', 'q'),
+            (4, 'x', 'r'),
+            (8, 'y', 's'),
+            (None, 'x', 't'),
+            (6, 'x', 'u')
+        )
+
+        self.number_type = Number()
+        self.text_type = Text()
+
+        self.left = Table(self.left_rows, ['time', 'name', 'group'], [self.number_type, self.text_type, self.text_type], row_names='name')
+        self.right = Table(self.right_rows, ['time', 'group', 'value'], [self.number_type, self.text_type, self.text_type])
+
+    def test_backward(self):
+        new_table = self.left.asof_join(self.right, 'time')
+
+        self.assertColumnNames(new_table, ['time', 'name', 'group', 'time2', 'group2', 'value'])
+        self.assertColumnTypes(new_table, [Number, Text, Text, Number, Text, Text])
+        self.assertRows(new_table, [
+            (1, 'a', 'x', None, None, None),
+            (5, 'b', 'x', 4, 'x', 'r'),
+            (7, 'c', 'y', 6, 'x', 'u'),
+            (None, 'd', 'x', None, None, None),
+            (10, 'e', 'y', 8, 'y', 's')
+        ])
+        self.assertSequenceEqual(new_table.row_names, ['a', 'b', 'c', 'd', 'e'])
+
+    def test_forward(self):
+        new_table = self.left.asof_join(self.right, 'time', direction='forward')
+
+        self.assertRows(new_table, [
+            (1, 'a', 'x', 2, 'x', 'p'),
+            (5, 'b', 'x', 6, 'x', 'u'),
+            (7, 'c', 'y', 8, 'y', 's'),
+            (None, 'd', 'x', None, None, None),
+            (10, 'e', 'y', None, None, None)
+        ])
+
+    def test_forward_ties(self):
+        new_table = Table([(4,)], ['time'], [self.number_type]).asof_join(self.right, 'time', direction='forward')
+
+        self.assertRows(new_table, [
+            (4, 4, 'x', 'q')
+        ])
+
+    def test_nearest(self):
+        new_table = self.left.asof_join(self.right, 'time', direction='nearest')
+
+        self.assertRows(new_table, [
+            (1, 'a', 'x', 2, 'x', 'p'),
+            (5, 'b', 'x', 4, 'x', 'r'),
+            (7, 'c', 'y', 6, 'x', 'u'),
+            (None, 'd', 'x', None, None, None),
+            (10, 'e', 'y', 8, 'y', 's')
+        ])
+
+    def test_by(self):
+        new_table = self.left.asof_join(self.right, 'time', by='group')
+
+        self.assertColumnNames(new_table, ['time', 'name', 'group', 'time2', 'value'])
+        self.assertColumnTypes(new_table, [Number, Text, Text, Number, Text])
+        self.assertRows(new_table, [
+            (1, 'a', 'x', None, None),
+            (5, 'b', 'x', 4, 'r'),
+            (7, 'c', 'y', None, None),
+            (None, 'd', 'x', None, None),
+            (10, 'e', 'y', 8, 's')
+        ])
+
+    def test_by_sequence(self):
+        new_table = self.left.asof_join(self.right, 'time', by=['group'], direction='forward')
+
+        self.assertRows(new_table, [
+            (1, 'a', 'x', 2, 'p'),
+            (5, 'b', 'x', 6, 'u'),
+            (7, 'c', 'y', 8, 's'),
+            (None, 'd', 'x', None, None),
+            (10, 'e', 'y', None, None)
+        ])
+
+    def test_tolerance(self):
+        new_table = self.left.asof_join(self.right, 'time', direction='nearest', tolerance=1)
+
+        self.assertRows(new_table, [
+            (1, 'a', 'x', 2, 'x', 'p'),
+            (5, 'b', 'x', 4, 'x', 'r'),
+            (7, 'c', 'y', 6, 'x', 'u'),
+            (None, 'd', 'x', None, None, None),
+            (10, 'e', 'y', None, None, None)
+        ])
+
+    def test_dates(self):
+        left = Table([
+            (datetime.datetime(2017, 1, 1, 12, 0),),
+            (datetime.datetime(2017, 1, 1, 12, 30),)
+        ], ['time'], [DateTime()])
+
+        right = Table([
+            (datetime.datetime(2017, 1, 1, 11, 50), 1),
+            (datetime.datetime(2017, 1, 1, 12, 10), 2)
+        ], ['time', 'value'], [DateTime(), self.number_type])
+
+        new_table = left.asof_join(right, 'time', tolerance=datetime.timedelta(minutes=15))
+
+        self.assertRows(new_table, [
+            (datetime.datetime(2017, 1, 1, 12, 0), datetime.datetime(2017, 1, 1, 11, 50), 1),
+            (datetime.datetime(2017, 1, 1, 12, 30), None, None)
+        ])
+
+    def test_empty_right(self):
+        right = Table([], ['time', 'group', 'value'], [self.number_type, self.text_type, self.text_type])
+
+        new_table = self.left.asof_join(right, 'time')
+
+        self.assertEqual(len(new_table.rows), 5)
+        self.assertSequenceEqual(new_table.rows[1], (5, 'b', 'x', None, None, None))
+
+    def test_invalid_direction(self):
+        with self.assertRaises(ValueError):
+            self.left.asof_join(self.right, 'time', direction='sideways')
+
+    def test_invalid_type(self):
+        with self.assertRaises(DataTypeError):
+            self.left.asof_join(self.right, 'group')
+
+    def test_mismatched_types(self):
+        left = Table([(datetime.date(2017, 1, 1),)], ['time'], [Date()])
+        right = Table([(datetime.datetime(2017, 1, 1, 12, 0),)], ['time'], [DateTime()])
+
+        with self.assertRaises(DataTypeError):
+            left.asof_join(right, 'time')
+
+    def test_rows_lazy(self):
+        new_table = self.left.asof_join(self.right, 'time')
+
+        for row in new_table.rows:
+            self.assertIsInstance(row, JoinedRow)
+
+        self.assertIs(new_table.rows[1]._left, self.left.rows[1])
+        self.assertIs(new_table.rows[1]._right, self.right.rows[2])
+        self.assertIsNone(new_table.rows[0]._right)
+
+    def test_missing_column(self):
+        with self.assertRaises(KeyError):
+            self.left.asof_join(self.right, 'foo')
+
+        with self.assertRaises(KeyError):
+            self.left.asof_join(self.right, 'time', by='name')
@@ -1,17 +1,60 @@
 #!/usr/bin/env python
 # -*- coding: utf8 -*-
 
+from csv import Error as CSVError
 import io
+import os
 import warnings
 
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
 import six
 
-from agate import Table
+from agate import Table, parallel, set_option
 from agate.testcase import AgateTestCase
 from agate.data_types import *
+from agate.exceptions import CastError
 from agate.type_tester import TypeTester
 
 
+class UnseekableFile(six.Iterator):
+    """
+    Wraps a file to behave like a pipe, such as STDIN.
+    """
+    def __init__(self, f):
+        self.f = f
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.f)
+
+    def read(self, size=-1):
+        return self.f.read(size)
+
+    def readline(self):
+        return self.f.readline()
+
+    def tell(self):
+        raise IOError('Illegal seek')
+
+    def close(self):
+        self.f.close()
+
+
+def odd_id(row):
+    return int(row['id']) % 2 == 1
+
+
 class TestFromCSV(AgateTestCase):
     def setUp(self):
         self.rows = (
@@ -55,6 +98,15 @@ class TestFromCSV(AgateTestCase):
 
         self.assertRows(table2, table1.rows)
 
+    def test_from_csv_gzip(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+        table2 = Table.from_csv('examples/test.csv.gz')
+
+        self.assertColumnNames(table2, table1.column_names)
+        self.assertColumnTypes(table2, [Number, Text, Boolean, Date, DateTime, TimeDelta])
+
+        self.assertRows(table2, table1.rows)
+
     def test_from_csv_file_like_object(self):
         table1 = Table(self.rows, self.column_names, self.column_types)
 
@@ -80,6 +132,13 @@ class TestFromCSV(AgateTestCase):
 
         self.assertColumnTypes(table, [Text, Text, Boolean, Date, DateTime, TimeDelta])
 
+    def test_from_csv_type_tester_limit(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+        table2 = Table.from_csv('examples/test.csv', column_types=TypeTester(limit=2))
+
+        self.assertColumnTypes(table2, [Number, Text, Boolean, Date, DateTime, TimeDelta])
+        self.assertRows(table2, table1.rows)
+
     def test_from_csv_no_type_tester(self):
         tester = TypeTester(limit=0)
 
@@ -120,6 +179,27 @@ class TestFromCSV(AgateTestCase):
 
         self.assertRows(table2, table1.rows)
 
+    @unittest.skipIf(six.PY2, 'Unseekable input is fully buffered on Python 2')
+    def test_from_csv_sniff_limit_unseekable(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+
+        with io.open('examples/test_csv_sniff.csv', encoding='utf-8') as f:
+            table2 = Table.from_csv(UnseekableFile(f), sniff_limit=200)
+
+        self.assertColumnNames(table2, table1.column_names)
+        self.assertColumnTypes(table2, [Number, Text, Boolean, Date, DateTime, TimeDelta])
+
+        self.assertRows(table2, table1.rows)
+
+    def test_from_csv_sniff_limit_rewinds(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+
+        with io.open('examples/test_csv_sniff.csv', encoding='utf-8') as f:
+            table2 = Table.from_csv(f, sniff_limit=200)
+
+        self.assertColumnNames(table2, table1.column_names)
+        self.assertRows(table2, table1.rows)
+
     def test_from_csv_sniff_limit_none(self):
         table1 = Table(self.rows, self.column_names, self.column_types)
         table2 = Table.from_csv('examples/test_csv_sniff.csv', sniff_limit=None)
@@ -129,6 +209,45 @@ class TestFromCSV(AgateTestCase):
 
         self.assertRows(table2, table1.rows)
 
+    def test_from_csv_sniff_limit_none_option(self):
+        try:
+            set_option('sniff_limit', 0)
+            table = Table.from_csv('examples/test_csv_sniff.csv', sniff_limit=None)
+        finally:
+            set_option('sniff_limit', 65536)
+
+        self.assertColumnNames(table, ['number|text|boolean|date|datetime|timedelta'])
+
+    @unittest.skipIf(six.PY2, 'Unseekable input is fully buffered on Python 2')
+    def test_from_csv_sniff_limit_none_unseekable(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+
+        with io.open('examples/test_csv_sniff.csv', encoding='utf-8') as f:
+            table2 = Table.from_csv(UnseekableFile(f), sniff_limit=None)
+
+        self.assertColumnNames(table2, table1.column_names)
+        self.assertRows(table2, table1.rows)
+
+    def test_from_csv_sniff_limit_partial_line(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+        table2 = Table.from_csv('examples/test_csv_sniff.csv', sniff_limit=60)
+
+        self.assertColumnNames(table2, table1.column_names)
+        self.assertRows(table2, table1.rows)
+
+    def test_from_csv_sniff_failure(self):
+        table = Table.from_csv('examples/test.csv', sniff_limit=1)
+
+        self.assertColumnNames(table, self.column_names)
+
+    @unittest.skipIf(six.PY2, 'Parallel parsing is only supported on Python 3')
+    def test_from_csv_sniff_limit_none_workers(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+        table2 = Table.from_csv('examples/test_csv_sniff.csv', sniff_limit=None, workers=2)
+
+        self.assertColumnNames(table2, table1.column_names)
+        self.assertRows(table2, table1.rows)
+
     def test_from_csv_skip_lines(self):
         warnings.simplefilter('ignore')
 
@@ -170,3 +289,159 @@ class TestFromCSV(AgateTestCase):
         self.assertColumnTypes(table2, [Number, Text, Boolean, Date, DateTime, TimeDelta])
 
         self.assertRows(table2, table1.rows)
+
+    @unittest.skipIf(six.PY2, 'Parallel parsing is only supported on Python 3')
+    def test_from_csv_workers(self):
+        table1 = Table.from_csv('examples/test.csv')
+        table2 = Table.from_csv('examples/test.csv', workers=2)
+
+        self.assertColumnNames(table2, table1.column_names)
+        self.assertColumnTypes(table2, [Number, Text, Boolean, Date, DateTime, TimeDelta])
+
+        self.assertRows(table2, table1.rows)
+
+    @unittest.skipIf(six.PY2, 'Parallel parsing is only supported on Python 3')
+    def test_from_csv_workers_quoted_newlines(self):
+        table1 = Table.from_csv('examples/test_quoted_newlines.csv', line_numbers=True)
+
+        for workers in (2, 3, 5):
+            table2 = Table.from_csv('examples/test_quoted_newlines.csv', line_numbers=True, workers=workers)
+
+            self.assertColumnNames(table2, table1.column_names)
+            self.assertColumnTypes(table2, [Number, Number, Text, Text])
+
+            self.assertRows(table2, table1.rows)
+
+    @unittest.skipIf(six.PY2, 'Parallel parsing is only supported on Python 3')
+    def test_from_csv_workers_cast_error(self):
+        column_types = [Number(), Text(), Number()]
+
+        with self.assertRaises(CastError) as e1:
+            Table.from_csv('examples/test_quoted_newlines.csv', column_types=column_types)
+
+        with self.assertRaises(CastError) as e2:
+            Table.from_csv('examples/test_quoted_newlines.csv', column_types=column_types, workers=3)
+
+        self.assertIn('Error at row 6 column value.', str(e1.exception))
+        self.assertEqual(str(e1.exception), str(e2.exception))
+
+    @unittest.skipIf(six.PY2, 'Parallel parsing is only supported on Python 3')
+    def test_from_csv_workers_stray_quote(self):
+        table1 = Table.from_csv('examples/test_stray_quote.csv')
+
+        self.assertEqual(len(table1.rows), 100)
+        self.assertColumnTypes(table1, [Number, Text, Number])
+
+        for workers in (2, 3, 5):
+            with patch.object(parallel, 'infer_and_cast', wraps=parallel.infer_and_cast) as infer_and_cast:
+                table2 = Table.from_csv('examples/test_stray_quote.csv', workers=workers)
+
+            # The file is split, but the stray quote moves a boundary into a
+            # quoted field, so it is parsed again serially
+            self.assertTrue(infer_and_cast.called)
+
+            self.assertColumnNames(table2, table1.column_names)
+            self.assertColumnTypes(table2, [Number, Text, Number])
+            self.assertRows(table2, table1.rows)
+            self.assertEqual(len(table2.rows), len(table1.rows))
+
+    @unittest.skipIf(six.PY2, 'Parallel parsing is only supported on Python 3')
+    def test_from_csv_workers_lenient_quoting(self):
+        with io.open('.test.csv', 'w') as f:
+            f.write(u'a,b\n' + u'1,x\n' * 20 + u'2,"y"z\n' + u'3,x\n' * 20)
+
+        try:
+            table1 = Table.from_csv('.test.csv')
+
+            with patch.object(parallel, 'infer_and_cast', wraps=parallel.infer_and_cast) as infer_and_cast:
+                table2 = Table.from_csv('.test.csv', workers=2)
+
+            self.assertTrue(infer_and_cast.called)
+            self.assertRows(table2, table1.rows)
+            self.assertEqual(len(table2.rows), 41)
+
+            with self.assertRaises(CSVError):
+                Table.from_csv('.test.csv', workers=2, strict=True)
+        finally:
+            os.remove('.test.csv')
+
+    def test_from_csv_workers_file_like_object(self):
+        with io.open('examples/test.csv', encoding='utf-8') as f:
+            with self.assertRaises(ValueError):
+                Table.from_csv(f, workers=2)
+
+    def test_from_csv_columns(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+        table2 = Table.from_csv('examples/test.csv', columns=['date', 'number'])
+
+        self.assertColumnNames(table2, ['date', 'number'])
+        self.assertColumnTypes(table2, [Date, Number])
+        self.assertRows(table2, table1.select(['date', 'number']).rows)
+
+    def test_from_csv_columns_indices(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+        table2 = Table.from_csv('examples/test.csv', columns=[1, 'boolean'])
+
+        self.assertColumnNames(table2, ['text', 'boolean'])
+        self.assertColumnTypes(table2, [Text, Boolean])
+        self.assertRows(table2, table1.select(['text', 'boolean']).rows)
+
+    def test_from_csv_columns_no_header(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+        table2 = Table.from_csv('examples/test_no_header.csv', header=False, columns=[0], column_names=self.column_names)
+
+        self.assertColumnNames(table2, ['number'])
+        self.assertRows(table2, table1.select(['number']).rows)
+
+        with self.assertRaises(ValueError):
+            Table.from_csv('examples/test_no_header.csv', header=False, columns=['number'])
+
+    def test_from_csv_columns_does_not_exist(self):
+        with self.assertRaises(ValueError):
+            Table.from_csv('examples/test.csv', columns=['foo'])
+
+    @unittest.skipIf(six.PY2, 'Parallel parsing is only supported on Python 3')
+    def test_from_csv_columns_workers(self):
+        table1 = Table.from_csv('examples/test_quoted_newlines.csv', columns=['value', 'id'])
+        table2 = Table.from_csv('examples/test_quoted_newlines.csv', columns=['value', 'id'], workers=3)
+
+        self.assertColumnNames(table2, ['value', 'id'])
+        self.assertColumnTypes(table2, [Text, Number])
+        self.assertRows(table2, table1.rows)
+
+    def test_from_csv_where(self):
+        table1 = Table(self.rows, self.column_names, self.column_types)
+        table2 = Table.from_csv('examples/test.csv', where=lambda row: row['text'] != 'b')
+
+        self.assertColumnNames(table2, self.column_names)
+        self.assertColumnTypes(table2, [Number, Text, Boolean, Date, DateTime, TimeDelta])
+        self.assertRows(table2, table1.where(lambda row: row['text'] != 'b').rows)
+
+    def test_from_csv_where_columns(self):
+        table = Table.from_csv('examples/test.csv', columns=['number'], where=lambda row: row['boolean'] == 'False')
+
+        self.assertColumnNames(table, ['number'])
+        self.assertRows(table, [[2]])
+
+    def test_from_csv_where_no_header(self):
+        table = Table.from_csv('examples/test_no_header.csv', header=False, where=lambda row: row['b'] == 'a')
+
+        self.assertColumnNames(table, ['a', 'b', 'c', 'd', 'e', 'f'])
+        self.assertEqual(len(table.rows), 1)
+
+    @unittest.skipIf(six.PY2, 'Parallel parsing is only supported on Python 3')
+    def test_from_csv_where_workers(self):
+        table1 = Table.from_csv('examples/test_quoted_newlines.csv', where=odd_id)
+        table2 = Table.from_csv('examples/test_quoted_newlines.csv', where=odd_id, workers=3)
+
+        self.assertColumnTypes(table2, [Number, Text, Text])
+        self.assertRows(table2, table1.rows)
+        self.assertSequenceEqual([row['id'] for row in table2.rows], [1, 3, 5, 7])
+
+    @unittest.skipIf(six.PY2, 'Parallel parsing is only supported on Python 3')
+    def test_from_csv_workers_gzip(self):
+        table1 = Table.from_csv('examples/test.csv')
+        table2 = Table.from_csv('examples/test.csv.gz', workers=2)
+
+        self.assertColumnNames(table2, table1.column_names)
+        self.assertRows(table2, table1.rows)
@@ -1,9 +1,23 @@
 #!/usr/bin/env python
 
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import io
+
+import six
+
 from agate import Table
+from agate.data_types import *
 from agate.testcase import AgateTestCase
 
 
+def is_true(row):
+    return row['boolean'] == 'True'
+
+
 class TestFromFixed(AgateTestCase):
     def test_from_fixed(self):
         table1 = Table.from_csv('examples/testfixed_converted.csv')
@@ -13,3 +27,86 @@ class TestFromFixed(AgateTestCase):
         self.assertColumnTypes(table2, [type(c) for c in table1.column_types])
 
         self.assertRows(table2, table1.rows)
+
+    @unittest.skipIf(six.PY2, 'xz compression is only supported on Python 3')
+    def test_from_fixed_xz(self):
+        table1 = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv')
+        table2 = Table.from_fixed('examples/testfixed.xz', 'examples/testfixed_schema.csv')
+
+        self.assertColumnNames(table2, table1.column_names)
+        self.assertRows(table2, table1.rows)
+
+    def test_from_fixed_columns(self):
+        table1 = Table.from_csv('examples/testfixed_converted.csv')
+        table2 = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv', columns=['date', 0])
+
+        self.assertColumnNames(table2, ['date', 'text'])
+        self.assertRows(table2, table1.select(['date', 'text']).rows)
+
+    def test_from_fixed_columns_column_names(self):
+        column_names = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
+        table = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv', column_names=column_names, columns=['c', 'a'])
+
+        self.assertColumnNames(table, ['c', 'a'])
+        self.assertSequenceEqual(table.rows[0], (40, 'Chicago Reader'))
+
+    def test_from_fixed_where(self):
+        table1 = Table.from_csv('examples/testfixed_converted.csv')
+        table2 = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv', where=lambda row: row['boolean'] == 'True')
+
+        self.assertColumnNames(table2, table1.column_names)
+        self.assertRows(table2, table1.where(lambda row: row['boolean']).rows)
+
+    def test_from_fixed_where_columns(self):
+        table = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv', columns=['text'], where=lambda row: row['integer'] == '63')
+
+        self.assertColumnNames(table, ['text'])
+        self.assertRows(table, [['Chicago Sun-Times']])
+
+    def test_from_fixed_file_like_objects(self):
+        table1 = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv')
+
+        with open('examples/testfixed') as f:
+            with open('examples/testfixed_schema.csv') as schema_f:
+                table2 = Table.from_fixed(f, schema_f)
+
+        self.assertColumnNames(table2, table1.column_names)
+        self.assertRows(table2, table1.rows)
+
+    def test_from_fixed_column_types(self):
+        table1 = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv')
+        table2 = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv', column_types=table1.column_types)
+
+        self.assertColumnTypes(table2, [type(c) for c in table1.column_types])
+        self.assertRows(table2, table1.rows)
+
+    @unittest.skipIf(six.PY2, 'Parallel fixed-width parsing is only supported on Python 3')
+    def test_from_fixed_workers(self):
+        table1 = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv')
+
+        for workers in (2, 3, 5):
+            table2 = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv', workers=workers)
+
+            self.assertColumnNames(table2, table1.column_names)
+            self.assertColumnTypes(table2, [type(c) for c in table1.column_types])
+            self.assertRows(table2, table1.rows)
+
+    @unittest.skipIf(six.PY2, 'Parallel fixed-width parsing is only supported on Python 3')
+    def test_from_fixed_workers_columns_where(self):
+        table1 = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv', columns=['date', 'text'], where=is_true)
+        table2 = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv', columns=['date', 'text'], where=is_true, workers=2)
+
+        self.assertColumnNames(table2, ['date', 'text'])
+        self.assertRows(table2, table1.rows)
+
+    @unittest.skipIf(six.PY2, 'Parallel fixed-width parsing is only supported on Python 3')
+    def test_from_fixed_workers_column_types(self):
+        table1 = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv')
+        table2 = Table.from_fixed('examples/testfixed', 'examples/testfixed_schema.csv', column_types={'integer': Text()}, workers=2)
+
+        self.assertColumnTypes(table2, [type(c) if n != 'integer' else Text for n, c in zip(table1.column_names, table1.column_types)])
+
+    def test_from_fixed_workers_file_like_object(self):
+        with io.open('examples/testfixed', encoding='utf-8') as f:
+            with self.assertRaises(ValueError):
+                Table.from_fixed(f, 'examples/testfixed_schema.csv', workers=2)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+import io
+import os
+
+import six
+
+from agate import Table
+from agate.aggregations import Sum
+from agate.data_types import *
+from agate.testcase import AgateTestCase
+from agate.type_tester import TypeTester
+
+
+class TestIterCSV(AgateTestCase):
+    def setUp(self):
+        self.rows = (
+            (1, 'a', True, '11/4/2015', '11/4/2015 12:22 PM', '4:15'),
+            (2, u'👍', False, '11/5/2015', '11/4/2015 12:45 PM', '6:18'),
+            (None, 'b', None, None, None, None)
+        )
+
+        self.column_names = [
+            'number', 'text', 'boolean', 'date', 'datetime', 'timedelta'
+        ]
+
+        self.column_types = [
+            Number(), Text(), Boolean(), Date(), DateTime(), TimeDelta()
+        ]
+
+    def test_iter_csv(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+        chunks = list(Table.iter_csv('examples/test.csv', chunk_size=2))
+
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+
+        for chunk in chunks:
+            self.assertColumnNames(chunk, self.column_names)
+            self.assertColumnTypes(chunk, [Number, Text, Boolean, Date, DateTime, TimeDelta])
+
+        self.assertRows(chunks[0], table.rows[:2])
+        self.assertRows(chunks[1], table.rows[2:])
+
+    def test_iter_csv_types_from_first_chunk(self):
+        chunks = list(Table.iter_csv('examples/test.csv', chunk_size=2))
+
+        # The last row is all nulls, but keeps the types of the first chunk
+        self.assertSequenceEqual(chunks[1].column_types, chunks[0].column_types)
+        self.assertColumnTypes(chunks[1], [Number, Text, Boolean, Date, DateTime, TimeDelta])
+
+    def test_iter_csv_column_types(self):
+        column_types = [Text()] * 6
+        chunks = list(Table.iter_csv('examples/test.csv', chunk_size=2, column_types=column_types))
+
+        for chunk in chunks:
+            self.assertColumnTypes(chunk, [Text] * 6)
+
+    def test_iter_csv_type_tester(self):
+        tester = TypeTester(force={
+            'number': Text()
+        })
+
+        chunks = list(Table.iter_csv('examples/test.csv', chunk_size=2, column_types=tester))
+
+        for chunk in chunks:
+            self.assertColumnTypes(chunk, [Text, Text, Boolean, Date, DateTime, TimeDelta])
+
+    def test_iter_csv_no_header_columns(self):
+        chunks = list(Table.iter_csv('examples/test_no_header.csv', chunk_size=2, column_names=self.column_names, header=False))
+
+        self.assertEqual(sum(len(chunk) for chunk in chunks), 3)
+
+        for chunk in chunks:
+            self.assertColumnNames(chunk, self.column_names)
+
+    def test_iter_csv_merge(self):
+        table = Table.from_csv('examples/test.csv')
+        merged = Table.merge(list(Table.iter_csv('examples/test.csv', chunk_size=2)))
+
+        self.assertColumnNames(merged, table.column_names)
+        self.assertRows(merged, table.rows)
+
+    def test_iter_csv_aggregate(self):
+        chunks = Table.iter_csv('examples/test.csv', chunk_size=2)
+        total = sum(chunk.aggregate(Sum('number')) for chunk in chunks)
+
+        self.assertEqual(total, 3)
+
+    def test_iter_csv_file_like_object(self):
+        if six.PY2:
+            f = open('examples/test.csv', 'rb')
+        else:
+            f = io.open('examples/test.csv', encoding='utf-8')
+
+        chunks = list(Table.iter_csv(f, chunk_size=10))
+        f.close()
+
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(len(chunks[0]), 3)
+
+    def test_iter_csv_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            list(Table.iter_csv('examples/test.csv', chunk_size=0))
+
+    def test_iter_csv_empty_file(self):
+        with open('.test.csv', 'w'):
+            pass
+
+        try:
+            chunks = list(Table.iter_csv('.test.csv', chunk_size=2))
+        finally:
+            os.remove('.test.csv')
+
+        self.assertEqual(chunks, [])
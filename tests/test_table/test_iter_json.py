@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+import io
+
+from agate import Table
+from agate.aggregations import Sum
+from agate.data_types import *
+from agate.testcase import AgateTestCase
+from agate.type_tester import TypeTester
+
+
+class TestIterJSON(AgateTestCase):
+    def setUp(self):
+        self.rows = (
+            (1, 'a', True, '11/4/2015', '11/4/2015 12:22 PM', '4:15'),
+            (2, u'👍', False, '11/5/2015', '11/4/2015 12:45 PM', '6:18'),
+            (None, 'b', None, None, None, None)
+        )
+
+        self.column_names = [
+            'number', 'text', 'boolean', 'date', 'datetime', 'timedelta'
+        ]
+
+        self.column_types = [
+            Number(), Text(), Boolean(), Date(), DateTime(), TimeDelta()
+        ]
+
+    def test_iter_json(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+        chunks = list(Table.iter_json('examples/test_newline.json', chunk_size=2))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+
+        for chunk in chunks:
+            self.assertColumnNames(chunk, self.column_names)
+            self.assertColumnTypes(chunk, [Number, Text, Boolean, Date, DateTime, TimeDelta])
+
+        self.assertRows(chunks[0], table.rows[:2])
+        self.assertRows(chunks[1], table.rows[2:])
+
+    def test_iter_json_new_columns(self):
+        f = io.StringIO(u'{"a": 1}\n{"a": 2}\n\n{"b": "x", "a": 3}\n{"c": true}\n')
+        chunks = list(Table.iter_json(f, chunk_size=2))
+
+        self.assertColumnNames(chunks[0], ['a'])
+        self.assertColumnTypes(chunks[0], [Number])
+        self.assertRows(chunks[0], [[1], [2]])
+
+        self.assertColumnNames(chunks[1], ['a', 'b', 'c'])
+        self.assertColumnTypes(chunks[1], [Number, Text, Boolean])
+        self.assertRows(chunks[1], [
+            [3, 'x', None],
+            [None, None, True]
+        ])
+
+    def test_iter_json_late_column_types(self):
+        data = u'{"a": 1}\n{"a": 2}\n{"a": 3, "b": "4"}\n'
+
+        for column_types in ({'b': Text()}, [Number(), Text()]):
+            chunks = list(Table.iter_json(io.StringIO(data), chunk_size=2, column_types=column_types))
+
+            self.assertColumnNames(chunks[0], ['a'])
+            self.assertColumnTypes(chunks[0], [Number])
+
+            self.assertColumnNames(chunks[1], ['a', 'b'])
+            self.assertColumnTypes(chunks[1], [Number, Text])
+            self.assertRows(chunks[1], [[3, '4']])
+
+            table = Table.from_json(io.StringIO(data), newline=True, column_types=column_types)
+
+            self.assertColumnTypes(table, [Number, Text])
+
+    def test_iter_json_type_tester(self):
+        tester = TypeTester(force={
+            'number': Text()
+        })
+
+        chunks = list(Table.iter_json('examples/test_newline.json', chunk_size=2, column_types=tester))
+
+        for chunk in chunks:
+            self.assertColumnTypes(chunk, [Text, Text, Boolean, Date, DateTime, TimeDelta])
+
+    def test_iter_json_columns_where(self):
+        chunks = list(Table.iter_json('examples/test_newline.json', chunk_size=2, columns=['text', 'number'], where=lambda row: row['boolean'] is not None))
+
+        self.assertEqual(len(chunks), 1)
+        self.assertColumnNames(chunks[0], ['text', 'number'])
+        self.assertRows(chunks[0], [
+            ['a', 1],
+            [u'👍', 2]
+        ])
+
+    def test_iter_json_aggregate(self):
+        chunks = Table.iter_json('examples/test_newline.json', chunk_size=2)
+        total = sum(chunk.aggregate(Sum('number')) for chunk in chunks)
+
+        self.assertEqual(total, 3)
+
+    def test_iter_json_invalid_columns(self):
+        with self.assertRaises(ValueError):
+            list(Table.iter_json('examples/test_newline.json', columns=[0]))
+
+    def test_iter_json_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            list(Table.iter_json('examples/test_newline.json', chunk_size=0))
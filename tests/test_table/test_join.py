@@ -1,8 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf8 -*-
 
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import pickle
+
+import six
+
 from agate import Table
 from agate.data_types import *
+from agate.rows import JoinedRow, Row
+from agate.table.join import _is_sorted
 from agate.testcase import AgateTestCase
 
 
@@ -326,3 +337,209 @@ class TestJoin(AgateTestCase):
             (None, 2, 'c', None, 2, 'c'),
             (7, 9, 'z', None, None, None)
         ])
+
+    def test_full_outer_multiple_columns(self):
+        right_rows = (
+            (1, 4, 'a'),
+            (2, 3, 'x'),
+            (None, 2, 'c')
+        )
+
+        right = Table(right_rows, self.right_column_names, self.column_types)
+
+        new_table = self.left.join(right, ['two', 'three'], ['five', 'six'], full_outer=True)
+
+        self.assertColumnNames(new_table, ['one', 'two', 'three', 'four', 'five', 'six'])
+        self.assertRows(new_table, [
+            (1, 4, 'a', 1, 4, 'a'),
+            (2, 3, 'b', None, None, None),
+            (None, 2, 'c', None, 2, 'c'),
+            (None, None, None, 2, 3, 'x')
+        ])
+
+    def test_join_smaller_left_order(self):
+        left_rows = (
+            (2, 3, 'b'),
+            (1, 4, 'a'),
+            (5, 0, 'z')
+        )
+
+        right_rows = (
+            (1, 1, 'a'),
+            (2, 2, 'b'),
+            (1, 3, 'c'),
+            (3, 4, 'd'),
+            (2, 5, 'e')
+        )
+
+        left = Table(left_rows, self.left_column_names, self.column_types)
+        right = Table(right_rows, self.right_column_names, self.column_types)
+
+        new_table = left.join(right, 'one', 'four', full_outer=True)
+
+        self.assertRows(new_table, [
+            (2, 3, 'b', 2, 2, 'b'),
+            (2, 3, 'b', 2, 5, 'e'),
+            (1, 4, 'a', 1, 1, 'a'),
+            (1, 4, 'a', 1, 3, 'c'),
+            (5, 0, 'z', None, None, None),
+            (None, None, None, 3, 4, 'd')
+        ])
+
+    def test_join_column_index_same_values(self):
+        right_rows = (
+            (1, 'a', 1),
+            (2, 'b', 2)
+        )
+
+        right = Table(right_rows, ['four', 'five', 'six'], [self.number_type, self.text_type, self.number_type])
+
+        new_table = self.left.join(right, 'one', 2)
+
+        self.assertColumnNames(new_table, ['one', 'two', 'three', 'four', 'five'])
+        self.assertRows(new_table, [
+            (1, 4, 'a', 1, 'a'),
+            (2, 3, 'b', 2, 'b'),
+            (None, 2, 'c', None, None)
+        ])
+
+    def test_join_algorithms(self):
+        left_rows = (
+            (3, 1, 'a'),
+            (1, 2, 'b'),
+            (None, 3, 'c'),
+            (1, 4, 'd'),
+            (5, 5, 'e')
+        )
+
+        right_rows = (
+            (1, 1, 'v'),
+            (None, 2, 'w'),
+            (4, 3, 'x'),
+            (1, 4, 'y'),
+            (3, 5, 'z')
+        )
+
+        left = Table(left_rows, self.left_column_names, self.column_types)
+        right = Table(right_rows, self.right_column_names, self.column_types)
+
+        for kwargs in ({}, {'inner': True}, {'full_outer': True}, {'columns': ['six']}):
+            expected = left.join(right, 'one', 'four', algorithm='hash', **kwargs)
+
+            for algorithm in ('merge', 'auto'):
+                new_table = left.join(right, 'one', 'four', algorithm=algorithm, **kwargs)
+
+                self.assertColumnNames(new_table, expected.column_names)
+                self.assertRows(new_table, expected.rows)
+
+            new_table = left.join(right, 'one', 'four', algorithm='merge', merge_buffer=2, **kwargs)
+
+            self.assertRows(new_table, expected.rows)
+
+        self.assertRows(left.join(right, 'one', 'four', algorithm='merge'), [
+            (3, 1, 'a', 5, 'z'),
+            (1, 2, 'b', 1, 'v'),
+            (1, 2, 'b', 4, 'y'),
+            (None, 3, 'c', 2, 'w'),
+            (1, 4, 'd', 1, 'v'),
+            (1, 4, 'd', 4, 'y'),
+            (5, 5, 'e', None, None)
+        ])
+
+    def test_join_merge_sorted(self):
+        new_table = self.left.join(self.right, ['one', 'two'], ['four', 'five'], algorithm='merge')
+
+        self.assertRows(new_table, [
+            (1, 4, 'a', 'a'),
+            (2, 3, 'b', 'b'),
+            (None, 2, 'c', 'c')
+        ])
+
+    def test_join_merge_require_match(self):
+        with self.assertRaises(ValueError):
+            self.left.join(self.right, 'one', 'five', algorithm='merge', require_match=True)
+
+    def test_join_is_sorted_nulls(self):
+        self.assertTrue(_is_sorted([1, 2, 2, None, None]))
+        self.assertFalse(_is_sorted([None, 1, 2]))
+        self.assertFalse(_is_sorted([2, 1, None]))
+        self.assertTrue(_is_sorted([(1, 2), (1, None), (2, 1)]))
+        self.assertFalse(_is_sorted([(1, None), (1, 2)]))
+        self.assertFalse(_is_sorted([1, 'a']))
+
+    def test_join_invalid_algorithm(self):
+        with self.assertRaises(ValueError):
+            self.left.join(self.right, 'one', 'four', algorithm='nested_loop')
+
+    @unittest.skipIf(six.PY2, 'Parallel joins are only tested on Python 3')
+    def test_join_workers(self):
+        left_rows = [(i % 7, i, 'a') for i in range(50)] + [(None, 50, 'b')]
+        right_rows = [(i % 11, i, 'c') for i in range(40)] + [(None, 40, 'd')]
+
+        left = Table(left_rows, self.left_column_names, self.column_types)
+        right = Table(right_rows, self.right_column_names, self.column_types)
+
+        for kwargs in ({}, {'inner': True}, {'full_outer': True}):
+            expected = left.join(right, 'one', 'four', **kwargs)
+            new_table = left.join(right, 'one', 'four', workers=3, **kwargs)
+
+            self.assertColumnNames(new_table, expected.column_names)
+            self.assertRows(new_table, expected.rows)
+
+        expected = left.join(right, ['one', 'three'], ['four', 'six'], full_outer=True)
+        new_table = left.join(right, ['one', 'three'], ['four', 'six'], full_outer=True, workers=2)
+
+        self.assertRows(new_table, expected.rows)
+
+    def test_join_workers_merge(self):
+        with self.assertRaises(ValueError):
+            self.left.join(self.right, 'one', 'four', algorithm='merge', workers=2)
+
+    def test_join_rows_lazy(self):
+        new_table = self.left.join(self.right, 'one', 'four', full_outer=True)
+
+        for row in new_table.rows:
+            self.assertIsInstance(row, JoinedRow)
+
+        row = new_table.rows[0]
+
+        self.assertIs(row._left, self.left.rows[0])
+        self.assertIs(row._right, self.right.rows[0])
+        self.assertEqual(len(row), 6)
+        self.assertEqual(row[-1], 'a')
+        self.assertEqual(row['five'], 4)
+        self.assertSequenceEqual(row[1:4], (4, 'a', 1))
+
+        with self.assertRaises(IndexError):
+            row[6]
+
+    def test_join_rows_lazy_unmatched(self):
+        new_table = self.left.join(self.right, 'one', 'five', full_outer=True)
+
+        self.assertRows(new_table, [
+            (1, 4, 'a', None, None, None),
+            (2, 3, 'b', None, 2, 'c'),
+            (None, 2, 'c', None, None, None),
+            (None, None, None, 1, 4, 'a'),
+            (None, None, None, 2, 3, 'b')
+        ])
+
+    def test_join_rows_pickle(self):
+        new_table = self.left.join(self.right, 'one', 'four')
+
+        row = pickle.loads(pickle.dumps(new_table.rows[0]))
+
+        self.assertIs(type(row), Row)
+        self.assertSequenceEqual(row, (1, 4, 'a', 4, 'a'))
+        self.assertEqual(row['six'], 'a')
+
+    def test_join_joined_table(self):
+        joined = self.left.join(self.right, 'one', 'four')
+        new_table = joined.join(self.left, 'five', 'two', columns=['three'])
+
+        self.assertColumnNames(new_table, ['one', 'two', 'three', 'five', 'six', 'three2'])
+        self.assertRows(new_table, [
+            (1, 4, 'a', 4, 'a', 'a'),
+            (2, 3, 'b', 3, 'b', 'b'),
+            (None, 2, 'c', 2, 'c', 'c')
+        ])
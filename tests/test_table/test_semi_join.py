@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+from agate import Table
+from agate.data_types import *
+from agate.testcase import AgateTestCase
+
+
+class TestSemiJoin(AgateTestCase):
+    def setUp(self):
+        self.left_rows = (
+            (1, 4, 'a'),
+            (2, 3, 'b'),
+            (None, 2, 'c'),
+            (3, 1, 'd')
+        )
+
+        self.right_rows = (
+            (1, 'a'),
+            (1, 'a'),
+            (3, 'x'),
+            (5, 'y')
+        )
+
+        self.number_type = Number()
+        self.text_type = Text()
+
+        self.left = Table(self.left_rows, ['one', 'two', 'three'], [self.number_type, self.number_type, self.text_type], row_names='three')
+        self.right = Table(self.right_rows, ['four', 'five'], [self.number_type, self.text_type])
+
+    def test_semi_join(self):
+        new_table = self.left.semi_join(self.right, 'one', 'four')
+
+        self.assertIsNot(new_table, self.left)
+        self.assertColumnNames(new_table, ['one', 'two', 'three'])
+        self.assertColumnTypes(new_table, [Number, Number, Text])
+        self.assertRows(new_table, [
+            self.left.rows[0],
+            self.left.rows[3]
+        ])
+        self.assertSequenceEqual(new_table.row_names, ('a', 'd'))
+
+        # Rows are shared, not copied
+        self.assertIs(new_table.rows[0], self.left.rows[0])
+
+    def test_semi_join_multiple_columns(self):
+        new_table = self.left.semi_join(self.right, ['one', 'three'], ['four', 'five'])
+
+        self.assertRows(new_table, [self.left.rows[0]])
+
+    def test_semi_join_func(self):
+        new_table = self.left.semi_join(self.right, lambda row: row['three'], 'five')
+
+        self.assertRows(new_table, [self.left.rows[0]])
+
+    def test_semi_join_same_key(self):
+        right = Table([(2,), (None,)], ['one'], [self.number_type])
+        new_table = self.left.semi_join(right, 'one')
+
+        self.assertRows(new_table, [
+            self.left.rows[1],
+            self.left.rows[2]
+        ])
+
+    def test_anti_join(self):
+        new_table = self.left.anti_join(self.right, 'one', 'four')
+
+        self.assertIsNot(new_table, self.left)
+        self.assertColumnNames(new_table, ['one', 'two', 'three'])
+        self.assertRows(new_table, [
+            self.left.rows[1],
+            self.left.rows[2]
+        ])
+        self.assertSequenceEqual(new_table.row_names, ('b', 'c'))
+
+    def test_anti_join_multiple_columns(self):
+        new_table = self.left.anti_join(self.right, ['one', 'three'], ['four', 'five'])
+
+        self.assertRows(new_table, self.left.rows[1:])
+
+    def test_semi_join_anti_join_complement(self):
+        semi = self.left.semi_join(self.right, 'one', 'four')
+        anti = self.left.anti_join(self.right, 'one', 'four')
+
+        self.assertEqual(len(semi.rows) + len(anti.rows), len(self.left.rows))
+
+    def test_semi_join_key_error(self):
+        with self.assertRaises(KeyError):
+            self.left.semi_join(self.right, 'one', 'seven')
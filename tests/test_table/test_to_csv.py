@@ -3,6 +3,7 @@
 
 import six
 
+import gzip
 import os
 import sys
 
@@ -42,6 +43,55 @@ class TestToCSV(AgateTestCase):
 
         os.remove('.test.csv')
 
+    def test_to_csv_gzip(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+
+        table.to_csv('.test.csv.gz')
+
+        with gzip.open('.test.csv.gz') as f:
+            contents1 = f.read()
+
+        with open('examples/test.csv', 'rb') as f:
+            contents2 = f.read()
+
+        self.assertEqual(contents1, contents2)
+
+        table2 = Table.from_csv('.test.csv.gz')
+        self.assertRows(table2, table.rows)
+
+        os.remove('.test.csv.gz')
+
+    def test_to_csv_mac_line_endings(self):
+        table = Table([(1, u'a\rb'), (2, None)], ['number', 'text'], [Number(), Text()])
+
+        output = six.StringIO()
+        table.to_csv(output)
+
+        self.assertEqual(output.getvalue(), 'number,text\n1,"a\nb"\n2,\n')
+
+    def test_to_csv_line_numbers(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+
+        output = six.StringIO()
+        table.to_csv(output, line_numbers=True)
+
+        lines = output.getvalue().split('\n')
+
+        self.assertEqual(lines[0], 'line_number,number,text,boolean,date,datetime,timedelta')
+        self.assertEqual(lines[1], '1,1,a,True,2015-11-04,2015-11-04T12:22:00,0:04:15')
+
+    def test_to_csv_batches(self):
+        rows = [(i, six.text_type(i)) for i in range(25001)]
+        table = Table(rows, ['number', 'text'], [Number(), Text()])
+
+        output = six.StringIO()
+        table.to_csv(output)
+
+        lines = output.getvalue().splitlines()
+
+        self.assertEqual(len(lines), 25002)
+        self.assertEqual(lines[-1], '25000,25000')
+
     def test_to_csv_file_like_object(self):
         table = Table(self.rows, self.column_names, self.column_types)
 
@@ -1,10 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf8 -*-
 
+import bz2
 import os
 import sys
 import six
 import json
+from collections import OrderedDict
 
 from agate import Table
 from agate.testcase import AgateTestCase
@@ -79,6 +81,46 @@ class TestJSON(AgateTestCase):
 
         self.assertEqual(js1, js2)
 
+    def test_to_json_formatting(self):
+        rows = [(i, six.text_type(i % 7)) for i in range(2500)]
+        table = Table(rows, ['number', 'text'], [Number(), Text()])
+
+        expected = [OrderedDict([('number', float(i)), ('text', t)]) for i, t in rows]
+        keyed = OrderedDict((six.text_type(i), row) for i, row in zip(range(2500), expected))
+
+        for kwargs in [{}, {'indent': 4}, {'indent': 0}, {'separators': (',', ':')}, {'sort_keys': True, 'indent': 2}]:
+            json_kwargs = {'ensure_ascii': False}
+            json_kwargs.update(kwargs)
+
+            output = six.StringIO()
+            table.to_json(output, **kwargs)
+
+            self.assertEqual(output.getvalue(), json.dumps(expected, **json_kwargs))
+
+            output = six.StringIO()
+            table.to_json(output, key=lambda row: six.text_type(row['number']), **kwargs)
+
+            self.assertEqual(output.getvalue(), json.dumps(keyed, **json_kwargs))
+
+    def test_to_json_empty(self):
+        table = Table([], self.column_names, self.column_types)
+
+        output = six.StringIO()
+        table.to_json(output, indent=4)
+
+        self.assertEqual(output.getvalue(), '[]')
+
+    def test_to_json_key_not_unique(self):
+        table = Table(self.rows + self.rows, self.column_names, self.column_types)
+
+        output = six.StringIO()
+
+        with self.assertRaises(ValueError):
+            table.to_json(output, key='text')
+
+        # Nothing is written
+        self.assertEqual(output.getvalue(), '')
+
     def test_to_json_newline_delimited(self):
         table = Table(self.rows, self.column_names, self.column_types)
 
@@ -123,6 +165,24 @@ class TestJSON(AgateTestCase):
 
         os.remove('.test.json')
 
+    def test_to_json_bz2(self):
+        table = Table(self.rows, self.column_names, self.column_types)
+
+        table.to_json('.test.json.bz2', newline=True)
+
+        with bz2.BZ2File('.test.json.bz2') as f1:
+            js1 = [json.loads(line.decode('utf-8')) for line in f1]
+
+        with open('examples/test.json') as f2:
+            js2 = json.load(f2)
+
+        self.assertEqual(js1, js2)
+
+        table2 = Table.from_json('.test.json.bz2', newline=True)
+        self.assertRows(table2, table.rows)
+
+        os.remove('.test.json.bz2')
+
     def test_to_json_make_dir(self):
         table = Table(self.rows, self.column_names, self.column_types)
 
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf8 -*-
+
+import gzip
+import io
+import os
+
+import six
+
+from agate import Table, TableWriter
+from agate.data_types import *
+from agate.testcase import AgateTestCase
+
+
+class TestTableWriter(AgateTestCase):
+    def setUp(self):
+        self.table = Table.from_csv('examples/test.csv')
+
+    def tearDown(self):
+        for path in ('.test.csv', '.test.csv.gz', '.test.json', 'newdir/test.csv'):
+            if os.path.exists(path):
+                os.remove(path)
+
+        if os.path.exists('newdir'):
+            os.rmdir('newdir')
+
+    def test_write_csv_chunks(self):
+        with TableWriter('.test.csv') as writer:
+            for chunk in Table.iter_csv('examples/test.csv', chunk_size=2, column_types=self.table.column_types):
+                writer.write(chunk)
+
+        with io.open('.test.csv', encoding='utf-8') as f:
+            contents1 = f.read()
+
+        with io.open('examples/test.csv', encoding='utf-8') as f:
+            contents2 = f.read()
+
+        self.assertEqual(contents1, contents2)
+
+    def test_write_json(self):
+        with TableWriter('.test.json') as writer:
+            writer.write(self.table.limit(1))
+            writer.write(self.table.limit(1, 3))
+
+        output = six.StringIO()
+        self.table.to_json(output, newline=True)
+
+        with io.open('.test.json', encoding='utf-8') as f:
+            self.assertEqual(f.read(), output.getvalue())
+
+    def test_write_rows(self):
+        column_names = ['number', 'text']
+        column_types = [Number(), Text()]
+
+        output = six.StringIO()
+
+        with TableWriter(output, column_names, column_types) as writer:
+            writer.write([('1', 'a')])
+            writer.write([(2, 'b\rc'), (None, None)])
+
+        self.assertEqual(output.getvalue(), 'number,text\n1,a\n2,"b\nc"\n,\n')
+
+        # File-like objects are left open
+        self.assertFalse(output.closed)
+
+    def test_write_header_only(self):
+        output = six.StringIO()
+
+        with TableWriter(output, ['a', 'b'], [Number(), Text()]):
+            pass
+
+        self.assertEqual(output.getvalue(), 'a,b\n')
+
+    def test_write_format_json(self):
+        output = six.StringIO()
+
+        with TableWriter(output, ['a'], [Number()], format='json') as writer:
+            writer.write([(1,), (None,)])
+
+        self.assertEqual(output.getvalue(), '{"a": 1.0}\n{"a": null}\n')
+
+    def test_write_gzip(self):
+        with TableWriter('.test.csv.gz') as writer:
+            writer.write(self.table)
+
+        with gzip.open('.test.csv.gz') as f:
+            contents1 = f.read()
+
+        with io.open('examples/test.csv', 'rb') as f:
+            contents2 = f.read()
+
+        self.assertEqual(contents1, contents2)
+
+    def test_write_make_dir(self):
+        with TableWriter('newdir/test.csv') as writer:
+            writer.write(self.table)
+
+        self.assertTrue(os.path.exists('newdir/test.csv'))
+
+    def test_write_mismatched_columns(self):
+        output = six.StringIO()
+
+        with TableWriter(output) as writer:
+            writer.write(self.table)
+
+            with self.assertRaises(ValueError):
+                writer.write(self.table.select(['number']))
+
+    def test_write_mismatched_column_types(self):
+        output = six.StringIO()
+        column_types = [Text() for column_type in self.table.column_types]
+
+        with TableWriter(output) as writer:
+            writer.write(self.table)
+
+            with self.assertRaises(ValueError):
+                writer.write(Table(self.table.rows, self.table.column_names, column_types))
+
+    def test_write_rows_without_columns(self):
+        with TableWriter(six.StringIO()) as writer:
+            with self.assertRaises(ValueError):
+                writer.write([(1, 2)])
+
+    def test_write_closed(self):
+        writer = TableWriter(six.StringIO())
+        writer.close()
+
+        with self.assertRaises(ValueError):
+            writer.write(self.table)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            TableWriter(six.StringIO(), format='xml')
+
+        with self.assertRaises(ValueError):
+            TableWriter(six.StringIO(), column_names=['a'])
@@ -10,7 +10,19 @@ except ImportError:
 import shutil
 import json
 
-from agate import Table, TableSet
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+import six
+
+from agate import Table, TableSet, parallel
 from agate.aggregations import *
 from agate.data_types import *
 from agate.computations import Formula
@@ -97,6 +109,52 @@ class TestTableSet(AgateTestCase):
             self.assertSequenceEqual(tableset1[name].rows[1], tableset2[name].rows[1])
             self.assertSequenceEqual(tableset1[name].rows[2], tableset2[name].rows[2])
 
+    @unittest.skipIf(six.PY2, 'Parallel loading is only tested on Python 3')
+    def test_from_csv_workers(self):
+        tableset1 = TableSet.from_csv('examples/tableset', self.column_names)
+        # Workers send back values rather than pickled tables
+        with patch.object(Table, '__reduce_ex__', side_effect=AssertionError('Table was pickled')):
+            tableset2 = TableSet.from_csv('examples/tableset', self.column_names, row_names='letter', workers=2)
+
+        self.assertSequenceEqual(tableset1.keys(), tableset2.keys())
+
+        for name in ['table1', 'table2', 'table3']:
+            self.assertColumnTypes(tableset2[name], [Text, Number])
+            self.assertRows(tableset2[name], tableset1[name].rows)
+            self.assertSequenceEqual(tableset2[name].row_names, tableset1[name].columns['letter'].values())
+
+    def test_from_csv_lazy(self):
+        tableset1 = TableSet.from_csv('examples/tableset', self.column_names)
+        tableset2 = TableSet.from_csv('examples/tableset', self.column_names, lazy=True)
+
+        self.assertSequenceEqual(tableset1.keys(), tableset2.keys())
+        self.assertSequenceEqual(tableset1.column_names, tableset2.column_names)
+        self.assertEqual(len(tableset2), 3)
+
+        # Only the first table has been loaded
+        self.assertEqual(len([t for t in tableset2._values._tables if t is not None]), 1)
+
+        self.assertRows(tableset2['table2'], tableset1['table2'].rows)
+        self.assertEqual(len([t for t in tableset2._values._tables if t is not None]), 2)
+
+        for name in ['table1', 'table2', 'table3']:
+            self.assertRows(tableset2[name], tableset1[name].rows)
+
+        self.assertIs(tableset2['table3'], tableset2['table3'])
+
+        with self.assertRaises(KeyError):
+            tableset2['table4']
+
+    def test_from_csv_lazy_column_types_not_equal(self):
+        tableset = TableSet.from_csv('examples/tableset/type_error', lazy=True)
+
+        with self.assertRaises(ValueError):
+            list(tableset)
+
+    def test_from_csv_lazy_workers(self):
+        with self.assertRaises(ValueError):
+            TableSet.from_csv('examples/tableset', lazy=True, workers=2)
+
     def test_tableset_from_csv_invalid_dir(self):
         with self.assertRaises(IOError):
             TableSet.from_csv('quack')
@@ -121,6 +179,51 @@ class TestTableSet(AgateTestCase):
 
         shutil.rmtree('.test-tableset')
 
+    @unittest.skipIf(six.PY2, 'Parallel export is only tested on Python 3')
+    def test_to_csv_workers(self):
+        tableset = TableSet(self.tables.values(), self.tables.keys())
+
+        times = tableset.to_csv('.test-tableset', workers=2)
+
+        self.assertSequenceEqual(list(times.keys()), ['table1', 'table2', 'table3'])
+
+        for seconds in times.values():
+            self.assertGreaterEqual(seconds, 0)
+
+        for name in ['table1', 'table2', 'table3']:
+            with open('.test-tableset/%s.csv' % name) as f:
+                contents1 = f.read()
+
+            with open('examples/tableset/%s.csv' % name) as f:
+                contents2 = f.read()
+
+            self.assertEqual(contents1, contents2)
+
+        shutil.rmtree('.test-tableset')
+
+    @unittest.skipIf(six.PY2, 'Parallel export is only tested on Python 3')
+    def test_to_csv_workers_not_pickled(self):
+        tableset = TableSet(self.tables.values(), self.tables.keys())
+
+        with patch.object(Table, '__reduce_ex__', side_effect=AssertionError('Table was pickled')):
+            tableset.to_csv('.test-tableset', workers=2)
+
+            with patch.object(parallel, '_fork_context', return_value=None):
+                tableset.to_csv('.test-tableset-threads', workers=2)
+
+        for name in ['table1', 'table2', 'table3']:
+            for path in ['.test-tableset', '.test-tableset-threads']:
+                with open('%s/%s.csv' % (path, name)) as f:
+                    contents1 = f.read()
+
+                with open('examples/tableset/%s.csv' % name) as f:
+                    contents2 = f.read()
+
+                self.assertEqual(contents1, contents2)
+
+        shutil.rmtree('.test-tableset')
+        shutil.rmtree('.test-tableset-threads')
+
     def test_from_json_dir(self):
         tableset1 = TableSet(self.tables.values(), self.tables.keys())
         tableset2 = TableSet.from_json('examples/tableset')
@@ -180,6 +283,25 @@ class TestTableSet(AgateTestCase):
 
         shutil.rmtree('.test-tableset')
 
+    @unittest.skipIf(six.PY2, 'Parallel export is only tested on Python 3')
+    def test_to_json_workers(self):
+        tableset = TableSet(self.tables.values(), self.tables.keys())
+
+        times = tableset.to_json('.test-tableset', workers=2)
+
+        self.assertSequenceEqual(list(times.keys()), ['table1', 'table2', 'table3'])
+
+        for name in ['table1', 'table2', 'table3']:
+            with open('.test-tableset/%s.json' % name) as f:
+                contents1 = json.load(f)
+
+            with open('examples/tableset/%s.json' % name) as f:
+                contents2 = json.load(f)
+
+            self.assertEqual(contents1, contents2)
+
+        shutil.rmtree('.test-tableset')
+
     def test_to_nested_json(self):
         tableset = TableSet(self.tables.values(), self.tables.keys())
 
@@ -200,6 +322,21 @@ class TestTableSet(AgateTestCase):
 
         shutil.rmtree('.test-tableset')
 
+    def test_to_nested_json_formatting(self):
+        tableset = TableSet(self.tables.values(), self.tables.keys())
+
+        with open('examples/test_tableset.json') as f:
+            contents = json.load(f, object_pairs_hook=OrderedDict, parse_int=float)
+
+        for kwargs in [{}, {'indent': 4}, {'indent': 0}, {'separators': (',', ':')}, {'sort_keys': True, 'indent': 2}]:
+            output = StringIO()
+            tableset.to_json(output, nested=True, **kwargs)
+
+            json_kwargs = {'ensure_ascii': False}
+            json_kwargs.update(kwargs)
+
+            self.assertEqual(output.getvalue(), json.dumps(contents, **json_kwargs))
+
     def test_get_column_types(self):
         tableset = TableSet(self.tables.values(), self.tables.keys())
 
@@ -16,7 +16,7 @@ import warnings
 from agate.data_types import Text
 from agate.mapped_sequence import MappedSequence
 from agate.table import Table
-from agate.utils import Quantiles, round_limits, letter_name
+from agate.utils import Quantiles, round_limits, letter_name, column_indices, project, filter_rows, parse_object, iter_object
 
 
 class TestQuantiles(unittest.TestCase):
@@ -82,3 +82,55 @@ class TestMisc(unittest.TestCase):
         self.assertEqual(letter_name(25), 'z')
         self.assertEqual(letter_name(30), 'ee')
         self.assertEqual(letter_name(77), 'zzz')
+
+    def test_column_indices(self):
+        self.assertSequenceEqual(column_indices(['b', 0], ['a', 'b']), [1, 0])
+        self.assertSequenceEqual(column_indices([2, 0]), [2, 0])
+
+        with self.assertRaises(ValueError):
+            column_indices(['c'], ['a', 'b'])
+
+        with self.assertRaises(ValueError):
+            column_indices(['a'])
+
+    def test_project(self):
+        rows = [['a', 'b', 'c'], ['d']]
+
+        self.assertSequenceEqual(list(project(rows, [2, 0])), [['c', 'a'], [None, 'd']])
+
+    def test_filter_rows(self):
+        rows = [['1', 'a'], ['2', 'b']]
+
+        self.assertSequenceEqual(list(filter_rows(rows, ['x', 'y'], lambda row: row['y'] == 'b')), [['2', 'b']])
+        self.assertSequenceEqual(list(filter_rows(rows, None, lambda row: row['a'] == '1')), [['1', 'a']])
+
+    def test_parse_object(self):
+        obj = {
+            'one': {'a': 1, 'b': [2, {'c': 3}]},
+            'two': [],
+            'three': 'd'
+        }
+
+        parsed = parse_object(obj)
+
+        self.assertEqual(parsed, {'one/a': 1, 'one/b/0': 2, 'one/b/1/c': 3, 'three': 'd'})
+        self.assertEqual(parse_object('a'), {'': 'a'})
+
+    def test_parse_object_order(self):
+        from collections import OrderedDict
+
+        obj = OrderedDict([('z', [OrderedDict([('y', 1), ('x', 2)])]), ('a', 3)])
+
+        self.assertSequenceEqual(list(parse_object(obj).keys()), ['z/0/y', 'z/0/x', 'a'])
+        self.assertSequenceEqual(list(iter_object(obj)), [('z/0/y', 1), ('z/0/x', 2), ('a', 3)])
+
+    def test_iter_object_deep(self):
+        obj = 1
+
+        for i in range(sys.getrecursionlimit() * 2):
+            obj = [obj]
+
+        path, value = list(iter_object(obj))[0]
+
+        self.assertEqual(value, 1)
+        self.assertEqual(path.count('/'), sys.getrecursionlimit() * 2 - 1)